@@ -0,0 +1,169 @@
+"""
+Buffered writer for batch job progress.
+
+scripts/batch_runner.py turns every progress marker in Claude's output into
+database writes. Committed one at a time, each marker costs its own
+transaction (and fsync), and a burst of output holds the write lock against
+the MCP server the batch is driving.
+
+BatchEventWriter collects events in memory and writes them in a single
+transaction once FLUSH_EVENTS have accumulated or FLUSH_INTERVAL_MS has
+passed, whichever comes first. Status and progress updates are coalesced:
+only the latest status fields and the summed progress count are written per
+flush. Terminal events (job completed, failed, cancelled, ...) flush at once.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any
+
+from .database import Database
+
+logger = logging.getLogger(__name__)
+
+
+# --- Configuration ---
+
+FLUSH_EVENTS = 20          # Flush when this many events are buffered
+FLUSH_INTERVAL_MS = 500    # ... or when the oldest buffered write is this old
+
+TERMINAL_EVENTS = {"batch_complete", "completed", "failed", "cancelled", "error"}
+TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
+
+
+class BatchEventWriter:
+    """
+    Buffered, coalescing sink for one batch job's events and status.
+
+    Thread-safe. A background thread flushes on the time limit; call close()
+    (or use as a context manager) to stop it and write what is left.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        job_id: str,
+        max_events: int = FLUSH_EVENTS,
+        interval_ms: int = FLUSH_INTERVAL_MS,
+    ):
+        self._db = db
+        self._job_id = job_id
+        self._max_events = max_events
+        self._interval = interval_ms / 1000
+        self._lock = threading.Lock()
+        self._events: list[tuple[str, str | None, str | None, str]] = []
+        self._status: dict[str, Any] = {}
+        self._progress = 0
+        self._oldest: float | None = None  # monotonic time of oldest unflushed write
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # --- Buffering ---
+
+    def event(
+        self,
+        event_type: str,
+        article_slug: str | None = None,
+        message: str | None = None,
+    ) -> None:
+        """Buffer an event; flushes immediately for terminal events."""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self._events.append((event_type, article_slug, message, timestamp))
+            self._touch()
+            due = event_type in TERMINAL_EVENTS or len(self._events) >= self._max_events
+        if due:
+            self.flush()
+
+    def status(
+        self,
+        status: str,
+        pid: int | None = None,
+        error_message: str | None = None,
+        current_article: str | None = None,
+    ) -> None:
+        """Buffer a job status update, merged with any not yet written."""
+        fields = {
+            "pid": pid,
+            "error_message": error_message,
+            "current_article": current_article,
+        }
+        with self._lock:
+            self._status["status"] = status
+            self._status.update({k: v for k, v in fields.items() if v is not None})
+            self._touch()
+        if status in TERMINAL_STATUSES:
+            self.flush()
+
+    def increment_progress(self) -> None:
+        """Buffer one completed article."""
+        with self._lock:
+            self._progress += 1
+            self._touch()
+
+    def _touch(self) -> None:
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+    # --- Writing ---
+
+    def flush(self) -> None:
+        """Write everything buffered in one transaction."""
+        with self._lock:
+            if self._oldest is None:
+                return
+            events, status, progress = self._events, self._status, self._progress
+            self._events, self._status, self._progress = [], {}, 0
+            self._oldest = None
+
+            try:
+                if status:
+                    self._db.update_batch_job_status(self._job_id, auto_commit=False, **status)
+                if progress:
+                    self._db.increment_batch_job_progress(self._job_id, progress, auto_commit=False)
+                if events:
+                    self._db.add_batch_job_events(self._job_id, events, auto_commit=False)
+                self._db.commit()
+            except sqlite3.Error as e:
+                self._db.rollback()
+                logger.warning(f"Batch event flush failed, will retry: {e}")
+                # Put the writes back in front of anything buffered since
+                self._events = events + self._events
+                self._status = {**status, **self._status}
+                self._progress += progress
+                self._oldest = time.monotonic()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval / 4):
+            with self._lock:
+                due = self._oldest is not None and time.monotonic() - self._oldest >= self._interval
+            if due:
+                self.flush()
+
+    # --- Lifecycle ---
+
+    def start(self) -> "BatchEventWriter":
+        """Start the background thread that enforces the time limit."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="batch-events", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the background thread and write anything left."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self) -> "BatchEventWriter":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
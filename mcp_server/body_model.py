@@ -0,0 +1,310 @@
+"""
+Parsed paragraph model of an article's body_html.
+
+Body review and the Step 4 checks all work on the top-level elements of
+body_html: get_body_for_review() flags issues and returns ten paragraphs per
+chunk, complete_body_review() re-checks the flags and applies fixes,
+step4_check_warnings() lists orphans, step4_check_formulas() looks for
+unwrapped statistics. Each of those used to build a BeautifulSoup tree of
+the whole body.
+
+BodyModel parses body_html once into BodyNodes (one per top-level node, with
+its HTML, text, issues and existing formula spans) and is cached per slug
+until body_html changes. Review chunks become list slices. Fixes re-render
+only the paragraphs they touch, and the result is a new model for the new
+body_html, so the next check does not parse it again.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any
+
+# Top-level elements that count as body paragraphs for review and fixes
+BLOCK_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'table', 'ul', 'ol')
+
+# Whitespace the HTML parser treats as insignificant between elements
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+MAX_MODELS = 8  # Articles whose models are kept in memory
+
+
+@dataclass(frozen=True)
+class BodyNode:
+    """One top-level node of body_html."""
+    position: int                  # Index among the body's top-level nodes
+    tag: str | None                # None for text between elements
+    html: str
+    text: str = ""                 # get_text(strip=True)
+    raw_text: str = ""             # get_text(), as the formula check reads it
+    formulas: tuple[str, ...] = () # Text of <span class="formula"> inside
+    issues: tuple[str, ...] = ()
+
+
+def paragraph_issues(tag: str, text: str) -> list[str]:
+    """Structural issues to flag for one body paragraph — BE SPECIFIC."""
+    issues = []
+
+    # 1. ORPHAN: starts with lowercase — likely split from previous paragraph
+    if text and text[0].islower() and len(text) > 20:
+        issues.append("ORPHAN: Starts lowercase — likely split from previous. Action: join_previous")
+
+    # 2. INCOMPLETE: doesn't end with sentence punctuation
+    if text and text[-1] not in '.!?:;)' and len(text) > 50 and tag == 'p':
+        issues.append("INCOMPLETE: No ending punctuation — check if continues in next. Action: join_next?")
+
+    # 3. CAPTION: looks like a figure/table caption
+    if re.match(r'^(Figure|Fig\.?|Table|Tableau)\s*\d', text, re.IGNORECASE):
+        issues.append("CAPTION: Looks like figure/table caption — should not be in body. Action: delete")
+
+    # 4. PAGE_ARTIFACT: page numbers, headers, footers
+    if re.match(r'^\d+$', text) or len(text) < 10 and re.match(r'^Page\s*\d+', text, re.IGNORECASE):
+        issues.append("PAGE_ARTIFACT: Looks like page number/header. Action: delete")
+
+    # 5. SHORT_FRAGMENT: very short text that may be cruft
+    if tag == 'p' and len(text) < 25 and not text.endswith(':'):
+        issues.append("SHORT_FRAGMENT: Very short — cruft or orphan piece? Action: delete or join")
+
+    # 6. REFERENCE_LEAK: reference that leaked into body
+    if re.match(r'^\d+\.\s*[A-Z]', text) and 'et al' in text.lower():
+        issues.append("REFERENCE_LEAK: Looks like a reference. Action: delete")
+
+    return issues
+
+
+def _node(position: int, element: Any) -> BodyNode:
+    """Build a BodyNode from a parsed top-level element or string."""
+    if not element.name:
+        return BodyNode(position, None, element.output_ready())
+    text = element.get_text(strip=True)
+    return BodyNode(
+        position=position,
+        tag=element.name,
+        html=str(element),
+        text=text,
+        raw_text=element.get_text(),
+        formulas=tuple(span.get_text() for span in element.find_all('span', class_='formula')),
+        issues=tuple(paragraph_issues(element.name, text)) if element.name in BLOCK_TAGS and text else (),
+    )
+
+
+def _collapse_space(node: BodyNode) -> BodyNode:
+    """The parser reduces whitespace-only text to a single character."""
+    if node.html.strip(ASCII_SPACES):
+        return node
+    return replace(node, html='\n' if '\n' in node.html else ' ')
+
+
+def _rendered(position: int, element: Any) -> tuple[str, list[BodyNode]]:
+    """HTML of an edited element, and its nodes as a fresh parse of that HTML sees them."""
+    from bs4 import BeautifulSoup
+    html = str(element)
+    soup = BeautifulSoup(html, 'html.parser')
+    return html, [_node(position, child) for child in soup.children]
+
+
+def _fragment(html: str) -> Any:
+    """Parse a single top-level element on its own."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    return next(child for child in soup.children if child.name)
+
+
+class BodyModel:
+    """Top-level nodes of body_html, parsed once."""
+
+    def __init__(self, body_html: str, nodes: list[BodyNode] | None = None):
+        if nodes is None:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(body_html, 'html.parser')
+            nodes = [_node(i, child) for i, child in enumerate(soup.children)]
+        self.body_html = body_html
+        self.nodes = nodes
+
+    @classmethod
+    def _from_nodes(
+        cls, nodes: list[BodyNode], edits: dict[int, tuple[str, list[BodyNode]]],
+    ) -> "BodyModel":
+        """
+        Model of the HTML the edited nodes render to, as a fresh parse would see it.
+
+        edits maps the position of each edited node to its _rendered() HTML and
+        nodes. The HTML is what the edited tree serializes to; the nodes can
+        differ from it in whitespace, as the parser collapses it.
+        """
+        body_html = "".join(edits[node.position][0] if node.position in edits else node.html for node in nodes)
+        parsed = [part for node in nodes for part in (edits[node.position][1] if node.position in edits else [node])]
+
+        # Text left adjacent by a removal is one node once the HTML is reparsed
+        merged: list[BodyNode] = []
+        for node in parsed:
+            if node.tag is None and merged and merged[-1].tag is None:
+                merged[-1] = replace(merged[-1], html=merged[-1].html + node.html)
+            else:
+                merged.append(node)
+        merged = [_collapse_space(node) if node.tag is None else node for node in merged]
+        merged = [node if node.position == i else replace(node, position=i) for i, node in enumerate(merged)]
+        return cls(body_html, merged)
+
+    # --- Reading ---
+
+    def paragraphs(self) -> list[dict]:
+        """Non-empty block paragraphs: index, tag, text, full_length, issues."""
+        return [
+            {
+                'index': node.position,
+                'tag': node.tag,
+                'text': node.text[:300] + '...' if len(node.text) > 300 else node.text,
+                'full_length': len(node.text),
+                'issues': list(node.issues),
+            }
+            for node in self.nodes
+            if node.tag in BLOCK_TAGS and node.text
+        ]
+
+    # --- Fixes ---
+
+    def apply_fixes(self, fixes: list[dict]) -> tuple["BodyModel", list[str]]:
+        """
+        Apply complete_body_review() fixes; returns the new model and a change log.
+
+        Indices count block elements (BLOCK_TAGS), in document order.
+        """
+        nodes: list[BodyNode | None] = list(self.nodes)
+        elements = [node.position for node in self.nodes if node.tag in BLOCK_TAGS]
+        edits: dict[int, tuple[str, list[BodyNode]]] = {}
+
+        def text_of(pos: int) -> str:
+            return nodes[pos].text if nodes[pos] is not None else ""
+
+        def set_text(pos: int, text: str) -> None:
+            if nodes[pos] is not None:  # A removed paragraph stays removed
+                element = _fragment(nodes[pos].html)
+                element.string = text
+                edits[pos] = _rendered(pos, element)
+                nodes[pos] = edits[pos][1][0]
+
+        changes = []
+        # Sort fixes by index descending (so deletions don't shift indices)
+        for fix in sorted(fixes, key=lambda f: f['index'], reverse=True):
+            idx = fix['index']
+            action = fix['action']
+
+            if idx >= len(elements):
+                changes.append(f"SKIPPED: index {idx} out of range")
+                continue
+
+            current = elements[idx]
+            if action == 'delete':
+                nodes[current] = None
+                changes.append(f"Deleted paragraph {idx}")
+
+            elif action == 'join_previous' and idx > 0:
+                previous = elements[idx - 1]
+                set_text(previous, text_of(previous) + ' ' + text_of(current))
+                nodes[current] = None
+                changes.append(f"Joined paragraph {idx} to {idx - 1}")
+
+            elif action == 'join_next' and idx < len(elements) - 1:
+                following = elements[idx + 1]
+                set_text(current, text_of(current) + ' ' + text_of(following))
+                nodes[following] = None
+                changes.append(f"Joined paragraph {idx + 1} to {idx}")
+
+            elif action == 'replace':
+                set_text(current, fix.get('text', ''))
+                changes.append(f"Replaced paragraph {idx}")
+
+        return self._from_nodes([node for node in nodes if node is not None], edits), changes
+
+    def join_orphans(self, fixes: list[dict]) -> tuple["BodyModel", list[str]]:
+        """
+        Apply step4_confirm_warnings() joins, keeping inline formatting.
+
+        Indices count all top-level elements, in document order.
+        """
+        from bs4 import NavigableString
+
+        nodes: list[BodyNode | None] = list(self.nodes)
+        elements = [node.position for node in self.nodes if node.tag]
+
+        # Edited elements stay live across joins, so a chain of joins builds
+        # the same tree the whole-body edit did
+        live: dict[int, Any] = {}
+        edits: dict[int, tuple[str, list[BodyNode]]] = {}
+
+        def element(pos: int) -> Any:
+            if pos not in live:
+                live[pos] = _fragment(nodes[pos].html)
+            return live[pos]
+
+        changes = []
+        # Sort by index descending to avoid index shifting
+        for fix in sorted(fixes, key=lambda f: f.get('index', 0), reverse=True):
+            idx = fix.get('index', -1)
+            action = fix.get('action', '')
+
+            if idx < 0 or idx >= len(elements):
+                continue
+
+            if action == 'join_previous' and idx > 0:
+                current, previous = elements[idx], elements[idx - 1]
+                if nodes[current] is None or nodes[previous] is None:
+                    continue
+
+                # A void element (<img>, <br>) has no content to join into, and
+                # joining one into a paragraph would drop it
+                void = [pos for pos in (previous, current) if element(pos).can_be_empty_element]
+                if void:
+                    changes.append(f"SKIPPED: join {idx} to {idx - 1}, <{nodes[void[0]].tag}> is a void element")
+                    continue
+
+                # Preserve HTML formatting: move the children of current into
+                # previous, after a space, instead of replacing with text
+                prev_el = element(previous)
+                prev_el.append(NavigableString(' '))
+                for child in list(element(current).children):
+                    prev_el.append(child.extract())
+                edits[previous] = _rendered(previous, prev_el)
+                nodes[previous] = edits[previous][1][0]
+                nodes[current] = None
+                changes.append(f"Joined paragraph {idx} to {idx - 1}")
+
+        return self._from_nodes([node for node in nodes if node is not None], edits), changes
+
+
+# --- Per-slug cache ---
+
+_models: OrderedDict[str, BodyModel] = OrderedDict()
+_models_lock = threading.Lock()
+
+
+def get_body_model(slug: str, body_html: str) -> BodyModel:
+    """Model of body_html, reused while the slug's body is unchanged."""
+    with _models_lock:
+        model = _models.get(slug)
+        if model is not None and model.body_html == body_html:
+            _models.move_to_end(slug)
+            return model
+
+    model = BodyModel(body_html)
+    remember_body_model(slug, model)
+    return model
+
+
+def remember_body_model(slug: str, model: BodyModel) -> None:
+    """Cache a model, e.g. the result of applying fixes."""
+    with _models_lock:
+        _models[slug] = model
+        _models.move_to_end(slug)
+        while len(_models) > MAX_MODELS:
+            _models.popitem(last=False)
+
+
+def clear_body_models() -> None:
+    """Drop all cached models."""
+    with _models_lock:
+        _models.clear()
@@ -10,16 +10,28 @@ This module handles:
 
 Per D6: Session state uses SQLite table with midnight auto-reset (local time).
 Per D17: Validation tokens stored in SQLite with 30-minute expiry.
+
+Articles are claimed with a lease (claimed_by, lease_expires_at), so several
+translation workers can share the queue without picking the same article.
+
+The MCP server, scripts/batch_runner.py and the Astro admin site all open
+data/pda.db at once. Connections use WAL journaling so readers never wait
+on a writer, and a busy timeout so concurrent writers queue instead of
+failing with "database is locked".
 """
 
 from __future__ import annotations
 
 import json
+import os
 import secrets
+import socket
 import sqlite3
+import threading
+import weakref
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional, List
+from typing import Any, Iterator, Optional, List
 
 
 # Paths
@@ -27,33 +39,150 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DB_PATH = PROJECT_ROOT / "data" / "pda.db"
 
 
+# Connection settings
+POOL_SIZE = 4                     # Idle connections kept for reuse
+BUSY_TIMEOUT_MS = 5000            # Wait this long for a competing writer
+MMAP_SIZE = 256 * 1024 * 1024     # Memory-map up to 256 MB of the file
+CACHE_SIZE_KB = 16 * 1024         # Page cache per connection (16 MB)
+
+# Article claims
+LEASE_SECONDS = 30 * 60  # Renewed on every get_chunk; expired leases are reclaimable
+
+
+def default_worker_id() -> str:
+    """Worker identity for article claims: $PDA_WORKER_ID, else host:pid."""
+    return os.environ.get("PDA_WORKER_ID") or f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _local_worker_dead(worker_id: str) -> bool:
+    """True if worker_id is a host:pid on this host whose process has exited."""
+    host, _, pid = worker_id.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        pass  # Exists but owned by another user
+    return False
+
+
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",  # Safe with WAL; fsync only at checkpoints
+    f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}",
+    f"PRAGMA mmap_size = {MMAP_SIZE}",
+    f"PRAGMA cache_size = -{CACHE_SIZE_KB}",
+    "PRAGMA foreign_keys = ON",
+)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of tuned SQLite connections to one database file.
+
+    Connections are created on demand and returned to the pool on release.
+    At most `size` idle connections are kept; extras are closed. A released
+    connection with an open transaction is rolled back first, so the next
+    borrower always starts clean.
+    """
+
+    def __init__(self, db_path: Path, size: int = POOL_SIZE):
+        self._path = db_path
+        self._size = size
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,  # Handed between threads by the pool
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Borrow a connection, opening a new one if none is idle."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool (or close it if the pool is full)."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections. Borrowed ones close on release."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def idle_count(self) -> int:
+        """Number of idle connections currently pooled."""
+        with self._lock:
+            return len(self._idle)
+
+
+class _Lease:
+    """A thread's hold on a pooled connection; released when dropped."""
+
+    def __init__(self, pool: ConnectionPool, conn: sqlite3.Connection):
+        self.conn = conn
+        self.release = weakref.finalize(self, pool.release, conn)
+
+
 class Database:
     """
     Database operations for the translation pipeline.
 
-    Maintains a single connection per instance. In production,
-    a new Database() is created per request or the connection
-    is managed by the MCP server lifecycle.
+    Each thread gets its own connection from a shared pool and keeps it
+    until close() or until the thread exits, so a transaction built up
+    over several execute() calls stays on one connection. Instances are
+    safe to share between threads.
     """
 
-    def __init__(self, db_path: Path = DB_PATH):
+    def __init__(
+        self,
+        db_path: Path = DB_PATH,
+        pool_size: int = POOL_SIZE,
+        worker_id: str | None = None,
+    ):
         self._path = db_path
-        self._conn: sqlite3.Connection | None = None
+        self.worker_id = worker_id or default_worker_id()
+        self._pool = ConnectionPool(db_path, pool_size)
+        self._local = threading.local()
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._conn is None:
-            self._conn = sqlite3.connect(self._path)
-            self._conn.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self._conn.execute("PRAGMA foreign_keys = ON")
-        return self._conn
+        """Get this thread's connection, borrowing one from the pool if needed."""
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            lease = _Lease(self._pool, self._pool.acquire())
+            self._local.lease = lease
+        return lease.conn
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Release this thread's connection and close idle pooled connections."""
+        lease = getattr(self._local, "lease", None)
+        if lease is not None:
+            self._local.lease = None
+            lease.release()
+        self._pool.close()
 
     def execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
         """Execute a SQL statement."""
@@ -84,6 +213,7 @@ class Database:
         self._migrate_validation_tokens()
         self._migrate_article_columns()
         self._migrate_batch_jobs()
+        self._migrate_indexes()
         self.commit()
 
     def _migrate_session_state(self) -> None:
@@ -133,6 +263,8 @@ class Database:
             ("processing_notes", "ALTER TABLE articles ADD COLUMN processing_notes TEXT"),
             ("processed_at", "ALTER TABLE articles ADD COLUMN processed_at TEXT"),
             ("summary_original", "ALTER TABLE articles ADD COLUMN summary_original TEXT"),
+            ("claimed_by", "ALTER TABLE articles ADD COLUMN claimed_by TEXT"),
+            ("lease_expires_at", "ALTER TABLE articles ADD COLUMN lease_expires_at TEXT"),
         ]
 
         for col_name, sql in migrations:
@@ -173,6 +305,29 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_batch_jobs_status ON batch_jobs(status)
         """)
 
+    def _migrate_indexes(self) -> None:
+        """
+        Create indexes for the hot queries.
+
+        - articles(processing_status, created_at): get_next_article and
+          iter_pending_articles filter on status and order by created_at;
+          get_progress groups by status using the index alone
+        - validation_tokens(article_id): token lookups and cleanup per article
+        - batch_job_events(job_id, timestamp): latest events for a job
+        """
+        self.execute("""
+            CREATE INDEX IF NOT EXISTS idx_articles_status_created
+            ON articles(processing_status, created_at)
+        """)
+        self.execute("""
+            CREATE INDEX IF NOT EXISTS idx_validation_tokens_article
+            ON validation_tokens(article_id)
+        """)
+        self.execute("""
+            CREATE INDEX IF NOT EXISTS idx_batch_job_events_job_time
+            ON batch_job_events(job_id, timestamp)
+        """)
+
     # --- Session State (per D6, D23) ---
 
     def get_session_state(self) -> dict[str, Any]:
@@ -362,43 +517,65 @@ class Database:
 
     def get_next_article(self) -> dict[str, Any] | None:
         """
-        Get the next article to process.
+        Claim the next article to process for this worker.
 
         Priority:
-        1. in_progress (crash recovery) — restart from beginning per D1
+        1. in_progress (crash recovery) — restart from beginning per D1.
+           Only rows this worker already holds, or whose lease has expired,
+           was never set, or belongs to a dead process on this host.
         2. pending
 
+        The claim is a single UPDATE ... RETURNING inside BEGIN IMMEDIATE,
+        so two workers can never claim the same article.
+
         Returns article dict or None if no articles available.
+
+        Raises:
+            RuntimeError: This thread's connection has an open transaction;
+                commit or roll it back first, so it is not committed with the claim
         """
-        # First check for in_progress (crash recovery)
-        row = self.execute("""
-            SELECT id, source_title, source_url, summary_original, open_access, doi
-            FROM articles
-            WHERE processing_status = 'in_progress'
-            ORDER BY created_at ASC
-            LIMIT 1
-        """).fetchone()
+        conn = self._get_conn()
+        if conn.in_transaction:
+            raise RuntimeError(
+                "get_next_article() called inside an open transaction; "
+                "commit or roll back pending changes first"
+            )
 
-        if not row:
-            # Get next pending
-            row = self.execute("""
-                SELECT id, source_title, source_url, summary_original, open_access, doi
-                FROM articles
-                WHERE processing_status = 'pending'
-                ORDER BY created_at ASC
-                LIMIT 1
-            """).fetchone()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._release_dead_local_leases()
+            row = conn.execute(
+                """
+                UPDATE articles
+                SET processing_status = 'in_progress',
+                    claimed_by = :worker,
+                    lease_expires_at = datetime('now', :lease)
+                WHERE id = COALESCE(
+                    (SELECT id FROM articles
+                     WHERE processing_status = 'in_progress'
+                       AND (claimed_by IS NULL
+                            OR claimed_by = :worker
+                            OR lease_expires_at IS NULL
+                            OR lease_expires_at <= datetime('now'))
+                     ORDER BY created_at ASC
+                     LIMIT 1),
+                    (SELECT id FROM articles
+                     WHERE processing_status = 'pending'
+                     ORDER BY created_at ASC
+                     LIMIT 1)
+                )
+                RETURNING id, source_title, source_url, summary_original, open_access, doi
+                """,
+                {"worker": self.worker_id, "lease": f"+{LEASE_SECONDS} seconds"},
+            ).fetchone()
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
 
         if not row:
             return None
 
-        # Mark as in_progress
-        self.execute(
-            "UPDATE articles SET processing_status = 'in_progress' WHERE id = ?",
-            (row["id"],)
-        )
-        self.commit()
-
         return {
             "id": row["id"],
             "source_title": row["source_title"],
@@ -408,6 +585,61 @@ class Database:
             "doi": row["doi"],
         }
 
+    def _release_dead_local_leases(self) -> None:
+        """Expire live leases held by exited processes on this host."""
+        rows = self.execute(
+            """
+            SELECT id, claimed_by FROM articles
+            WHERE processing_status = 'in_progress'
+              AND claimed_by IS NOT NULL
+              AND claimed_by != ?
+              AND lease_expires_at > datetime('now')
+            """,
+            (self.worker_id,)
+        ).fetchall()
+        dead = [(row["id"],) for row in rows if _local_worker_dead(row["claimed_by"])]
+        if dead:
+            self.executemany(
+                "UPDATE articles SET lease_expires_at = NULL WHERE id = ?",
+                dead
+            )
+
+    def renew_article_lease(self, article_id: str) -> bool:
+        """
+        Extend this worker's lease on an in_progress article.
+
+        Returns False if the article is not held by this worker.
+        """
+        cursor = self.execute(
+            """
+            UPDATE articles
+            SET lease_expires_at = datetime('now', ?)
+            WHERE id = ? AND processing_status = 'in_progress' AND claimed_by = ?
+            """,
+            (f"+{LEASE_SECONDS} seconds", article_id, self.worker_id)
+        )
+        self.commit()
+        return cursor.rowcount > 0
+
+    def iter_pending_articles(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield pending open-access articles with a source URL, in the order
+        get_next_article() will hand them out.
+
+        Read-only (no status change): used to prefetch sources ahead of the
+        translation loop.
+        """
+        cursor = self.execute("""
+            SELECT id, source_url
+            FROM articles
+            WHERE processing_status = 'pending'
+              AND open_access = 1
+              AND source_url IS NOT NULL AND source_url != ''
+            ORDER BY created_at ASC
+        """)
+        for row in cursor:
+            yield {"id": row["id"], "source_url": row["source_url"]}
+
     def get_article_by_id(self, article_id: str) -> dict[str, Any] | None:
         """Get an article by ID."""
         row = self.execute(
@@ -439,6 +671,8 @@ class Database:
             UPDATE articles
             SET processing_status = 'translated',
                 processed_at = datetime('now'),
+                claimed_by = NULL,
+                lease_expires_at = NULL,
                 method = ?,
                 voice = ?,
                 peer_reviewed = ?,
@@ -479,6 +713,8 @@ class Database:
             """
             UPDATE articles
             SET processing_status = 'skipped',
+                claimed_by = NULL,
+                lease_expires_at = NULL,
                 processing_notes = ?,
                 processing_flags = ?
             WHERE id = ?
@@ -708,26 +944,24 @@ class Database:
             (article_id,)
         )
 
-        # Insert primary
-        self.execute(
-            "INSERT INTO article_categories (article_id, category_id, is_primary) VALUES (?, ?, 1)",
-            (article_id, primary_category)
+        # Insert primary and secondaries in one call
+        rows = [(article_id, primary_category, 1)]
+        rows.extend((article_id, cat, 0) for cat in secondary_categories)
+        self.executemany(
+            "INSERT INTO article_categories (article_id, category_id, is_primary) VALUES (?, ?, ?)",
+            rows
         )
 
-        # Insert secondary
-        for cat in secondary_categories:
-            self.execute(
-                "INSERT INTO article_categories (article_id, category_id, is_primary) VALUES (?, ?, 0)",
-                (article_id, cat)
-            )
-
     # --- Keyword Operations ---
 
     def set_article_keywords(self, article_id: str, keywords: list[str]) -> None:
         """
         Set keywords for an article.
 
-        Creates keywords if they don't exist, then links them.
+        Creates keywords if they don't exist, then links them. Costs a fixed
+        number of statements regardless of how many keywords there are: one
+        upsert returns the ids of new and existing keywords alike, and the
+        links go in with a single executemany.
         """
         # Clear existing links
         self.execute(
@@ -735,26 +969,26 @@ class Database:
             (article_id,)
         )
 
-        for keyword in keywords:
-            # Insert keyword if not exists
-            self.execute(
-                "INSERT OR IGNORE INTO keywords (keyword) VALUES (?)",
-                (keyword,)
-            )
-
-            # Get keyword id
-            row = self.execute(
-                "SELECT id FROM keywords WHERE keyword = ?",
-                (keyword,)
-            ).fetchone()
+        unique_keywords = list(dict.fromkeys(keywords))
+        if not unique_keywords:
+            return
 
-            if row:
-                # Link to article
-                self.execute(
-                    "INSERT INTO article_keywords (article_id, keyword_id) VALUES (?, ?)",
-                    (article_id, row["id"])
-                )
+        # Upsert all keywords; the no-op update makes RETURNING yield existing ids too
+        rows = self.execute(
+            """
+            INSERT INTO keywords (keyword)
+            SELECT value FROM json_each(?) WHERE true
+            ON CONFLICT(keyword) DO UPDATE SET keyword = excluded.keyword
+            RETURNING id
+            """,
+            (json.dumps(unique_keywords),)
+        ).fetchall()
 
+        # Link to article
+        self.executemany(
+            "INSERT INTO article_keywords (article_id, keyword_id) VALUES (?, ?)",
+            [(article_id, row["id"]) for row in rows]
+        )
 
     # --- Batch Job Operations ---
 
@@ -783,6 +1017,7 @@ class Database:
         pid: int | None = None,
         error_message: str | None = None,
         current_article: str | None = None,
+        auto_commit: bool = True,
     ) -> None:
         """Update batch job status and optional fields."""
         updates = ["status = ?"]
@@ -808,15 +1043,22 @@ class Database:
         params.append(job_id)
         sql = f"UPDATE batch_jobs SET {', '.join(updates)} WHERE id = ?"
         self.execute(sql, tuple(params))
-        self.commit()
+        if auto_commit:
+            self.commit()
 
-    def increment_batch_job_progress(self, job_id: str) -> None:
+    def increment_batch_job_progress(
+        self,
+        job_id: str,
+        count: int = 1,
+        auto_commit: bool = True,
+    ) -> None:
         """Increment processed_count for a batch job."""
         self.execute(
-            "UPDATE batch_jobs SET processed_count = processed_count + 1 WHERE id = ?",
-            (job_id,)
+            "UPDATE batch_jobs SET processed_count = processed_count + ? WHERE id = ?",
+            (count, job_id)
         )
-        self.commit()
+        if auto_commit:
+            self.commit()
 
     def add_batch_job_event(
         self,
@@ -835,6 +1077,32 @@ class Database:
         )
         self.commit()
 
+    def add_batch_job_events(
+        self,
+        job_id: str,
+        events: list[tuple[str, str | None, str | None, str]],
+        auto_commit: bool = True,
+    ) -> None:
+        """
+        Add several events to the batch job log in one executemany.
+
+        Args:
+            job_id: Batch job the events belong to
+            events: (event_type, article_slug, message, timestamp) tuples;
+                    timestamp is local time as 'YYYY-MM-DD HH:MM:SS'
+            auto_commit: If True (default), commits immediately.
+                         If False, caller is responsible for commit.
+        """
+        self.executemany(
+            """
+            INSERT INTO batch_job_events (job_id, event_type, article_slug, message, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [(job_id, *event) for event in events]
+        )
+        if auto_commit:
+            self.commit()
+
     def get_batch_job(self, job_id: str) -> dict[str, Any] | None:
         """Get a batch job by ID."""
         row = self.execute(
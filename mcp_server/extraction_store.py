@@ -0,0 +1,324 @@
+"""
+Persistent, content-addressed store for extraction results.
+
+get_chunk() keeps extracted chunks in memory for an hour (per D26). This
+store sits behind that cache on disk, so reopening an article after a
+server restart, a TTL expiry or a skip does not re-run the extractors and
+the spaCy chunking.
+
+Entries are keyed by the SHA-256 of the cached source file plus the
+extractor chain and chunking parameters. A replaced PDF or a change in
+chunking therefore gets a new key; stale entries are never served, they
+just age out. The store is capped by total size and evicts least recently
+used entries first.
+
+The chunking itself (per D3) lives here too, so load_extraction() can
+extract, chunk and store a file for both get_chunk() and the prefetcher.
+
+Layout: cache/extractions/{key}.json
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .nlp_models import MODELS, TASK_SENTENCES, get_pipeline, is_model_installed
+from .pdf_extraction import EXTRACTORS, extract_article_text
+
+logger = logging.getLogger(__name__)
+
+
+# --- Paths and limits ---
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXTRACTION_STORE_DIR = PROJECT_ROOT / "cache" / "extractions"
+EXTRACTION_STORE_MAX_BYTES = 100 * 1024 * 1024  # 100 MB
+
+# Bump when extraction or chunking output changes for the same input
+STORE_FORMAT_VERSION = 1
+
+
+@dataclass
+class StoredExtraction:
+    """Extraction result as persisted: text, chunks and extraction metadata."""
+    text: str
+    chunks: list[str]
+    extractor_used: str
+    extraction_problems: list[str]
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionStore:
+    """
+    Disk-backed extraction results, one JSON file per key.
+
+    Recency is tracked with file mtimes (touched on every hit), so eviction
+    survives restarts without a separate index.
+    """
+
+    def __init__(
+        self,
+        root: Path = EXTRACTION_STORE_DIR,
+        max_bytes: int = EXTRACTION_STORE_MAX_BYTES,
+    ):
+        self._root = root
+        self._max_bytes = max_bytes
+
+    @property
+    def max_bytes(self) -> int:
+        """Size budget for all entries combined."""
+        return self._max_bytes
+
+    def key_for(self, source_path: Path, params: dict[str, Any]) -> str:
+        """Build the store key for a source file and extraction parameters."""
+        material = json.dumps(
+            {
+                "format": STORE_FORMAT_VERSION,
+                "sha256": file_sha256(source_path),
+                "suffix": source_path.suffix.lower(),
+                "params": params,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self._root / f"{key}.json"
+
+    def get(self, key: str) -> StoredExtraction | None:
+        """Return the stored extraction for key, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)  # Mark as recently used
+            return StoredExtraction(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Discarding unreadable extraction entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, extraction: StoredExtraction) -> None:
+        """Persist an extraction atomically, then enforce the size budget."""
+        path = self._entry_path(key)
+        # Unique per writer: the prefetch thread and get_chunk() can store the
+        # same PDF at once
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self._root.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(asdict(extraction), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Could not write extraction entry {path.name}: {e}")
+            return
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path | None = None) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self._root):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+                total += stat.st_size
+
+        if total <= self._max_bytes:
+            return
+
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Evicted extraction entry {path.name} ({size} bytes)")
+            if total <= self._max_bytes:
+                break
+
+    def size_bytes(self) -> int:
+        """Total size of stored entries."""
+        if not self._root.exists():
+            return 0
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(self._root)
+            if entry.is_file() and entry.name.endswith(".json")
+        )
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        if not self._root.exists():
+            return
+        for entry in os.scandir(self._root):
+            if entry.is_file() and entry.name.endswith((".json", ".tmp")):
+                Path(entry.path).unlink(missing_ok=True)
+
+
+# --- Module-level singleton ---
+
+_store: ExtractionStore | None = None
+
+
+def get_extraction_store() -> ExtractionStore:
+    """Get the extraction store singleton."""
+    global _store
+    if _store is None:
+        _store = ExtractionStore()
+    return _store
+
+
+# --- Chunking Logic (per D3, Part 4.2) ---
+
+CHUNK_TARGET_PARAGRAPHS = 4
+LONG_PARAGRAPH_WORDS = 500
+SPLIT_TARGET_WORDS = 400
+
+
+def _chunking_params() -> dict[str, Any]:
+    """Everything that determines get_chunk() output for a given source file."""
+    return {
+        "extractors": [name for name, _ in EXTRACTORS],
+        "target_paragraphs": CHUNK_TARGET_PARAGRAPHS,
+        "long_paragraph_words": LONG_PARAGRAPH_WORDS,
+        "split_target_words": SPLIT_TARGET_WORDS,
+        # Without the model, long paragraphs are left unsplit
+        "sentence_model": MODELS["en"] if is_model_installed("en") else None,
+    }
+
+
+def _split_into_chunks(text: str, target_paragraphs: int = CHUNK_TARGET_PARAGRAPHS) -> list[str]:
+    """
+    Split text into chunks of ~4 paragraphs each.
+
+    Per D3:
+    - Split on double newlines
+    - Target 4 paragraphs per chunk
+    - If a paragraph exceeds 500 words, split at ~400 words on sentence boundary
+
+    Uses spaCy for sentence boundary detection on long paragraphs.
+    """
+    # Sentence-only pipeline from the shared registry (per D18)
+    try:
+        nlp_en = get_pipeline("en", TASK_SENTENCES)
+    except RuntimeError:
+        logger.warning("Long paragraphs won't be split at sentence boundaries.")
+        nlp_en = None
+
+    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+    chunks: list[str] = []
+    current_chunk: list[str] = []
+
+    for para in paragraphs:
+        word_count = len(para.split())
+
+        # If paragraph is too long (>500 words), split it
+        if word_count > LONG_PARAGRAPH_WORDS and nlp_en is not None:
+            sub_paras = _split_long_paragraph(para, nlp_en, target_words=SPLIT_TARGET_WORDS)
+            for sub in sub_paras:
+                current_chunk.append(sub)
+                if len(current_chunk) >= target_paragraphs:
+                    chunks.append('\n\n'.join(current_chunk))
+                    current_chunk = []
+        else:
+            current_chunk.append(para)
+            if len(current_chunk) >= target_paragraphs:
+                chunks.append('\n\n'.join(current_chunk))
+                current_chunk = []
+
+    # Don't forget remaining paragraphs
+    if current_chunk:
+        chunks.append('\n\n'.join(current_chunk))
+
+    return chunks
+
+
+def load_extraction(cached_path: Path) -> tuple[StoredExtraction | None, list[str]]:
+    """
+    Get the extraction for a cached source file, running it only on a miss.
+
+    Reuses the stored extraction of this exact file if there is one;
+    otherwise extracts, chunks and stores it. Shared by get_chunk() and the
+    prefetcher, which warms the store before the article is opened.
+
+    Returns:
+        (StoredExtraction, problems), or (None, problems) if extraction failed
+    """
+    store = get_extraction_store()
+    store_key = store.key_for(cached_path, _chunking_params())
+    stored = store.get(store_key)
+
+    if stored is not None:
+        logger.info(f"Reusing stored extraction {store_key[:12]} for {cached_path.name}")
+        return stored, stored.extraction_problems
+
+    result = extract_article_text(cached_path)
+    if not result.usable:
+        return None, result.problems
+
+    # Split into chunks and persist with metadata
+    stored = StoredExtraction(
+        text=result.text,
+        chunks=_split_into_chunks(result.text),
+        extractor_used=result.extractor_used,
+        extraction_problems=result.problems,
+    )
+    store.put(store_key, stored)
+    return stored, stored.extraction_problems
+
+
+def _split_long_paragraph(para: str, nlp, target_words: int = 400) -> list[str]:
+    """
+    Split a long paragraph at sentence boundaries.
+
+    Args:
+        para: The paragraph text
+        nlp: spaCy language model
+        target_words: Target words per sub-paragraph
+
+    Returns:
+        List of sub-paragraphs
+    """
+    doc = nlp(para)
+    sentences = list(doc.sents)
+
+    sub_paras: list[str] = []
+    current_sub: list[str] = []
+    current_word_count = 0
+
+    for sent in sentences:
+        sent_text = sent.text.strip()
+        sent_words = len(sent_text.split())
+
+        if current_word_count + sent_words > target_words and current_sub:
+            # Start a new sub-paragraph
+            sub_paras.append(' '.join(current_sub))
+            current_sub = [sent_text]
+            current_word_count = sent_words
+        else:
+            current_sub.append(sent_text)
+            current_word_count += sent_words
+
+    # Don't forget remaining sentences
+    if current_sub:
+        sub_paras.append(' '.join(current_sub))
+
+    return sub_paras
@@ -8,6 +8,19 @@ Per D12 of the plan:
 - Return {en_term: fr_term} for all matches found
 
 The glossary is loaded from data/glossary.yaml and indexed for fast lookup.
+All indexed forms (term, hyphen variant, abbreviation) are compiled into a
+single Aho-Corasick automaton, so matching is one pass over the text rather
+than one regex search per term.
+
+Lemmas of every French term (fr and fr_alt) are computed in one batched spaCy
+pass and persisted to cache/glossary_lemmas.json, keyed by glossary version,
+so recall checks look up sets instead of running the model per term.
+
+reload_glossary() builds a complete new Glossary (index, matcher and, when
+the French model is installed, lemma table) and then swaps the singleton in
+one assignment, so tool calls during a rebuild keep using the old glossary.
+mcp_server.hot_reload calls it when data/glossary.yaml changes.
+
 Terms may have optional fields:
 - fr_alt: list of acceptable French variants
 - abbreviation: e.g., "DA" for "demand avoidance"
@@ -16,13 +29,18 @@ Terms may have optional fields:
 
 from __future__ import annotations
 
+import json
 import logging
-import re
+import os
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import yaml
 
+from .nlp_models import is_model_installed
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +48,91 @@ logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent
 GLOSSARY_PATH = PROJECT_ROOT / "data" / "glossary.yaml"
+LEMMA_CACHE_PATH = PROJECT_ROOT / "cache" / "glossary_lemmas.json"
+
+
+# --- Multi-pattern matching ---
+
+def _is_word_char(ch: str) -> bool:
+    """Match the definition of \\w used by the re module for str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+class _TermMatcher:
+    """
+    Aho-Corasick automaton over normalized glossary terms.
+
+    Built once per index; finds every occurrence of every term in a single
+    left-to-right pass, including overlapping ones ("demand avoidance"
+    inside "pathological demand avoidance").
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+
+        for term in terms:
+            if term:
+                self._add(term)
+        self._link()
+
+    def _add(self, term: str) -> None:
+        state = 0
+        for ch in term:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._out[state].append(term)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield (start, term) for every occurrence of every term in text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for term in out[state]:
+                    yield i - len(term) + 1, term
+
+    def find_bounded(self, text: str) -> set[str]:
+        """
+        Return the terms that occur in text with a word boundary at each end.
+
+        Same semantics as re.search(r'\\b' + re.escape(term) + r'\\b', text).
+        """
+        found: set[str] = set()
+        n = len(text)
+        for start, term in self.iter_matches(text):
+            if term in found:
+                continue
+            end = start + len(term)
+            before = start > 0 and _is_word_char(text[start - 1])
+            after = end < n and _is_word_char(text[end])
+            if before != _is_word_char(term[0]) and after != _is_word_char(term[-1]):
+                found.add(term)
+        return found
 
 
 class Glossary:
@@ -40,10 +143,18 @@ class Glossary:
     each containing a list of term entries with en/fr pairs.
     """
 
-    def __init__(self, glossary_path: Path = GLOSSARY_PATH):
+    def __init__(
+        self,
+        glossary_path: Path = GLOSSARY_PATH,
+        lemma_cache_path: Path | None = LEMMA_CACHE_PATH,
+    ):
         self._path = glossary_path
+        self._lemma_cache_path = lemma_cache_path
         self._data: dict[str, Any] = {}
         self._index: dict[str, dict[str, Any]] = {}  # Normalized EN term -> entry
+        self._matcher = _TermMatcher(())
+        self._term_lemmas: dict[str, frozenset[str]] | None = None  # FR term -> lemmas
+        self._lemma_lock = threading.Lock()  # Warm-up and tool calls build the table once
         self._version: str = "unknown"
         self._load()
 
@@ -111,6 +222,12 @@ class Glossary:
                     abbr_normalized = self._normalize(processed_entry["abbreviation"])
                     self._index[abbr_normalized] = processed_entry
 
+        # Compile every indexed form into one automaton (rebuilt on reload)
+        self._matcher = _TermMatcher(self._index.keys())
+
+        # French lemmas are rebuilt (or read back from disk) on first use
+        self._term_lemmas = None
+
         logger.info(f"Glossary loaded: {len(self._index)} indexed terms from {self._path}")
 
     def _normalize(self, text: str) -> str:
@@ -145,6 +262,9 @@ class Glossary:
            b. Hyphenation variant
            c. Abbreviation if defined
 
+        All forms are matched in a single pass with word boundaries at both
+        ends, e.g. "autism" does not match inside "autistic".
+
         Args:
             text: Source text (English) to search
 
@@ -153,22 +273,21 @@ class Glossary:
             Example: {"demand avoidance": "évitement des demandes"}
         """
         normalized_text = self._normalize(text)
+        found = self._matcher.find_bounded(normalized_text)
         matches: dict[str, str] = {}
 
-        for normalized_term, entry in self._index.items():
-            # Check if term appears in text
-            # Use word boundary regex to avoid partial matches
-            # e.g., "autism" should not match inside "autistic"
-            pattern = r'\b' + re.escape(normalized_term) + r'\b'
+        if not found:
+            return matches
 
-            if re.search(pattern, normalized_text):
+        # Walk the index in order so results are identical to a per-term scan
+        for normalized_term, entry in self._index.items():
+            if normalized_term in found:
                 en_term = entry["en"]
-                fr_term = entry["fr"]
 
                 # Only add if we haven't already matched this term
                 # (avoids duplicates from hyphen variants)
                 if en_term not in matches:
-                    matches[en_term] = fr_term
+                    matches[en_term] = entry["fr"]
 
         return matches
 
@@ -223,6 +342,93 @@ class Glossary:
         normalized = self._normalize(en_term)
         return self._index.get(normalized)
 
+    def get_term_lemmas(self, fr_term: str) -> frozenset[str]:
+        """
+        Get content-word lemmas for a French term.
+
+        Glossary terms are served from the precomputed table. Terms outside
+        the glossary are lemmatized on first request and memoized in memory.
+        """
+        self.warm_lemmas()
+
+        lemmas = self._term_lemmas.get(fr_term)
+        if lemmas is None:
+            from .quality_checks import lemmatize_terms_fr
+
+            lemmas = lemmatize_terms_fr([fr_term])[0]
+            self._term_lemmas[fr_term] = lemmas
+        return lemmas
+
+    def warm_lemmas(self) -> None:
+        """Build the French lemma table now rather than on first use."""
+        if self._term_lemmas is None:
+            with self._lemma_lock:
+                if self._term_lemmas is None:
+                    self._term_lemmas = self._load_term_lemmas()
+
+    def _french_terms(self) -> list[str]:
+        """Return every distinct fr and fr_alt string, in glossary order."""
+        terms: dict[str, None] = {}
+        for entry in self.get_all_terms():
+            if isinstance(entry["fr"], str) and entry["fr"]:
+                terms[entry["fr"]] = None
+            fr_alts = entry.get("fr_alt") or []
+            if isinstance(fr_alts, list):
+                for alt in fr_alts:
+                    if isinstance(alt, str) and alt:
+                        terms[alt] = None
+        return list(terms)
+
+    def _load_term_lemmas(self) -> dict[str, frozenset[str]]:
+        """
+        Build the FR term -> lemmas table for the current version.
+
+        Reads the on-disk cache when its version matches, lemmatizes any
+        terms it lacks in one batched pass, and writes the result back.
+        """
+        cached: dict[str, list[str]] = {}
+        path = self._lemma_cache_path
+        if path is not None and path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    payload = json.load(f)
+                if payload.get("version") == self._version:
+                    cached = payload.get("lemmas", {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable lemma cache {path}: {e}")
+
+        terms = self._french_terms()
+        table = {term: frozenset(cached[term]) for term in terms if term in cached}
+        missing = [term for term in terms if term not in table]
+
+        if missing:
+            from .quality_checks import lemmatize_terms_fr
+
+            table.update(zip(missing, lemmatize_terms_fr(missing)))
+            logger.info(f"Lemmatized {len(missing)} glossary terms (version {self._version})")
+            self._save_term_lemmas(table)
+
+        return table
+
+    def _save_term_lemmas(self, table: dict[str, frozenset[str]]) -> None:
+        """Persist the lemma table atomically (write temp file, then rename)."""
+        path = self._lemma_cache_path
+        if path is None:
+            return
+
+        payload = {
+            "version": self._version,
+            "lemmas": {term: sorted(lemmas) for term, lemmas in table.items()},
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write lemma cache {path}: {e}")
+
     def get_all_terms(self) -> list[dict[str, Any]]:
         """Get all glossary entries (deduplicated)."""
         # Deduplicate by English term (hyphen variants point to same entry)
@@ -241,16 +447,47 @@ class Glossary:
 # --- Module-level singleton ---
 
 _glossary: Glossary | None = None
+_glossary_lock = threading.Lock()
 
 
 def get_glossary() -> Glossary:
     """Get the glossary singleton, loading it if necessary."""
     global _glossary
     if _glossary is None:
-        _glossary = Glossary()
+        with _glossary_lock:
+            if _glossary is None:
+                _glossary = Glossary(lemma_cache_path=LEMMA_CACHE_PATH)
     return _glossary
 
 
+def reload_glossary() -> Glossary:
+    """
+    Rebuild the glossary from disk and swap it in atomically.
+
+    The new instance is fully built (lemmas included, if the French model
+    is installed) before it replaces the singleton. If the file cannot be
+    loaded, the exception propagates and the current glossary stays.
+    """
+    global _glossary
+    current = _glossary
+    if current is None:
+        fresh = Glossary(lemma_cache_path=LEMMA_CACHE_PATH)
+    else:
+        fresh = Glossary(current._path, current._lemma_cache_path)
+
+    if is_model_installed("fr"):
+        try:
+            fresh.warm_lemmas()
+        except RuntimeError as e:
+            logger.warning(f"Glossary lemmas will be built on first use: {e}")
+
+    _glossary = fresh
+    logger.info(
+        f"Glossary reloaded: version {current.version if current else 'none'} -> {fresh.version}"
+    )
+    return fresh
+
+
 def get_glossary_version() -> str:
     """Return version string from glossary.yaml header."""
     return get_glossary().version
@@ -0,0 +1,129 @@
+"""
+Hot reload of data/glossary.yaml and data/taxonomy.yaml.
+
+Without this, an edit to either file is only picked up by restarting the MCP
+server, which also throws away the chunk cache and the loaded spaCy models.
+
+A daemon thread polls each watched file's (mtime, size). A change is acted on
+once it has been stable for one poll, so a half-written file is not loaded.
+The reload callbacks (reload_glossary, reload_taxonomy) build a complete new
+instance and swap it in with one assignment; if loading fails, the error is
+logged and the previous version keeps serving until the next edit.
+
+Polling rather than inotify keeps this dependency-free and portable (macOS
+dev machines); at a 2 s interval its cost is a couple of stat() calls.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+# --- Configuration ---
+
+WATCH_INTERVAL = 2.0  # Seconds between polls
+
+Signature = tuple[int, int]  # (st_mtime_ns, st_size)
+
+
+def _signature(path: Path) -> Signature | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class _Watch:
+    path: Path
+    on_change: Callable[[], Any]
+    loaded: Signature | None
+    pending: Signature | None = None
+
+
+class FileWatcher:
+    """Calls a reload function when a watched file changes."""
+
+    def __init__(self, interval: float = WATCH_INTERVAL):
+        self._interval = interval
+        self._watches: list[_Watch] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, path: Path, on_change: Callable[[], Any]) -> None:
+        """Watch path; the current contents count as already loaded."""
+        self._watches.append(_Watch(path, on_change, loaded=_signature(path)))
+
+    def poll(self) -> list[Path]:
+        """
+        Check every watched file once. Returns the paths that were reloaded.
+
+        A new signature is first recorded as pending; the reload runs when
+        the next poll sees the same signature.
+        """
+        reloaded = []
+        for watch in self._watches:
+            sig = _signature(watch.path)
+            if sig == watch.loaded or sig is None:
+                # Unchanged, or missing mid-replace: nothing to do yet
+                watch.pending = None
+                continue
+            if sig != watch.pending:
+                watch.pending = sig
+                continue
+
+            watch.loaded = sig
+            watch.pending = None
+            try:
+                watch.on_change()
+            except Exception as e:
+                logger.error(f"Reload of {watch.path} failed, keeping previous version: {e}")
+                continue
+            reloaded.append(watch.path)
+        return reloaded
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.poll()
+
+    def start(self) -> None:
+        """Start polling on a daemon thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="hot-reload", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+# --- Module-level singleton ---
+
+_watcher: FileWatcher | None = None
+
+
+def start_hot_reload(interval: float = WATCH_INTERVAL) -> FileWatcher:
+    """Watch the glossary and taxonomy files and reload them on change."""
+    global _watcher
+    if _watcher is None:
+        from .glossary import get_glossary, reload_glossary
+        from .taxonomy import get_taxonomy, reload_taxonomy
+
+        _watcher = FileWatcher(interval)
+        _watcher.watch(get_glossary()._path, reload_glossary)
+        _watcher.watch(get_taxonomy()._path, reload_taxonomy)
+        _watcher.start()
+        logger.info("Watching glossary and taxonomy for changes")
+    return _watcher
@@ -0,0 +1,331 @@
+"""
+Content-addressed sidecar store for article images.
+
+Datalab returns every image as base64. batch_extract used to inline each one
+as a data URI in its block's HTML, and parse_blocks carried those blobs into
+{slug}_parsed.json, so every text-only review tool decoded megabytes of
+base64. Images now live once on disk, named by the SHA-256 of their bytes,
+and JSON files carry a short reference instead:
+
+    <img src="pda-image:3f1c...e9.png">
+
+References are turned back into something a browser can load only when HTML
+leaves the pipeline: resolve_image_refs() maps them to URLs (the admin site
+serves the store) or, lazily and cached, to data URIs for self-contained
+HTML. save_article() does the latter for translated_full_text, which the
+public site renders without access to the store.
+
+Existing cache files are converted with:
+
+    python -m mcp_server.image_store [--dry-run] [paths ...]
+
+Layout: cache/images/{sha256[:2]}/{sha256}.{ext}
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# --- Paths and formats ---
+
+PROJECT_ROOT = Path(__file__).parent.parent
+IMAGE_STORE_DIR = PROJECT_ROOT / "cache" / "images"
+ARTICLES_DIR = PROJECT_ROOT / "cache" / "articles"
+
+IMAGE_REF_PREFIX = "pda-image:"
+SITE_URL_PREFIX = "/admin/images/_store/"  # Served from the store by the admin site
+
+MIME_TYPES = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "svg": "image/svg+xml",
+}
+EXTENSIONS = {"image/jpeg": "jpg", "image/png": "png", "image/gif": "gif", "image/webp": "webp", "image/svg+xml": "svg"}
+
+_REF = re.compile(r'pda-image:([0-9a-f]{64})\.([a-z0-9]+)')
+_SRC = re.compile(r'src="([^"]*)"')
+_DATA_URI = re.compile(r'data:(image/[\w.+-]+);base64,([A-Za-z0-9+/=]+)')
+
+
+def is_image_ref(value: str) -> bool:
+    """True if value is a store reference rather than an inline payload."""
+    return value.startswith(IMAGE_REF_PREFIX)
+
+
+def _extension(filename: str) -> str:
+    ext = Path(filename).suffix.lstrip(".").lower()
+    return ext if ext in MIME_TYPES else "jpg"
+
+
+class ImageStore:
+    """Image files on disk, named by content hash; writing the same bytes twice is free."""
+
+    def __init__(self, root: Path = IMAGE_STORE_DIR):
+        self._root = root
+
+    @property
+    def root(self) -> Path:
+        """Directory holding the images."""
+        return self._root
+
+    def path_for(self, ref: str) -> Path:
+        """File behind a reference (which may not exist)."""
+        match = _REF.fullmatch(ref)
+        if not match:
+            raise ValueError(f"Not an image reference: {ref[:80]}")
+        digest, ext = match.groups()
+        return self._root / digest[:2] / f"{digest}.{ext}"
+
+    def put(self, data: bytes, ext: str) -> str:
+        """Store image bytes and return their reference."""
+        ref = f"{IMAGE_REF_PREFIX}{hashlib.sha256(data).hexdigest()}.{ext}"
+        path = self.path_for(ref)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        return ref
+
+    def put_base64(self, payload: str, filename: str) -> str:
+        """
+        Store a base64 payload (as Datalab sends it) and return its reference.
+
+        Raises:
+            ValueError: payload is not valid base64
+        """
+        try:
+            data = base64.b64decode(payload, validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"Invalid base64 for {filename}: {e}") from e
+        return self.put(data, _extension(filename))
+
+    def read(self, ref: str) -> bytes:
+        """
+        Bytes of a stored image.
+
+        Raises:
+            FileNotFoundError: The image is not in the store
+        """
+        return self.path_for(ref).read_bytes()
+
+    def data_uri(self, ref: str) -> str:
+        """The image as a data URI (cached; files never change once written)."""
+        return _data_uri(self.path_for(ref))
+
+
+@lru_cache(maxsize=64)
+def _data_uri(path: Path) -> str:
+    mime = MIME_TYPES[path.suffix.lstrip(".")]
+    return f"data:{mime};base64,{base64.b64encode(path.read_bytes()).decode('ascii')}"
+
+
+# --- Module-level singleton ---
+
+_store: ImageStore | None = None
+
+
+def get_image_store() -> ImageStore:
+    """Get the image store singleton."""
+    global _store
+    if _store is None:
+        _store = ImageStore()
+    return _store
+
+
+# --- Moving payloads out of HTML and JSON ---
+
+def read_image_payload(value: str) -> bytes:
+    """Bytes of an image given as a store reference or as base64."""
+    if is_image_ref(value):
+        return get_image_store().read(value)
+    return base64.b64decode(value)
+
+
+def externalize_html(html: str, images: dict[str, str] | None = None) -> str:
+    """
+    Point img sources at the store instead of inlining image data.
+
+    Args:
+        html: Block or body HTML
+        images: Datalab's {filename: base64 or reference} for images the HTML
+            names by filename. Inline data URIs are always moved to the store;
+            a payload that is not valid base64 is inlined as a data URI.
+    """
+    if "data:image/" in html:
+        store = get_image_store()
+
+        def data_uri_to_ref(match: re.Match) -> str:
+            mime, payload = match.groups()
+            try:
+                data = base64.b64decode(payload, validate=True)
+            except binascii.Error:
+                return match.group(0)
+            return store.put(data, EXTENSIONS.get(mime, "jpg"))
+
+        html = _DATA_URI.sub(data_uri_to_ref, html)
+
+    # After the data URI pass, so payloads inlined below are left alone
+    if images and 'src="' in html:
+        store = get_image_store()
+        refs: dict[str, str] = {}
+
+        def to_ref(match: re.Match) -> str:
+            filename = match.group(1)
+            if filename not in images or not isinstance(images[filename], str):
+                return match.group(0)
+            if filename not in refs:
+                payload = images[filename]
+                if is_image_ref(payload):
+                    refs[filename] = payload
+                else:
+                    try:
+                        refs[filename] = store.put_base64(payload, filename)
+                    except ValueError as e:
+                        logger.warning(f"Keeping inline image {filename}: {e}")
+                        refs[filename] = f"data:{MIME_TYPES[_extension(filename)]};base64,{payload}"
+            return f'src="{refs[filename]}"'
+
+        html = _SRC.sub(to_ref, html)
+
+    return html
+
+
+def externalize_images(images: dict[str, str]) -> dict[str, str]:
+    """Replace a Datalab {filename: base64} dict's payloads with references."""
+    store = get_image_store()
+    result = {}
+    for filename, payload in images.items():
+        if not isinstance(payload, str) or is_image_ref(payload):
+            result[filename] = payload
+            continue
+        try:
+            result[filename] = store.put_base64(payload, filename)
+        except ValueError as e:
+            logger.warning(f"Keeping inline image {filename}: {e}")
+            result[filename] = payload
+    return result
+
+
+def externalize_document(value: Any) -> Any:
+    """Copy of a Datalab or parsed-article JSON value with every image payload in the store."""
+    if isinstance(value, str):
+        return externalize_html(value) if "data:image/" in value else value
+    if isinstance(value, list):
+        return [externalize_document(item) for item in value]
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if key == "images" and isinstance(item, dict):
+                result[key] = externalize_images(item)
+            else:
+                result[key] = externalize_document(item)
+        return result
+    return value
+
+
+# --- Resolving references ---
+
+def resolve_image_refs(html: str, url_prefix: str | None = None) -> str:
+    """
+    Make image references loadable, for HTML leaving the pipeline.
+
+    Args:
+        html: HTML that may contain references
+        url_prefix: Serve images from here (url_prefix + "{sha256}.{ext}"),
+            e.g. SITE_URL_PREFIX.
+            Without it, references become data URIs, read from the store
+            only for images the HTML actually contains.
+    """
+    if IMAGE_REF_PREFIX not in html:
+        return html
+    store = get_image_store()
+
+    def resolve(match: re.Match) -> str:
+        if url_prefix is not None:
+            return f"{url_prefix}{match.group(1)}.{match.group(2)}"
+        try:
+            return store.data_uri(match.group(0))
+        except (FileNotFoundError, KeyError):
+            logger.warning(f"Image missing from store: {match.group(0)}")
+            return match.group(0)
+
+    return _REF.sub(resolve, html)
+
+
+# --- Migration of existing cache files ---
+
+def migrate_file(path: Path, dry_run: bool = False) -> tuple[int, int]:
+    """
+    Move the image payloads of one JSON file into the store.
+
+    Returns (bytes before, bytes after); equal if nothing changed.
+    """
+    before = path.stat().st_size
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    migrated = externalize_document(data)
+    if migrated == data:
+        return before, before
+
+    text = json.dumps(migrated, ensure_ascii=False, indent=2)
+    after = len(text.encode("utf-8"))
+    if not dry_run:
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    return before, after
+
+
+def default_migration_paths() -> list[Path]:
+    """Datalab and parsed JSON files under cache/articles and its subfolders."""
+    return sorted(
+        path for path in ARTICLES_DIR.rglob("*.json")
+        if not path.name.startswith(".") and "images" not in path.relative_to(ARTICLES_DIR).parts
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Move inline images from cache JSON files into the image store")
+    parser.add_argument("paths", nargs="*", type=Path, help="JSON files (default: everything under cache/articles)")
+    parser.add_argument("--dry-run", action="store_true", help="Report sizes without rewriting files")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or default_migration_paths()
+    total_before = total_after = changed = 0
+    for path in paths:
+        try:
+            before, after = migrate_file(path, dry_run=args.dry_run)
+        except (OSError, ValueError) as e:
+            print(f"  SKIPPED {path.name}: {e}", file=sys.stderr)
+            continue
+        total_before += before
+        total_after += after
+        if after != before:
+            changed += 1
+            print(f"  {path.name}: {before / 1024:.0f} KB -> {after / 1024:.0f} KB")
+
+    verb = "Would rewrite" if args.dry_run else "Rewrote"
+    print(f"{verb} {changed} of {len(paths)} files: {total_before / 1024 / 1024:.1f} MB -> {total_after / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
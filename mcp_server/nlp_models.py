@@ -0,0 +1,287 @@
+"""
+Shared spaCy model registry.
+
+Per D18, spaCy models are loaded once and reused. This module is the single
+load point: callers ask for a pipeline by language and task. Each language's
+model is loaded once and shared by its tasks; a task runs only the
+components it needs, by disabling the others per call (not select_pipes(),
+which changes the shared model under concurrent callers).
+
+Tasks:
+- sentences: senter only (sentence counting, splitting long paragraphs)
+- lemmas:    tagger/morphologizer + lemmatizer (content words, glossary terms)
+- analysis:  senter + tagger + lemmatizer (one pass for all quality checks)
+
+The dependency parser and NER are never loaded; they dominate load time and
+memory in the small models and no task uses them.
+
+Each task pipeline records its throughput, and the load time and
+approximate memory cost (RSS delta while loading) of the model it shares;
+see get_model_stats().
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import resource
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+# --- Configuration ---
+
+MODELS = {
+    "en": "en_core_web_sm",
+    "fr": "fr_core_news_sm",
+}
+
+TASK_SENTENCES = "sentences"
+TASK_LEMMAS = "lemmas"
+TASK_ANALYSIS = "analysis"
+
+# Components excluded at load time; no task uses them
+_EXCLUDE = ("parser", "ner")
+
+# Components skipped per call, per task. Names missing from a given model
+# (e.g. "tagger" in the French model) are simply ignored by spaCy.
+_TASK_DISABLE: dict[str, tuple[str, ...]] = {
+    TASK_SENTENCES: ("tagger", "morphologizer", "attribute_ruler", "lemmatizer"),
+    TASK_LEMMAS: ("senter", "sentencizer"),
+    TASK_ANALYSIS: (),
+}
+
+
+def _rss_bytes() -> int:
+    """Current resident set size in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+# --- Stats ---
+
+@dataclass
+class PipelineStats:
+    """Usage counters for one (language, task) pipeline, and its model's load cost."""
+    lang: str
+    task: str
+    model: str
+    components: list[str] = field(default_factory=list)
+    load_seconds: float = 0.0  # Of the model, shared by the language's tasks
+    memory_bytes: int = 0      # RSS growth while loading the model (approximate)
+    docs: int = 0
+    chars: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summary suitable for logging or returning from a tool."""
+        return {
+            "lang": self.lang,
+            "task": self.task,
+            "model": self.model,
+            "components": self.components,
+            "load_seconds": round(self.load_seconds, 3),
+            "memory_mb": round(self.memory_bytes / (1024 * 1024), 1),
+            "docs": self.docs,
+            "chars": self.chars,
+            "seconds": round(self.seconds, 3),
+            "chars_per_second": round(self.chars / self.seconds) if self.seconds else None,
+        }
+
+
+class TaskPipeline:
+    """
+    A language's shared spaCy model bound to one task, with throughput accounting.
+
+    Behaves like a Language object for the two calls the server makes:
+    nlp(text) and nlp.pipe(texts), running only the task's components.
+    """
+
+    def __init__(self, nlp, stats: PipelineStats, disable: tuple[str, ...] = ()):
+        self.nlp = nlp
+        self.stats = stats
+        self.disable = list(disable)
+
+    def __call__(self, text: str):
+        start = time.perf_counter()
+        doc = self.nlp(text, disable=self.disable)
+        self._record(len(text), time.perf_counter() - start)
+        return doc
+
+    def pipe(self, texts: Iterable[str], batch_size: int = 256) -> Iterator[Any]:
+        """Stream docs via nlp.pipe, counting time spent inside spaCy."""
+        sizes: deque[int] = deque()
+
+        def tracked() -> Iterator[str]:
+            for text in texts:
+                sizes.append(len(text))
+                yield text
+
+        docs = iter(self.nlp.pipe(tracked(), batch_size=batch_size, disable=self.disable))
+        while True:
+            start = time.perf_counter()
+            doc = next(docs, None)
+            elapsed = time.perf_counter() - start
+            if doc is None:
+                self.stats.seconds += elapsed
+                return
+            self._record(sizes.popleft(), elapsed)
+            yield doc
+
+    def _record(self, chars: int, seconds: float) -> None:
+        self.stats.docs += 1
+        self.stats.chars += chars
+        self.stats.seconds += seconds
+
+
+# --- Registry ---
+
+@dataclass
+class _LoadedModel:
+    """A language's model, loaded once without parser and NER."""
+    nlp: Any
+    load_seconds: float
+    memory_bytes: int
+
+
+class ModelRegistry:
+    """
+    Loads spaCy models and hands out task-specific pipelines over them.
+
+    Each language's model is loaded at most once and shared by its task
+    pipelines. A model that fails to load is remembered, so later calls
+    fail fast instead of retrying.
+    """
+
+    def __init__(self, loader: Callable[..., Any] | None = None):
+        self._loader = loader
+        self._models: dict[str, _LoadedModel] = {}
+        self._pipelines: dict[tuple[str, str], TaskPipeline] = {}
+        self._failures: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, lang: str, task: str) -> TaskPipeline:
+        """
+        Get the pipeline for a language and task, loading the model if necessary.
+
+        Raises:
+            ValueError: Unknown language or task
+            RuntimeError: The spaCy model is not installed
+        """
+        key = (lang, task)
+        pipeline = self._pipelines.get(key)
+        if pipeline is not None:
+            return pipeline
+
+        if lang not in MODELS:
+            raise ValueError(f"Unknown language: {lang}. Expected one of {sorted(MODELS)}")
+        if task not in _TASK_DISABLE:
+            raise ValueError(f"Unknown task: {task}. Expected one of {sorted(_TASK_DISABLE)}")
+
+        with self._lock:
+            pipeline = self._pipelines.get(key)
+            if pipeline is None:
+                model = self._models.get(lang)
+                if model is None:
+                    if lang in self._failures:
+                        raise RuntimeError(self._failures[lang])
+                    model = self._models[lang] = self._load(lang)
+                pipeline = self._pipelines[key] = self._bind(lang, task, model)
+        return pipeline
+
+    def _load(self, lang: str) -> _LoadedModel:
+        """Load a language's model without parser and NER, and measure what it cost."""
+        model = MODELS[lang]
+        loader = self._loader
+        if loader is None:
+            import spacy
+            loader = spacy.load
+
+        rss_before = _rss_bytes()
+        start = time.perf_counter()
+        try:
+            nlp = loader(model, exclude=list(_EXCLUDE))
+        except OSError as e:
+            message = (
+                f"spaCy model '{model}' not found. "
+                f"Run: python -m spacy download {model}"
+            )
+            logger.error(message)
+            self._failures[lang] = message
+            raise RuntimeError(message) from e
+
+        # senter ships disabled in the sm models (the parser normally sets sentences)
+        if "senter" in nlp.disabled:
+            nlp.enable_pipe("senter")
+        elif "senter" not in nlp.pipe_names:
+            logger.warning(f"{model} has no senter; using rule-based sentencizer")
+            nlp.add_pipe("sentencizer", first=True)
+
+        loaded = _LoadedModel(nlp, time.perf_counter() - start, max(_rss_bytes() - rss_before, 0))
+        logger.info(
+            f"Loaded spaCy {model} ({', '.join(nlp.pipe_names)}) in {loaded.load_seconds:.2f}s, "
+            f"+{loaded.memory_bytes / (1024 * 1024):.0f} MB"
+        )
+        return loaded
+
+    @staticmethod
+    def _bind(lang: str, task: str, model: _LoadedModel) -> TaskPipeline:
+        """Task pipeline over a loaded model."""
+        disable = _TASK_DISABLE[task]
+        stats = PipelineStats(
+            lang=lang,
+            task=task,
+            model=MODELS[lang],
+            components=[name for name in model.nlp.pipe_names if name not in disable],
+            load_seconds=model.load_seconds,
+            memory_bytes=model.memory_bytes,
+        )
+        return TaskPipeline(model.nlp, stats, disable)
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Per-task throughput, and model memory, for every loaded pipeline."""
+        return [pipeline.stats.as_dict() for pipeline in self._pipelines.values()]
+
+
+def is_model_installed(lang: str) -> bool:
+    """Check whether the model package for lang is installed, without loading it."""
+    return importlib.util.find_spec(MODELS[lang]) is not None
+
+
+# --- Module-level singleton ---
+
+_registry: ModelRegistry | None = None
+
+
+def get_registry() -> ModelRegistry:
+    """Get the model registry singleton."""
+    global _registry
+    if _registry is None:
+        _registry = ModelRegistry()
+    return _registry
+
+
+def get_pipeline(lang: str, task: str) -> TaskPipeline:
+    """
+    Get a task-specific pipeline from the shared registry.
+
+    Convenience function that uses the singleton registry.
+    """
+    return get_registry().get(lang, task)
+
+
+def get_model_stats() -> list[dict[str, Any]]:
+    """Report load cost and throughput for each loaded pipeline."""
+    return get_registry().stats()
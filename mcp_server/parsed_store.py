@@ -0,0 +1,211 @@
+"""
+In-memory store for the JSON documents the preprocessing tools work on.
+
+An article goes through twenty-odd preprocessing tool calls (review, body
+review, every step4_check_* and step4_confirm_*), and each one used to
+json.load {slug}_parsed.json, base64 figure payloads included. The store
+keeps each decoded document in memory, keyed by path:
+
+- load() decodes a file once and serves it from memory until the file's
+  mtime or size changes (an edit from outside the server is picked up on
+  the next call).
+- save() writes the file at once, via a temp file and rename, so readers
+  never see a half-written file. It first checks that the file is still the
+  version the document was loaded from. The admin site writes the same
+  files, and an edit made there between a load and a save is reported
+  rather than overwritten.
+- write() replaces the file without that check, for newly parsed articles.
+- move() writes a document to its new home and removes the old file, for
+  articles leaving cache/ for ready/.
+
+What the store removes is the decode on every call. Writes are not
+deferred: a confirmed review is on disk when the tool returns, even if the
+server is then killed, so each confirm still encodes and rewrites the whole
+file. Files are written as compact JSON rather than with indent=2, which
+keeps that rewrite smaller and faster.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+# --- Configuration ---
+
+MAX_DOCUMENTS = 16  # Documents kept in memory (one article needs two)
+
+
+class StaleDocumentError(RuntimeError):
+    """The file changed on disk after the document being saved was loaded."""
+
+
+@dataclass
+class _Document:
+    data: dict[str, Any]
+    mtime_ns: int  # Signature of the file this data matches
+    size: int
+
+
+def _write_atomic(path: Path, data: dict[str, Any]) -> os.stat_result:
+    """Write data as compact JSON via a temp file and rename. Returns the new file's stat."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, ensure_ascii=False))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path.stat()
+
+
+class ParsedArticleStore:
+    """
+    Decoded JSON documents, cached by path and validated by mtime and size.
+
+    load() returns a shallow copy: a tool can assign top-level keys and then
+    decide not to save without affecting what the next call sees. Nested
+    values are shared, so replace them rather than mutating them in place.
+    """
+
+    def __init__(self, max_documents: int = MAX_DOCUMENTS):
+        self._max_documents = max_documents
+        self._docs: dict[Path, _Document] = {}  # Insertion order = least recently used first
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path: Path | str) -> Path:
+        return Path(path).absolute()
+
+    # --- Reading ---
+
+    def load(self, path: Path | str) -> dict[str, Any]:
+        """
+        Return the document at path, decoding the file only if it changed.
+
+        Raises:
+            FileNotFoundError: No file at path
+            json.JSONDecodeError: The file is not valid JSON
+        """
+        key = self._key(path)
+        with self._lock:
+            doc = self._docs.get(key)
+            try:
+                stat = key.stat()
+            except FileNotFoundError:
+                self._docs.pop(key, None)
+                raise
+            if doc is not None and (doc.mtime_ns, doc.size) == (stat.st_mtime_ns, stat.st_size):
+                self._touch(key)
+                self.hits += 1
+                return dict(doc.data)
+
+            with open(key, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.misses += 1
+            self._docs[key] = _Document(data, stat.st_mtime_ns, stat.st_size)
+            self._touch(key)
+            self._evict()
+            return dict(data)
+
+    def _touch(self, key: Path) -> None:
+        self._docs[key] = self._docs.pop(key)
+
+    def _evict(self) -> None:
+        while len(self._docs) > self._max_documents:
+            del self._docs[next(iter(self._docs))]
+
+    # --- Writing ---
+
+    def _check_unchanged(self, key: Path) -> None:
+        """Raise StaleDocumentError if the file is not the version last loaded."""
+        doc = self._docs.get(key)
+        try:
+            stat = key.stat()
+        except FileNotFoundError:
+            stat = None
+        if doc is None:
+            if stat is None:
+                return
+            raise StaleDocumentError(f"{key.name} was not loaded before saving")
+        if stat is None or (stat.st_mtime_ns, stat.st_size) != (doc.mtime_ns, doc.size):
+            # Forget it, so the next load() reads the other edit
+            del self._docs[key]
+            raise StaleDocumentError(
+                f"{key.name} was changed outside the server since it was loaded; "
+                f"call the tool again to work on the current version"
+            )
+
+    def save(self, path: Path | str, data: dict[str, Any]) -> None:
+        """
+        Write an edited document, if the file is still the version loaded.
+
+        Raises:
+            StaleDocumentError: The file changed since the last load()
+        """
+        key = self._key(path)
+        with self._lock:
+            self._check_unchanged(key)
+            self._store(key, data)
+
+    def write(self, path: Path | str, data: dict[str, Any]) -> None:
+        """Replace the document and its file (for newly parsed articles)."""
+        with self._lock:
+            self._store(self._key(path), data)
+
+    def _store(self, key: Path, data: dict[str, Any]) -> None:
+        stat = _write_atomic(key, data)
+        self._docs[key] = _Document(dict(data), stat.st_mtime_ns, stat.st_size)
+        self._touch(key)
+        self._evict()
+
+    def move(self, path: Path | str, dest: Path | str, data: dict[str, Any]) -> None:
+        """
+        Write data to dest, then remove path and forget it (cache/ -> ready/).
+
+        Raises:
+            StaleDocumentError: The file at path changed since the last load()
+        """
+        key = self._key(path)
+        with self._lock:
+            self._check_unchanged(key)
+            _write_atomic(self._key(dest), data)
+            self._docs.pop(key, None)
+            key.unlink(missing_ok=True)
+
+    def discard(self, path: Path | str) -> None:
+        """Forget path."""
+        with self._lock:
+            self._docs.pop(self._key(path), None)
+
+    def stats(self) -> dict[str, Any]:
+        """Cache counters, for debugging."""
+        with self._lock:
+            return {
+                "documents": len(self._docs),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# --- Module-level singleton ---
+
+_store: ParsedArticleStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_parsed_store() -> ParsedArticleStore:
+    """Get the store singleton."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ParsedArticleStore()
+    return _store
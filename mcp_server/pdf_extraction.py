@@ -10,23 +10,33 @@ Per Part 5 of the plan:
 This module detects SPECIFIC, OBSERVABLE problems (not confidence scores):
 - BLOCKING: UNUSABLE, TOOSHORT, GARBLED
 - WARNING: COLUMNJUMBLE, NOPARAGRAPHS, REPEATEDTEXT, NOREFSSECTION
+
+Parallel mode (opt-in, PDA_PARALLEL_EXTRACTION=1 or parallel=True): all
+extractors start at once in a process pool and the first usable result in
+priority order wins, so a bad PyMuPDF pass no longer costs three parses in
+series. The chosen result is identical to the serial chain's.
+
+The PDF libraries (fitz, pymupdf4llm, pdfminer, pdfplumber) take over a
+second to import, so they are imported inside the functions that use them.
+Importing this module, and therefore tools.py, stays cheap for tools that
+never touch a PDF.
 """
 
 from __future__ import annotations
 
+import importlib.util
 import logging
+import multiprocessing
+import os
 import re
+import tempfile
+import time
 import urllib.request
 import urllib.error
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
-import fitz  # PyMuPDF
-import pymupdf4llm
-from pdfminer.high_level import extract_text as pdfminer_extract
-import pdfplumber
-
 logger = logging.getLogger(__name__)
 
 
@@ -56,17 +66,53 @@ class FetchResult:
 
 # --- Fetch and Cache ---
 
-def fetch_and_cache(article_id: str, source_url: str, timeout: int = 30) -> FetchResult:
+# Streaming download settings
+DOWNLOAD_BLOCK_SIZE = 64 * 1024          # Bytes per read; the first block is sniffed
+MAX_DOWNLOAD_BYTES = 100 * 1024 * 1024   # Abort downloads larger than this
+
+PAYWALL_INDICATORS = [
+    b'purchase', b'subscribe', b'sign in', b'access denied',
+    b'institutional access', b'buy this article', b'rent this article',
+    b'full text unavailable', b'abstract only'
+]
+
+
+def _read_first_block(response, size: int) -> bytes:
+    """Read up to size bytes, looping over short reads until EOF."""
+    parts: list[bytes] = []
+    remaining = size
+    while remaining > 0:
+        data = response.read(remaining)
+        if not data:
+            break
+        parts.append(data)
+        remaining -= len(data)
+    return b"".join(parts)
+
+
+def fetch_and_cache(
+    article_id: str,
+    source_url: str,
+    timeout: int = 30,
+    max_bytes: int = MAX_DOWNLOAD_BYTES,
+) -> FetchResult:
     """
     Fetch content from URL and cache it.
 
     Validates that the response is actually a PDF before caching.
     Returns error if URL is a paywall page, 404, or other non-PDF response.
 
+    The body is streamed to a temp file in CACHE_DIR in DOWNLOAD_BLOCK_SIZE
+    blocks, so memory stays flat for large PDFs. PDF magic bytes and paywall
+    markers are checked on the first block only: non-PDF responses are
+    rejected without downloading the rest. A complete download is renamed
+    into place atomically, so a partial file is never visible as cached.
+
     Args:
         article_id: Article ID for cache filename
         source_url: URL to fetch from
         timeout: Request timeout in seconds
+        max_bytes: Maximum body size; larger downloads fail with FETCH_FAILED
 
     Returns:
         FetchResult with success status, cached path, or error details
@@ -84,25 +130,30 @@ def fetch_and_cache(article_id: str, source_url: str, timeout: int = 30) -> Fetc
         )
 
         with urllib.request.urlopen(request, timeout=timeout) as response:
-            content = response.read()
             content_type = response.headers.get('Content-Type', '')
 
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+                return FetchResult(
+                    success=False,
+                    path=None,
+                    error_code="FETCH_FAILED",
+                    error_message=f"Response is {int(content_length)} bytes, over the {max_bytes} byte limit"
+                )
+
+            head = _read_first_block(response, DOWNLOAD_BLOCK_SIZE)
+
             # Check if it's a PDF
             is_pdf = (
-                content[:4] == b'%PDF' or
+                head[:4] == b'%PDF' or
                 'application/pdf' in content_type.lower()
             )
 
             if not is_pdf:
                 # Check for paywall indicators in HTML
-                if b'<html' in content[:1000].lower():
-                    content_lower = content.lower()
-                    paywall_indicators = [
-                        b'purchase', b'subscribe', b'sign in', b'access denied',
-                        b'institutional access', b'buy this article', b'rent this article',
-                        b'full text unavailable', b'abstract only'
-                    ]
-                    if any(indicator in content_lower for indicator in paywall_indicators):
+                head_lower = head.lower()
+                if b'<html' in head_lower[:1000]:
+                    if any(indicator in head_lower for indicator in PAYWALL_INDICATORS):
                         return FetchResult(
                             success=False,
                             path=None,
@@ -117,9 +168,35 @@ def fetch_and_cache(article_id: str, source_url: str, timeout: int = 30) -> Fetc
                     error_message=f"URL returned non-PDF content (Content-Type: {content_type})"
                 )
 
-            # Cache the PDF
-            cached_path = cache_content(article_id, content, source_url)
-            logger.info(f"Fetched and cached: {article_id} from {source_url}")
+            # Stream the rest to a temp file next to the final path
+            tmp = tempfile.NamedTemporaryFile(
+                dir=CACHE_DIR, prefix=f".{article_id}.", suffix=".part", delete=False
+            )
+            tmp_path = Path(tmp.name)
+            try:
+                with tmp:
+                    size = len(head)
+                    tmp.write(head)
+                    while True:
+                        block = response.read(DOWNLOAD_BLOCK_SIZE)
+                        if not block:
+                            break
+                        size += len(block)
+                        if size > max_bytes:
+                            return FetchResult(
+                                success=False,
+                                path=None,
+                                error_code="FETCH_FAILED",
+                                error_message=f"Download exceeded the {max_bytes} byte limit"
+                            )
+                        tmp.write(block)
+
+                cached_path = CACHE_DIR / f"{article_id}{_cache_extension(source_url, head)}"
+                os.replace(tmp_path, cached_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+            logger.info(f"Fetched and cached: {article_id} from {source_url} ({size} bytes)")
 
             return FetchResult(
                 success=True,
@@ -175,14 +252,81 @@ def fetch_and_cache(article_id: str, source_url: str, timeout: int = 30) -> Fetc
 
 # --- Extraction Functions ---
 
-def extract_pymupdf(pdf_path: Path) -> str:
+# Documents with at least this many pages are converted in page-range
+# shards across a process pool (proceedings and booklets run to 100+ pages)
+PYMUPDF_PARALLEL_MIN_PAGES = 40
+PYMUPDF_MAX_WORKERS = 4
+PYMUPDF_SHARD_PAGES = True  # False: always convert in one process
+
+
+def _layout_engine_installed() -> bool:
+    """pymupdf4llm converts with the layout engine whenever pymupdf.layout is installed."""
+    try:
+        return importlib.util.find_spec("pymupdf.layout") is not None
+    except ImportError:
+        return False
+
+
+def _pymupdf_pages(pdf_path: str, pages: list[int]) -> str:
+    """Pool worker: convert one page range to Markdown."""
+    import pymupdf4llm
+
+    return pymupdf4llm.to_markdown(pdf_path, pages=pages)
+
+
+def extract_pymupdf(
+    pdf_path: Path,
+    min_pages: int = PYMUPDF_PARALLEL_MIN_PAGES,
+    max_workers: int = PYMUPDF_MAX_WORKERS,
+    shard_pages: bool = PYMUPDF_SHARD_PAGES,
+) -> str:
     """
     Extract text as Markdown using PyMuPDF4LLM.
 
     Preserves document structure: headings, tables, lists, paragraphs.
     Returns Markdown-formatted text ready for translation.
+
+    Long documents are split into contiguous page ranges converted in
+    parallel and joined in page order. With the layout engine each page is
+    rendered independently, so the result is the same as one whole-document
+    call. The legacy engine derives heading levels from the pages it is
+    given, so without pymupdf-layout installed, or with shard_pages=False,
+    the document is converted in one process.
     """
-    return pymupdf4llm.to_markdown(str(pdf_path))
+    import fitz  # PyMuPDF
+    import pymupdf4llm
+
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+
+    workers = min(max_workers, os.cpu_count() or 1)
+    if (
+        not shard_pages
+        or page_count < min_pages
+        or workers < 2
+        or not _layout_engine_installed()
+        # Pool workers (e.g. the parallel extractor race) cannot start pools
+        or multiprocessing.current_process().daemon
+    ):
+        return pymupdf4llm.to_markdown(str(pdf_path))
+
+    shard_size = -(-page_count // workers)  # ceiling division
+    shards = [
+        list(range(start, min(start + shard_size, page_count)))
+        for start in range(0, page_count, shard_size)
+    ]
+
+    try:
+        pool = multiprocessing.get_context("spawn").Pool(processes=len(shards))
+    except OSError as e:
+        logger.warning(f"Could not start PyMuPDF pool, converting in one process: {e}")
+        return pymupdf4llm.to_markdown(str(pdf_path))
+
+    with pool:
+        parts = pool.starmap(_pymupdf_pages, [(str(pdf_path), pages) for pages in shards])
+
+    logger.info(f"PyMuPDF converted {page_count} pages in {len(shards)} shards")
+    return "".join(parts)
 
 
 def extract_pdfminer(pdf_path: Path) -> str:
@@ -191,6 +335,8 @@ def extract_pdfminer(pdf_path: Path) -> str:
 
     Better layout analysis for two-column academic papers.
     """
+    from pdfminer.high_level import extract_text as pdfminer_extract
+
     return pdfminer_extract(str(pdf_path))
 
 
@@ -200,6 +346,8 @@ def extract_pdfplumber(pdf_path: Path) -> str:
 
     Good for table extraction, different text flow algorithm.
     """
+    import pdfplumber
+
     text_parts = []
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
@@ -303,7 +451,100 @@ def _has_repeated_blocks(text: str, min_block_size: int = 100) -> bool:
 
 # --- Main Extraction Function ---
 
-def extract_article_text(article_path: Path) -> ExtractionResult:
+# Fallback chain, in priority order (per Part 5)
+EXTRACTORS: list[tuple[str, Callable[[Path], str]]] = [
+    ("pymupdf", extract_pymupdf),
+    ("pdfminer", extract_pdfminer),
+    ("pdfplumber", extract_pdfplumber),
+]
+
+# Opt-in: race the extractors in a process pool instead of running them in series
+PARALLEL_EXTRACTION = os.environ.get("PDA_PARALLEL_EXTRACTION") == "1"
+
+# Per-extractor time limits for parallel mode, in seconds from the race start
+EXTRACTOR_TIMEOUTS: dict[str, float] = {
+    "pymupdf": 120.0,
+    "pdfminer": 180.0,
+    "pdfplumber": 180.0,
+}
+
+
+def _run_extractor(name: str, path: str) -> tuple[str, list[str]]:
+    """Pool worker: run one extractor and detect problems in the child process."""
+    extract_fn = dict(EXTRACTORS)[name]
+    text = extract_fn(Path(path))
+    return text, detect_extraction_problems(text)
+
+
+def _extract_parallel(
+    article_path: Path,
+    timeouts: dict[str, float],
+) -> ExtractionResult | None:
+    """
+    Run every extractor concurrently and accept the first usable result
+    in priority order.
+
+    Results are awaited in chain order, so a faster lower-priority extractor
+    never wins over a usable higher-priority one. Once a result is accepted
+    the pool is terminated, killing extractors still running.
+
+    Returns None if the pool could not be started (caller falls back to serial).
+    """
+    try:
+        # spawn: the server process has threads, which fork does not copy safely
+        pool = multiprocessing.get_context("spawn").Pool(processes=len(EXTRACTORS))
+    except OSError as e:
+        logger.warning(f"Could not start extraction pool, running serially: {e}")
+        return None
+
+    try:
+        start = time.monotonic()
+        pending = [
+            (name, pool.apply_async(_run_extractor, (name, str(article_path))))
+            for name, _ in EXTRACTORS
+        ]
+
+        for name, async_result in pending:
+            deadline = start + timeouts.get(name, EXTRACTOR_TIMEOUTS.get(name, 180.0))
+            try:
+                text, problems = async_result.get(timeout=max(deadline - time.monotonic(), 0))
+            except multiprocessing.TimeoutError:
+                logger.warning(f"Extractor {name} timed out")
+                continue
+            except Exception as e:
+                logger.warning(f"Extractor {name} failed: {e}")
+                continue
+
+            if "UNUSABLE" not in problems:
+                logger.info(
+                    f"Extraction successful with {name} (parallel, "
+                    f"{time.monotonic() - start:.1f}s), problems: {problems}"
+                )
+                return ExtractionResult(
+                    text=text,
+                    extractor_used=name,
+                    problems=problems,
+                    usable=True,
+                )
+            logger.warning(f"Extractor {name} produced unusable text: {problems}")
+
+        logger.error(f"All extractors failed for {article_path}")
+        return ExtractionResult(
+            text="",
+            extractor_used="none",
+            problems=["PDFEXTRACT"],
+            usable=False,
+        )
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def extract_article_text(
+    article_path: Path,
+    parallel: bool | None = None,
+    timeouts: dict[str, float] | None = None,
+) -> ExtractionResult:
     """
     Extract text from a PDF using fallback chain.
 
@@ -312,6 +553,9 @@ def extract_article_text(article_path: Path) -> ExtractionResult:
 
     Args:
         article_path: Path to PDF file (or .txt for preprocessed)
+        parallel: Race extractors in a process pool (default: PARALLEL_EXTRACTION)
+        timeouts: Per-extractor limits in seconds for parallel mode
+            (default: EXTRACTOR_TIMEOUTS)
 
     Returns:
         ExtractionResult with text, extractor used, problems, and usability flag
@@ -333,14 +577,15 @@ def extract_article_text(article_path: Path) -> ExtractionResult:
     if article_path.suffix.lower() == '.html':
         return _extract_from_html(article_path)
 
-    # PDF extraction with fallback chain
-    extractors: list[tuple[str, Callable[[Path], str]]] = [
-        ("pymupdf", extract_pymupdf),
-        ("pdfminer", extract_pdfminer),
-        ("pdfplumber", extract_pdfplumber),
-    ]
+    if parallel is None:
+        parallel = PARALLEL_EXTRACTION
+    if parallel:
+        result = _extract_parallel(article_path, timeouts or EXTRACTOR_TIMEOUTS)
+        if result is not None:
+            return result
 
-    for name, extract_fn in extractors:
+    # PDF extraction with fallback chain
+    for name, extract_fn in EXTRACTORS:
         try:
             logger.info(f"Trying extractor: {name}")
             text = extract_fn(article_path)
@@ -442,6 +687,15 @@ def get_cached_path(article_id: str) -> Path | None:
     return None
 
 
+def _cache_extension(source_url: str, head: bytes) -> str:
+    """Pick the cache file extension from the URL and the first bytes of content."""
+    if source_url.endswith('.pdf') or head[:4] == b'%PDF':
+        return '.pdf'
+    elif b'<html' in head[:1000].lower():
+        return '.html'
+    return '.txt'
+
+
 def cache_content(article_id: str, content: bytes, source_url: str) -> Path:
     """
     Save fetched content to cache.
@@ -451,15 +705,7 @@ def cache_content(article_id: str, content: bytes, source_url: str) -> Path:
     # Ensure cache directory exists
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Determine extension
-    if source_url.endswith('.pdf') or content[:4] == b'%PDF':
-        ext = '.pdf'
-    elif b'<html' in content[:1000].lower():
-        ext = '.html'
-    else:
-        ext = '.txt'
-
-    path = CACHE_DIR / f"{article_id}{ext}"
+    path = CACHE_DIR / f"{article_id}{_cache_extension(source_url, content)}"
     path.write_bytes(content)
     logger.info(f"Cached content: {path}")
     return path
@@ -474,6 +720,8 @@ def extract_pdf_metadata(pdf_path: Path) -> dict[str, str | None]:
     Falls back to text extraction for title if metadata missing.
     Used by ingest_article() tool.
     """
+    import fitz  # PyMuPDF
+
     doc = fitz.open(pdf_path)
     metadata = doc.metadata or {}
 
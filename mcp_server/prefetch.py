@@ -0,0 +1,179 @@
+"""
+Prefetch of upcoming article sources.
+
+Without prefetch, a source URL is fetched the first time get_chunk() is
+called for an article, so every article blocks on network I/O inside the
+translation loop. After get_next_article() hands out an article, the server
+starts a background prefetch of the next few pending articles: their sources
+are downloaded and pre-extracted into the extraction store, so their first
+get_chunk() is served from warm caches.
+
+Downloads run concurrently (asyncio, with the blocking fetch in worker
+threads), limited both overall and per host so a single publisher is not
+hit with a burst of requests.
+
+The database is read only when choosing candidates, on the caller's thread;
+the background thread touches just the file cache and extraction store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+from .database import get_database
+from .extraction_store import load_extraction
+from .pdf_extraction import fetch_and_cache, get_cached_path
+
+logger = logging.getLogger(__name__)
+
+
+# --- Configuration ---
+
+PREFETCH_COUNT = 3        # Pending articles to look ahead
+PREFETCH_CONCURRENCY = 4  # Simultaneous downloads overall
+PREFETCH_PER_HOST = 2     # Simultaneous downloads per host
+PREFETCH_RETRY_BASE = 300   # Seconds before a failed article is tried again
+PREFETCH_RETRY_MAX = 3600   # Backoff cap, doubling from the base per failure
+
+
+@dataclass
+class PrefetchReport:
+    """Outcome of one prefetch run, by article ID."""
+    fetched: list[str] = field(default_factory=list)
+    extracted: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)  # article_id -> error code
+
+
+# --- Failed prefetches ---
+# Per process: article_id -> (failure count, monotonic time of next attempt).
+# A paywalled or dead URL would otherwise be downloaded again after every
+# get_next_article(); get_chunk() still fetches it on demand.
+
+_failures: dict[str, tuple[int, float]] = {}
+_failures_lock = threading.Lock()
+
+
+def record_prefetch_report(report: PrefetchReport) -> None:
+    """Back off from failed articles, and forget earlier failures that succeeded."""
+    now = time.monotonic()
+    with _failures_lock:
+        for article_id in report.fetched:
+            _failures.pop(article_id, None)
+        for article_id in report.failed:
+            attempts = _failures.get(article_id, (0, 0.0))[0] + 1
+            delay = min(PREFETCH_RETRY_BASE * 2 ** (attempts - 1), PREFETCH_RETRY_MAX)
+            _failures[article_id] = (attempts, now + delay)
+
+
+def _in_backoff(article_id: str, now: float) -> bool:
+    with _failures_lock:
+        failure = _failures.get(article_id)
+    return failure is not None and failure[1] > now
+
+
+def select_prefetch_candidates(count: int = PREFETCH_COUNT) -> list[dict[str, Any]]:
+    """
+    Next pending articles (in get_next_article() order) that have a source
+    URL, no cached file yet, and no recent failed prefetch.
+    """
+    now = time.monotonic()
+    candidates = []
+    for article in get_database().iter_pending_articles():
+        if len(candidates) >= count:
+            break
+        if get_cached_path(article["id"]) is None and not _in_backoff(article["id"], now):
+            candidates.append(article)
+    return candidates
+
+
+async def prefetch_articles(
+    articles: list[dict[str, Any]],
+    concurrency: int = PREFETCH_CONCURRENCY,
+    per_host: int = PREFETCH_PER_HOST,
+    extract: bool = True,
+) -> PrefetchReport:
+    """
+    Download (and optionally pre-extract) articles concurrently.
+
+    Args:
+        articles: Dicts with id and source_url
+        concurrency: Maximum downloads in flight overall
+        per_host: Maximum downloads in flight per URL host
+        extract: Also run extraction + chunking into the extraction store
+
+    Returns:
+        PrefetchReport listing fetched, extracted and failed article IDs
+    """
+    report = PrefetchReport()
+    overall = asyncio.Semaphore(concurrency)
+    hosts: dict[str, asyncio.Semaphore] = {}
+
+    async def prefetch_one(article: dict[str, Any]) -> None:
+        article_id = article["id"]
+        host = urlparse(article["source_url"]).netloc.lower()
+        host_limit = hosts.setdefault(host, asyncio.Semaphore(per_host))
+
+        async with host_limit, overall:
+            result = await asyncio.to_thread(fetch_and_cache, article_id, article["source_url"])
+        if not result.success:
+            report.failed[article_id] = result.error_code or "FETCH_FAILED"
+            return
+        report.fetched.append(article_id)
+
+        if extract:
+            stored, problems = await asyncio.to_thread(load_extraction, result.path)
+            if stored is None:
+                report.failed[article_id] = ",".join(problems)
+            else:
+                report.extracted.append(article_id)
+
+    outcomes = await asyncio.gather(
+        *(prefetch_one(article) for article in articles), return_exceptions=True
+    )
+    for article, outcome in zip(articles, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(f"Prefetch of {article['id']} failed: {outcome}")
+            report.failed[article["id"]] = "ERROR"
+
+    return report
+
+
+# --- Background runner ---
+
+_prefetch_thread: threading.Thread | None = None
+_prefetch_lock = threading.Lock()
+
+
+def start_background_prefetch(count: int = PREFETCH_COUNT) -> bool:
+    """
+    Prefetch the next `count` pending articles on a daemon thread.
+
+    Does nothing if a prefetch is already running or nothing needs fetching.
+    Returns True if a prefetch was started.
+    """
+    global _prefetch_thread
+    with _prefetch_lock:
+        if _prefetch_thread is not None and _prefetch_thread.is_alive():
+            return False
+
+        candidates = select_prefetch_candidates(count)
+        if not candidates:
+            return False
+
+        def run() -> None:
+            report = asyncio.run(prefetch_articles(candidates))
+            record_prefetch_report(report)
+            logger.info(
+                f"Prefetch done: fetched={report.fetched} "
+                f"extracted={report.extracted} failed={report.failed}"
+            )
+
+        _prefetch_thread = threading.Thread(target=run, name="article-prefetch", daemon=True)
+        _prefetch_thread.start()
+        return True
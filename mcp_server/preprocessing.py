@@ -31,12 +31,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-# Add scripts directory to path for imports
+# Add scripts directory to path for imports. parse_article_blocks (which pulls
+# in BeautifulSoup and the section-heading YAML) is imported inside the tools
+# that use it, so server startup does not pay for it.
 scripts_dir = Path(__file__).parent.parent / 'scripts'
 sys.path.insert(0, str(scripts_dir))
 
-from parse_article_blocks import parse_blocks, extract_text
-
+from .body_model import BodyModel, get_body_model, remember_body_model
+from .parsed_store import StaleDocumentError, get_parsed_store
 from .taxonomy import get_taxonomy
 from .utils import slugify
 
@@ -97,6 +99,18 @@ def step_progress(step_key: str, slug: str | None = None) -> dict[str, Any]:
     }
 
 
+def _stale_document_error(slug: str, error: StaleDocumentError, retry: str) -> dict[str, Any]:
+    """Response for a save refused because the file was edited outside the server."""
+    return {
+        "success": False,
+        "error": "STALE_DOCUMENT",
+        "slug": slug,
+        "details": str(error),
+        "action": f"The file was edited outside the server (e.g. in the admin site). "
+                  f"Call {retry} to review the current version, then confirm again."
+    }
+
+
 def find_pdf_by_query(query: str) -> dict[str, Any]:
     """
     Find a PDF in intake by partial name match.
@@ -256,6 +270,8 @@ def parse_datalab_file(filename: str) -> dict[str, Any]:
     """
     import shutil
 
+    from parse_article_blocks import parse_blocks
+
     # Validate filename
     json_path = CACHE_DIR / filename
 
@@ -328,8 +344,7 @@ def parse_datalab_file(filename: str) -> dict[str, Any]:
         logger.info(f"Renamed {filename} -> {slug}.json")
 
     # Save the parsed result
-    with open(final_parsed_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    get_parsed_store().write(final_parsed_path, result)
 
     # Update session
     session = get_session()
@@ -495,6 +510,8 @@ def parse_extracted_article(slug: str) -> dict[str, Any]:
     """
     Run mechanical parser on Datalab JSON, create _parsed.json.
     """
+    from parse_article_blocks import parse_blocks
+
     json_path = CACHE_DIR / f"{slug}.json"
 
     if not json_path.exists():
@@ -518,9 +535,7 @@ def parse_extracted_article(slug: str) -> dict[str, Any]:
         output['body_html_chars'] = len(body_html)
 
         # Save full result including body_html for later use
-        with open(parsed_path, 'w', encoding='utf-8') as f:
-            # Save everything including body_html
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        get_parsed_store().write(parsed_path, result)
 
         # Build summary for response
         summary = {
@@ -572,6 +587,8 @@ def get_article_for_review(slug: str) -> dict[str, Any]:
 
     NO SUGGESTIONS PROVIDED. Claude must derive all classifications from the content.
     """
+    from parse_article_blocks import extract_text
+
     parsed_path = CACHE_DIR / f"{slug}_parsed.json"
     json_path = CACHE_DIR / f"{slug}.json"
 
@@ -591,12 +608,10 @@ def get_article_for_review(slug: str) -> dict[str, Any]:
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     # Load raw blocks
-    with open(json_path, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
+    raw_data = get_parsed_store().load(json_path)
 
     # Build raw blocks from pages 0-1 (where metadata lives)
     raw_blocks = []
@@ -736,8 +751,7 @@ def complete_article_review(
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = get_parsed_store().load(parsed_path)
 
     # Validate all required fields
     taxonomy = get_taxonomy()
@@ -819,8 +833,10 @@ def complete_article_review(
         changes.append(f"notes: {notes[:50]}...")
 
     # Save updated JSON
-    with open(parsed_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    try:
+        get_parsed_store().save(parsed_path, data)
+    except StaleDocumentError as e:
+        return _stale_document_error(slug, e, f"get_article_for_review('{slug}')")
 
     # Build final state summary
     final_state = {
@@ -877,8 +893,7 @@ def get_body_for_review(slug: str, chunk: int = 0) -> dict[str, Any]:
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = get_parsed_store().load(parsed_path)
 
     # Check that article review is complete
     if not data.get('method') or not data.get('voice') or data.get('peer_reviewed') is None:
@@ -898,8 +913,8 @@ def get_body_for_review(slug: str, chunk: int = 0) -> dict[str, Any]:
             "action": "Check the parser output — body may not have been extracted."
         }
 
-    # Use shared helper to detect issues
-    paragraphs = detect_body_issues(body_html)
+    # Parsed once per body version; each chunk is a slice of the same model
+    paragraphs = get_body_model(slug, body_html).paragraphs()
 
     # Chunk the paragraphs (10 per chunk)
     CHUNK_SIZE = 10
@@ -978,13 +993,13 @@ def complete_body_review(
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = get_parsed_store().load(parsed_path)
 
     body_html = data.get('body_html', '')
 
-    # Re-scan body to find all flagged issues
-    paragraphs = detect_body_issues(body_html)
+    # Re-check flagged issues against the cached model
+    model = get_body_model(slug, body_html)
+    paragraphs = model.paragraphs()
     flagged_indices = {p['index'] for p in paragraphs if p['issues']}
 
     # Check that every flagged issue is addressed
@@ -1025,53 +1040,12 @@ def complete_body_review(
             "action": "Either set body_approved=True or provide fixes list."
         }
 
-    # Apply fixes if provided
+    # Apply fixes if provided (only the paragraphs they touch are re-rendered)
     if fixes:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(body_html, 'html.parser')
-
-        # Get all paragraph elements
-        elements = [e for e in soup.children if e.name in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'table', 'ul', 'ol']]
-
-        # Sort fixes by index descending (so deletions don't shift indices)
-        sorted_fixes = sorted(fixes, key=lambda f: f['index'], reverse=True)
-
-        changes_made = []
-        for fix in sorted_fixes:
-            idx = fix['index']
-            action = fix['action']
-
-            if idx >= len(elements):
-                changes_made.append(f"SKIPPED: index {idx} out of range")
-                continue
-
-            if action == 'delete':
-                elements[idx].decompose()
-                changes_made.append(f"Deleted paragraph {idx}")
-
-            elif action == 'join_previous' and idx > 0:
-                # Append text of current to previous
-                current_text = elements[idx].get_text(strip=True)
-                prev_text = elements[idx - 1].get_text(strip=True)
-                elements[idx - 1].string = prev_text + ' ' + current_text
-                elements[idx].decompose()
-                changes_made.append(f"Joined paragraph {idx} to {idx - 1}")
-
-            elif action == 'join_next' and idx < len(elements) - 1:
-                # Append text of next to current
-                current_text = elements[idx].get_text(strip=True)
-                next_text = elements[idx + 1].get_text(strip=True)
-                elements[idx].string = current_text + ' ' + next_text
-                elements[idx + 1].decompose()
-                changes_made.append(f"Joined paragraph {idx + 1} to {idx}")
-
-            elif action == 'replace':
-                new_text = fix.get('text', '')
-                elements[idx].string = new_text
-                changes_made.append(f"Replaced paragraph {idx}")
+        model, changes_made = model.apply_fixes(fixes)
 
         # Rebuild body_html
-        data['body_html'] = str(soup)
+        data['body_html'] = model.body_html
         data['body_fixes_applied'] = changes_made
     else:
         changes_made = []
@@ -1090,9 +1064,10 @@ def complete_body_review(
 
     # 1. Move parsed JSON
     ready_parsed_path = READY_DIR / f"{slug}_parsed.json"
-    with open(ready_parsed_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    parsed_path.unlink()
+    try:
+        get_parsed_store().move(parsed_path, ready_parsed_path, data)
+    except StaleDocumentError as e:
+        return _stale_document_error(slug, e, f"get_body_for_review('{slug}')")
 
     # 2. Move raw JSON
     raw_json_path = CACHE_DIR / f"{slug}.json"
@@ -1205,53 +1180,11 @@ def detect_body_issues(body_html: str) -> list[dict]:
     - complete_body_review() to verify Claude addressed all issues
 
     Returns list of dicts with: index, tag, text, full_length, issues
-    """
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(body_html, 'html.parser')
-
-    paragraphs = []
-    for i, element in enumerate(soup.children):
-        if element.name in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'table', 'ul', 'ol']:
-            text = element.get_text(strip=True)
-            if not text:
-                continue
-
-            # Flag potential issues — BE SPECIFIC
-            issues = []
-
-            # 1. ORPHAN: starts with lowercase — likely split from previous paragraph
-            if text and text[0].islower() and len(text) > 20:
-                issues.append("ORPHAN: Starts lowercase — likely split from previous. Action: join_previous")
-
-            # 2. INCOMPLETE: doesn't end with sentence punctuation
-            if text and text[-1] not in '.!?:;)' and len(text) > 50 and element.name == 'p':
-                issues.append("INCOMPLETE: No ending punctuation — check if continues in next. Action: join_next?")
-
-            # 3. CAPTION: looks like a figure/table caption
-            if re.match(r'^(Figure|Fig\.?|Table|Tableau)\s*\d', text, re.IGNORECASE):
-                issues.append("CAPTION: Looks like figure/table caption — should not be in body. Action: delete")
 
-            # 4. PAGE_ARTIFACT: page numbers, headers, footers
-            if re.match(r'^\d+$', text) or len(text) < 10 and re.match(r'^Page\s*\d+', text, re.IGNORECASE):
-                issues.append("PAGE_ARTIFACT: Looks like page number/header. Action: delete")
-
-            # 5. SHORT_FRAGMENT: very short text that may be cruft
-            if element.name == 'p' and len(text) < 25 and not text.endswith(':'):
-                issues.append("SHORT_FRAGMENT: Very short — cruft or orphan piece? Action: delete or join")
-
-            # 6. REFERENCE_LEAK: reference that leaked into body
-            if re.match(r'^\d+\.\s*[A-Z]', text) and 'et al' in text.lower():
-                issues.append("REFERENCE_LEAK: Looks like a reference. Action: delete")
-
-            paragraphs.append({
-                'index': i,
-                'tag': element.name,
-                'text': text[:300] + '...' if len(text) > 300 else text,
-                'full_length': len(text),
-                'issues': issues
-            })
-
-    return paragraphs
+    Tools that know the slug use get_body_model() instead, which reuses the
+    parsed model until body_html changes.
+    """
+    return BodyModel(body_html).paragraphs()
 
 
 # slugify is now imported from utils.py
@@ -1319,6 +1252,8 @@ def step4_check_fields(slug: str) -> dict[str, Any]:
         - raw_html_hint: First 2 pages of raw HTML for extraction
         - next_step: Call step4_confirm_fields() with your findings
     """
+    from parse_article_blocks import extract_text
+
     parsed_path = CACHE_DIR / f"{slug}_parsed.json"
     json_path = CACHE_DIR / f"{slug}.json"
 
@@ -1331,8 +1266,7 @@ def step4_check_fields(slug: str) -> dict[str, Any]:
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     # Check required fields
     fields_to_check = ['title', 'authors', 'citation', 'abstract', 'year']
@@ -1359,8 +1293,7 @@ def step4_check_fields(slug: str) -> dict[str, Any]:
     # Load raw blocks for reference (first 2 pages)
     raw_hint = []
     if json_path.exists():
-        with open(json_path, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
+        raw_data = get_parsed_store().load(json_path)
         blocks = normalize_datalab_json(raw_data)
         for block in blocks[:20]:  # First 20 blocks usually cover pages 0-1
             if block.get('page', 0) > 1:
@@ -1448,8 +1381,7 @@ def step4_confirm_fields(
             }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     changes = []
 
@@ -1475,8 +1407,10 @@ def step4_confirm_fields(
         changes.append(f"abstract: {len(abstract)} chars")
 
     # Save updates
-    with open(parsed_path, 'w', encoding='utf-8') as f:
-        json.dump(parsed, f, ensure_ascii=False, indent=2)
+    try:
+        get_parsed_store().save(parsed_path, parsed)
+    except StaleDocumentError as e:
+        return _stale_document_error(slug, e, f"step4_check_fields('{slug}')")
 
     # Mark check complete (state already loaded above)
     state['fields'] = True
@@ -1529,14 +1463,13 @@ def step4_check_warnings(slug: str) -> dict[str, Any]:
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     warnings = parsed.get('warnings', [])
 
     # Also scan body for orphan-like patterns
     body_html = parsed.get('body_html', '')
-    body_issues = detect_body_issues(body_html)
+    body_issues = get_body_model(slug, body_html).paragraphs()
     orphan_issues = [p for p in body_issues if any('ORPHAN' in issue for issue in p.get('issues', []))]
 
     # Mark that this check was called (required before confirm can be called)
@@ -1604,51 +1537,26 @@ def step4_confirm_warnings(
         }
 
     # Load and apply fixes
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     changes = []
 
     if orphan_fixes:
-        from bs4 import BeautifulSoup
-        body_html = parsed.get('body_html', '')
-        soup = BeautifulSoup(body_html, 'html.parser')
+        model, joins = get_body_model(slug, parsed.get('body_html', '')).join_orphans(orphan_fixes)
+        remember_body_model(slug, model)
+        changes.extend(joins)
 
-        elements = list(soup.children)
-        elements = [e for e in elements if hasattr(e, 'name') and e.name]
-
-        # Sort by index descending to avoid index shifting
-        sorted_fixes = sorted(orphan_fixes, key=lambda f: f.get('index', 0), reverse=True)
-
-        for fix in sorted_fixes:
-            idx = fix.get('index', -1)
-            action = fix.get('action', '')
-
-            if idx < 0 or idx >= len(elements):
-                continue
-
-            if action == 'join_previous' and idx > 0:
-                current_el = elements[idx]
-                prev_el = elements[idx - 1]
-
-                # Preserve HTML formatting: append children instead of replacing with text
-                # Add a space text node, then move all children from current to previous
-                from bs4 import NavigableString
-                prev_el.append(NavigableString(' '))
-                for child in list(current_el.children):
-                    prev_el.append(child.extract())
-                current_el.decompose()
-                changes.append(f"Joined paragraph {idx} to {idx - 1}")
-
-        parsed['body_html'] = str(soup)
+        parsed['body_html'] = model.body_html
 
     if notes:
         parsed['warning_review_notes'] = notes
         changes.append(f"Notes: {notes[:50]}...")
 
     # Save updates
-    with open(parsed_path, 'w', encoding='utf-8') as f:
-        json.dump(parsed, f, ensure_ascii=False, indent=2)
+    try:
+        get_parsed_store().save(parsed_path, parsed)
+    except StaleDocumentError as e:
+        return _stale_document_error(slug, e, f"step4_check_warnings('{slug}')")
 
     # Mark check complete
     state['warnings'] = True
@@ -1678,6 +1586,8 @@ def step4_check_references(slug: str) -> dict[str, Any]:
     Args:
         slug: The article slug
     """
+    from parse_article_blocks import extract_text
+
     parsed_path = CACHE_DIR / f"{slug}_parsed.json"
     json_path = CACHE_DIR / f"{slug}.json"
 
@@ -1699,16 +1609,14 @@ def step4_check_references(slug: str) -> dict[str, Any]:
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     references = parsed.get('references', [])
 
     # Try to find reference section in raw HTML if references are empty
     raw_reference_hint = None
     if not references and json_path.exists():
-        with open(json_path, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
+        raw_data = get_parsed_store().load(json_path)
 
         blocks = raw_data.get('blocks', [])
         in_refs = False
@@ -1799,8 +1707,7 @@ def step4_confirm_references(
         }
 
     # Load and update
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     changes = []
 
@@ -1813,8 +1720,10 @@ def step4_confirm_references(
         parsed['references_review_notes'] = notes
 
     # Save
-    with open(parsed_path, 'w', encoding='utf-8') as f:
-        json.dump(parsed, f, ensure_ascii=False, indent=2)
+    try:
+        get_parsed_store().save(parsed_path, parsed)
+    except StaleDocumentError as e:
+        return _stale_document_error(slug, e, f"step4_check_references('{slug}')")
 
     # Mark complete
     state['references'] = True
@@ -1867,8 +1776,7 @@ def step4_check_formulas(slug: str) -> dict[str, Any]:
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     body_html = parsed.get('body_html', '')
 
@@ -1887,21 +1795,15 @@ def step4_check_formulas(slug: str) -> dict[str, Any]:
 
     combined_pattern = '|'.join(f'({p})' for p in stat_patterns)
 
-    # Parse HTML and find unwrapped formulas
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(body_html, 'html.parser')
-
+    # Find unwrapped formulas in the cached paragraph model
     paragraphs_with_formulas = []
 
-    for i, element in enumerate(soup.children):
-        if not hasattr(element, 'name') or element.name not in ['p', 'td', 'li']:
+    for node in get_body_model(slug, body_html).nodes:
+        if node.tag not in ['p', 'td', 'li']:
             continue
 
         # Get text NOT inside formula spans
-        text = element.get_text()
-
-        # Check if there are formula spans already
-        existing_formulas = element.find_all('span', class_='formula')
+        text = node.raw_text
 
         # Find matches in text
         matches = re.findall(combined_pattern, text)
@@ -1920,8 +1822,8 @@ def step4_check_formulas(slug: str) -> dict[str, Any]:
             for match in flat_matches:
                 # See if this match is inside an existing formula span
                 is_wrapped = False
-                for span in existing_formulas:
-                    if match in span.get_text():
+                for formula in node.formulas:
+                    if match in formula:
                         is_wrapped = True
                         break
                 if not is_wrapped:
@@ -1929,7 +1831,7 @@ def step4_check_formulas(slug: str) -> dict[str, Any]:
 
             if unwrapped:
                 paragraphs_with_formulas.append({
-                    'index': i,
+                    'index': node.position,
                     'text_preview': text[:200] + '...' if len(text) > 200 else text,
                     'unwrapped_formulas': unwrapped[:5],  # First 5
                     'total_unwrapped': len(unwrapped)
@@ -1999,8 +1901,7 @@ def step4_confirm_formulas(
         }
 
     # Load and update
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     changes = []
 
@@ -2021,8 +1922,10 @@ def step4_confirm_formulas(
         parsed['formula_review_notes'] = notes
 
     # Save
-    with open(parsed_path, 'w', encoding='utf-8') as f:
-        json.dump(parsed, f, ensure_ascii=False, indent=2)
+    try:
+        get_parsed_store().save(parsed_path, parsed)
+    except StaleDocumentError as e:
+        return _stale_document_error(slug, e, f"step4_check_formulas('{slug}')")
 
     # Mark complete
     state['formulas'] = True
@@ -2079,8 +1982,7 @@ def step4_complete(slug: str) -> dict[str, Any]:
         }
 
     # Load parsed data
-    with open(parsed_path, 'r', encoding='utf-8') as f:
-        parsed = json.load(f)
+    parsed = get_parsed_store().load(parsed_path)
 
     # Mark step 4 as complete
     parsed['step4_complete'] = True
@@ -2094,9 +1996,10 @@ def step4_complete(slug: str) -> dict[str, Any]:
 
     # 1. Move parsed JSON
     ready_parsed_path = READY_DIR / f"{slug}_parsed.json"
-    with open(ready_parsed_path, 'w', encoding='utf-8') as f:
-        json.dump(parsed, f, ensure_ascii=False, indent=2)
-    parsed_path.unlink()
+    try:
+        get_parsed_store().move(parsed_path, ready_parsed_path, parsed)
+    except StaleDocumentError as e:
+        return _stale_document_error(slug, e, f"step4_check_fields('{slug}')")
 
     # 2. Move raw JSON
     json_path = CACHE_DIR / f"{slug}.json"
@@ -22,8 +22,15 @@ Empirically validated on known-good translations:
 - Drifted translations: ~0.23 recall
 - Threshold 0.7 correctly separates good from drifted
 
-spaCy models are loaded ONCE at module import (per D18), not per-request.
-This takes ~2-3 seconds on first import but is reused for all subsequent calls.
+spaCy models are loaded ONCE (per D18), not per-request, through the shared
+registry in nlp_models, which hands out pipelines pruned to each task.
+
+Each text is parsed ONCE per run for its sentence boundaries:
+run_quality_checks builds a TextAnalysis for the source and the translation
+and hands it to the sentence check. The recall check parses the translation
+once more, lowercased, because glossary terms are lemmatized lowercased too.
+Glossary-term lemmas are precomputed in bulk by the Glossary (see
+Glossary.get_term_lemmas).
 """
 
 from __future__ import annotations
@@ -32,54 +39,10 @@ import logging
 import re
 from dataclasses import dataclass
 
-logger = logging.getLogger(__name__)
-
-
-# --- spaCy Model Loading (per D18) ---
-# Models loaded once at module import for consistent behavior.
+from .glossary import get_glossary
+from .nlp_models import TASK_ANALYSIS, TASK_LEMMAS, TASK_SENTENCES, get_pipeline
 
-_nlp_en = None
-_nlp_fr = None
-
-
-def _get_nlp_en():
-    """Get English spaCy model, loading it if necessary."""
-    global _nlp_en
-    if _nlp_en is None:
-        try:
-            import spacy
-            _nlp_en = spacy.load("en_core_web_sm")
-            logger.info("Loaded spaCy model: en_core_web_sm")
-        except OSError as e:
-            logger.error(
-                f"spaCy model 'en_core_web_sm' not found. "
-                f"Run: python -m spacy download en_core_web_sm"
-            )
-            raise RuntimeError(
-                "spaCy model 'en_core_web_sm' not found. "
-                "Run: python -m spacy download en_core_web_sm"
-            ) from e
-    return _nlp_en
-
-
-def _get_nlp_fr():
-    """Get French spaCy model, loading it if necessary."""
-    global _nlp_fr
-    if _nlp_fr is None:
-        try:
-            import spacy
-            _nlp_fr = spacy.load("fr_core_news_sm")
-            logger.info("Loaded spaCy model: fr_core_news_sm")
-        except OSError as e:
-            logger.error(
-                f"spaCy model 'fr_core_news_sm' not found. "
-                f"Run: python -m spacy download fr_core_news_sm"
-            )
-            raise RuntimeError(
-                "spaCy model 'fr_core_news_sm' not found. "
-                "Run: python -m spacy download fr_core_news_sm"
-            ) from e
-    return _nlp_fr
+logger = logging.getLogger(__name__)
 
 
 # --- Result Types ---
@@ -159,6 +122,48 @@ class QualityCheckResults:
         return len(self.blocking_flags) > 0
 
 
+# --- Text Analysis (single spaCy pass) ---
+
+# POS tags kept as "content words" for the recall check
+CONTENT_POS = frozenset({"NOUN", "VERB", "ADJ"})
+
+
+@dataclass(frozen=True)
+class TextAnalysis:
+    """
+    Result of one spaCy pass over a text, in its original case.
+
+    Shared by the checks that need the full parse (sentence boundaries) so
+    the pipeline never runs twice on the same text for them.
+    """
+    sentence_count: int
+
+
+def _content_words(doc) -> set[str]:
+    """Lowercased lemmas of content-word tokens in a parsed doc."""
+    return {
+        lemma
+        for lemma, pos in ((token.lemma_.lower(), token.pos_) for token in doc)
+        if pos in CONTENT_POS and len(lemma) > 2
+    }
+
+
+def _analyze(nlp, text: str) -> TextAnalysis:
+    """Run the pipeline once and keep only what the checks use."""
+    doc = nlp(text)
+    return TextAnalysis(sentence_count=sum(1 for _ in doc.sents))
+
+
+def analyze_en(text: str) -> TextAnalysis:
+    """Analyze English text with a single spaCy pass."""
+    return _analyze(get_pipeline("en", TASK_ANALYSIS), text)
+
+
+def analyze_fr(text: str) -> TextAnalysis:
+    """Analyze French text with a single spaCy pass."""
+    return _analyze(get_pipeline("fr", TASK_ANALYSIS), text)
+
+
 # --- Sentence Counting ---
 
 def count_sentences_en(text: str) -> int:
@@ -170,9 +175,8 @@ def count_sentences_en(text: str) -> int:
     - "p < 0.05 was significant." → 1 sentence (regex: 2)
     - "The U.S.A. is..." → 1 sentence (regex: 4)
     """
-    nlp = _get_nlp_en()
-    doc = nlp(text)
-    return len(list(doc.sents))
+    doc = get_pipeline("en", TASK_SENTENCES)(text)
+    return sum(1 for _ in doc.sents)
 
 
 def count_sentences_fr(text: str) -> int:
@@ -184,12 +188,16 @@ def count_sentences_fr(text: str) -> int:
     - "etc." → handled correctly
     - "p. ex." → handled correctly
     """
-    nlp = _get_nlp_fr()
-    doc = nlp(text)
-    return len(list(doc.sents))
+    doc = get_pipeline("fr", TASK_SENTENCES)(text)
+    return sum(1 for _ in doc.sents)
 
 
-def compare_sentence_counts(source_en: str, target_fr: str) -> SentenceCountResult:
+def compare_sentence_counts(
+    source_en: str,
+    target_fr: str,
+    source_analysis: TextAnalysis | None = None,
+    target_analysis: TextAnalysis | None = None,
+) -> SentenceCountResult:
     """
     Compare sentence counts between source (EN) and target (FR).
 
@@ -198,12 +206,19 @@ def compare_sentence_counts(source_en: str, target_fr: str) -> SentenceCountResu
     Args:
         source_en: English source text
         target_fr: French translation
+        source_analysis: Precomputed analysis of source_en (skips a parse)
+        target_analysis: Precomputed analysis of target_fr (skips a parse)
 
     Returns:
         SentenceCountResult with counts, ratio, and optional flag
     """
-    source_count = count_sentences_en(source_en)
-    target_count = count_sentences_fr(target_fr)
+    if source_analysis is None:
+        source_analysis = analyze_en(source_en)
+    if target_analysis is None:
+        target_analysis = analyze_fr(target_fr)
+
+    source_count = source_analysis.sentence_count
+    target_count = target_analysis.sentence_count
 
     # Avoid division by zero
     ratio = target_count / max(source_count, 1)
@@ -269,38 +284,36 @@ def extract_content_words_en(text: str) -> set[str]:
 
     Uses spaCy for accurate lemmatization.
     """
-    nlp = _get_nlp_en()
-    doc = nlp(text.lower())
-
-    content_pos = {"NOUN", "VERB", "ADJ"}
-    return {
-        token.lemma_
-        for token in doc
-        if token.pos_ in content_pos and len(token.lemma_) > 2
-    }
+    return _content_words(get_pipeline("en", TASK_LEMMAS)(text.lower()))
 
 
 def extract_content_words_fr(text: str) -> set[str]:
     """
     Extract lemmatized content words (nouns, verbs, adjectives) from French text.
 
-    Uses spaCy for accurate lemmatization.
+    Uses spaCy for accurate lemmatization. The text is lowercased first, the
+    same way lemmatize_terms_fr treats glossary terms: a capitalized
+    sentence-initial noun can be tagged PROPN and would never match.
     """
-    nlp = _get_nlp_fr()
-    doc = nlp(text.lower())
+    return _content_words(get_pipeline("fr", TASK_LEMMAS)(text.lower()))
 
-    content_pos = {"NOUN", "VERB", "ADJ"}
-    return {
-        token.lemma_
-        for token in doc
-        if token.pos_ in content_pos and len(token.lemma_) > 2
-    }
+
+def lemmatize_terms_fr(terms: list[str], batch_size: int = 256) -> list[frozenset[str]]:
+    """
+    Lemmatize French glossary terms in one batched pass.
+
+    Returns one set of content-word lemmas per term, in input order.
+    Terms are lowercased first, as short terms tag more reliably that way.
+    """
+    nlp = get_pipeline("fr", TASK_LEMMAS)
+    docs = nlp.pipe((term.lower() for term in terms), batch_size=batch_size)
+    return [frozenset(_content_words(doc)) for doc in docs]
 
 
 def check_glossary_recall(
     source_en: str,
     translation_fr: str,
-    glossary: dict | None = None
+    glossary: dict | None = None,
 ) -> GlossaryRecallResult:
     """
     Check that expected glossary terms appear in the translation.
@@ -328,16 +341,11 @@ def check_glossary_recall(
     # Use glossary terms if provided and sufficient
     if glossary and len(glossary) >= 3:
         expected_fr_words = set()
-        nlp_fr = _get_nlp_fr()
+        term_glossary = get_glossary()
 
         for fr_term in glossary.values():
             if isinstance(fr_term, str) and fr_term:
-                doc = nlp_fr(fr_term.lower())
-                expected_fr_words.update(
-                    token.lemma_
-                    for token in doc
-                    if token.pos_ in ("NOUN", "VERB", "ADJ") and len(token.lemma_) > 2
-                )
+                expected_fr_words.update(term_glossary.get_term_lemmas(fr_term))
 
         if len(expected_fr_words) >= 3:
             # Extract actual content words from translation
@@ -450,11 +458,16 @@ def run_quality_checks(
     Returns:
         QualityCheckResults with all check results
     """
-    sentence_check = compare_sentence_counts(source_en, translation_fr)
-    word_ratio_check = calculate_word_ratio(source_en, translation_fr)
-    recall_check = check_glossary_recall(
-        source_en, translation_fr, glossary_terms
+    # Parse each text once for sentence boundaries; the recall check does its
+    # own lowercased parse so translation and glossary lemmas match in case
+    source_analysis = analyze_en(source_en)
+    target_analysis = analyze_fr(translation_fr)
+
+    sentence_check = compare_sentence_counts(
+        source_en, translation_fr, source_analysis, target_analysis
     )
+    word_ratio_check = calculate_word_ratio(source_en, translation_fr)
+    recall_check = check_glossary_recall(source_en, translation_fr, glossary_terms)
     statistics_check = check_statistics_preserved(source_en, translation_fr)
 
     return QualityCheckResults(
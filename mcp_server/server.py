@@ -5,6 +5,9 @@ This server provides tools for the translation pipeline:
 - get_next_article() — get next article to translate
 - get_progress() — get translation progress statistics
 - get_chunk() — get a chunk of article text for translation (Phase 2)
+- get_cache_stats() — chunk cache diagnostics (hits, misses, evictions)
+- get_warmup_status() — background model warm-up progress
+- get_server_metrics() — per-tool latency percentiles (p50/p95/p99)
 - validate_classification() — validate article classification (Phase 4)
 - save_article() — save translated article (Phase 4)
 - skip_article() — skip an article with reason
@@ -15,6 +18,7 @@ This server provides tools for the translation pipeline:
 
 Usage:
     python -m mcp_server.server
+    python -m mcp_server.server --profile-startup   # import time per module, then exit
 
 Or run via the entry point:
     pda-mcp
@@ -23,6 +27,8 @@ Or run via the entry point:
 import functools
 import json
 import logging
+import sys
+import time
 from pathlib import Path
 from typing import Any, Callable
 
@@ -32,6 +38,10 @@ from .database import get_database
 from .taxonomy import get_taxonomy
 from . import tools
 from . import preprocessing
+from . import hot_reload
+from . import prefetch
+from . import tracing
+from . import warmup
 
 
 # --- Logging Configuration ---
@@ -59,29 +69,42 @@ def log_tool_call(func: Callable) -> Callable:
 
     If a conversation dies mid-session, the log will show the last TOOL_START
     without a corresponding TOOL_END — that's our culprit.
+
+    Each call is also recorded as a JSONL span with its duration (see
+    tracing.py). Argument and result previews are bounded and rendered only
+    when a record is written.
     """
+    tracer = tracing.get_tracer()
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         tool_name = func.__name__
-
-        # Log entry with args (truncate large values)
-        args_repr = repr(args)[:200] + "..." if len(repr(args)) > 200 else repr(args)
-        kwargs_repr = repr(kwargs)[:200] + "..." if len(repr(kwargs)) > 200 else repr(kwargs)
-        logger.info(f"TOOL_START: {tool_name} args={args_repr} kwargs={kwargs_repr}")
+        logger.info(
+            "TOOL_START: %s args=%s kwargs=%s",
+            tool_name, tracing.LazyPreview(args), tracing.LazyPreview(kwargs),
+        )
+        started_at = time.time()
+        start = time.perf_counter()
 
         try:
             result = func(*args, **kwargs)
-
-            # Truncate result for logging if large
-            result_str = str(result)
-            result_preview = result_str[:500] + "..." if len(result_str) > 500 else result_str
-            logger.info(f"TOOL_END: {tool_name} success=True result_preview={result_preview}")
-
-            return result
         except Exception as e:
-            logger.exception(f"TOOL_END: {tool_name} success=False error={e}")
+            elapsed = time.perf_counter() - start
+            tracer.record(tool_name, started_at, elapsed, args, kwargs, error=e)
+            logger.exception(
+                "TOOL_END: %s success=False duration_ms=%.1f error=%s",
+                tool_name, elapsed * 1000, e,
+            )
             raise
 
+        elapsed = time.perf_counter() - start
+        tracer.record(tool_name, started_at, elapsed, args, kwargs, result=result)
+        logger.info(
+            "TOOL_END: %s success=True duration_ms=%.1f result_preview=%s",
+            tool_name, elapsed * 1000, tracing.LazyPreview(result, 500),
+        )
+        return result
+
     return wrapper
 
 
@@ -109,7 +132,16 @@ def get_next_article() -> dict[str, Any]:
 
     Or returns SESSION_PAUSE / COMPLETE status if applicable.
     """
-    return tools.get_next_article()
+    result = tools.get_next_article()
+
+    # Warm caches for the articles after this one while it is translated
+    if "article" in result:
+        try:
+            prefetch.start_background_prefetch()
+        except Exception:
+            logger.exception("Could not start article prefetch")
+
+    return result
 
 
 # --- Tool: get_progress ---
@@ -192,6 +224,61 @@ def get_chunk(article_id: str, chunk_number: int) -> dict[str, Any]:
     return tools.get_chunk(article_id, chunk_number)
 
 
+# --- Tool: get_cache_stats (diagnostics) ---
+
+@mcp.tool()
+@log_tool_call
+def get_cache_stats() -> dict[str, Any]:
+    """
+    Report chunk cache and extraction store usage.
+
+    Diagnostic tool for sizing the cache during long batch sessions.
+
+    Response contains:
+    - chunk_cache: entries, bytes, max_bytes, hits, misses, hit_rate, evictions, expirations
+    - extraction_store: bytes and max_bytes of the on-disk extraction store
+    """
+    return tools.get_cache_stats()
+
+
+# --- Tool: get_warmup_status (diagnostics) ---
+
+@mcp.tool()
+@log_tool_call
+def get_warmup_status() -> dict[str, Any]:
+    """
+    Report progress of the background spaCy/glossary warm-up.
+
+    The server loads the EN and FR pipelines and the glossary matcher in the
+    background at startup. Tools that need a model before it is ready wait
+    for it; nothing is loaded twice.
+
+    Response contains:
+    - state: not_started | running | ready | failed
+    - steps: per pipeline (e.g. "fr/analysis") and glossary — status, seconds, error
+    - models: load time, memory and throughput of each loaded pipeline
+    """
+    return warmup.get_warmup_status()
+
+
+# --- Tool: get_server_metrics (diagnostics) ---
+
+@mcp.tool()
+@log_tool_call
+def get_server_metrics() -> dict[str, Any]:
+    """
+    Report per-tool latency since the server started.
+
+    Diagnostic tool for finding slow tools in batch runs. Percentiles cover
+    each tool's most recent calls; full spans are in logs/trace.jsonl.
+
+    Response contains:
+    - uptime_seconds, window (calls per tool used for percentiles)
+    - tools: {tool_name: {count, errors, p50_ms, p95_ms, p99_ms, max_ms, mean_ms}}
+    """
+    return tracing.get_server_metrics()
+
+
 # --- Tool: set_human_review_interval ---
 
 @mcp.tool()
@@ -1011,6 +1098,11 @@ def start_preprocessing(
 
 def main():
     """Run the MCP server."""
+    if "--profile-startup" in sys.argv[1:]:
+        from . import startup_profile
+        startup_profile.main([])
+        return
+
     logger.info("Starting PDA Translation Machine MCP Server...")
 
     # Initialize on startup
@@ -1018,6 +1110,12 @@ def main():
     db.cleanup_expired_tokens()
     logger.info(f"Database at {db._path}")
 
+    # Drop expired chunk cache entries for articles that are never reopened
+    tools._chunk_cache.start_sweeper()
+
+    # Pick up glossary.yaml / taxonomy.yaml edits without a restart
+    hot_reload.start_hot_reload()
+
     # Log taxonomy status
     taxonomy = get_taxonomy()
     logger.info(
@@ -1032,6 +1130,9 @@ def main():
         f"{progress['pending']} pending, {progress['skipped']} skipped"
     )
 
+    # Load spaCy pipelines and the glossary while the transport comes up
+    warmup.start_warmup()
+
     # Run the server
     mcp.run()
 
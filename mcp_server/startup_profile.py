@@ -0,0 +1,98 @@
+"""
+Startup import profile for the MCP server.
+
+Claude Desktop restarts the server on every config change, so import time is
+paid often. This runs a fresh interpreter with `-X importtime`, imports the
+server module, and reports where the time went: the slowest modules by their
+own import cost, and each mcp_server module with everything it pulled in.
+
+Usage:
+    python -m mcp_server.server --profile-startup
+    python -m mcp_server.startup_profile [--module mcp_server.tools] [--top 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# import time: self [us] | cumulative | imported package
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+@dataclass
+class ImportTiming:
+    """Import cost of one module, in microseconds."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # Nesting level in the import tree (0 = imported directly)
+
+
+def profile_imports(module: str = "mcp_server.server") -> list[ImportTiming]:
+    """
+    Import module in a fresh interpreter and collect per-module import times.
+
+    Raises:
+        RuntimeError: The module failed to import
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()[-2000:]}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            timings.append(ImportTiming(
+                module=name,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(indent) - 1) // 2,
+            ))
+    return timings
+
+
+def format_profile(timings: list[ImportTiming], module: str, top: int = 15) -> str:
+    """Render the profile as a plain-text report."""
+    total = next((t.cumulative_us for t in reversed(timings) if t.module == module), 0)
+    lines = [f"Import of {module}: {total / 1000:.1f} ms", ""]
+
+    lines.append(f"Slowest {top} modules (self time):")
+    for t in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        lines.append(f"  {t.self_us / 1000:8.1f} ms  {t.module}")
+
+    lines.append("")
+    lines.append("Project modules (including their imports):")
+    own = [t for t in timings if t.module.split(".")[0] in ("mcp_server", "parse_article_blocks")]
+    for t in sorted(own, key=lambda t: t.cumulative_us, reverse=True):
+        lines.append(f"  {t.cumulative_us / 1000:8.1f} ms  {t.module}")
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Report MCP server import time per module")
+    parser.add_argument("--module", default="mcp_server.server", help="Module to import")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to list")
+    args = parser.parse_args(argv)
+
+    try:
+        timings = profile_imports(args.module)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    # stderr: stdout is the MCP transport when run via the server
+    print(format_profile(timings, args.module, args.top), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
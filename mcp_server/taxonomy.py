@@ -7,21 +7,39 @@ This module provides:
 - Valid category IDs
 - Valid flag codes
 - French/English labels for all terms
+
+Lookup tables (valid values, flag code -> severity/description/category)
+are built once per load, so validation in save_article() never walks the
+YAML tree. reload_taxonomy() swaps in a freshly loaded instance.
 """
 
 from __future__ import annotations
 
+import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 TAXONOMY_PATH = PROJECT_ROOT / "data" / "taxonomy.yaml"
 
 
+@dataclass(frozen=True)
+class FlagInfo:
+    """A processing flag as defined in taxonomy.yaml."""
+    code: str
+    category: str             # content, access, classification, relevance, automated
+    severity: Optional[str]   # blocking / warning for automated flags, else None
+    description: str
+
+
 class Taxonomy:
     """
     Loads and provides access to taxonomy.yaml data.
@@ -32,6 +50,16 @@ class Taxonomy:
     def __init__(self, taxonomy_path: Path = TAXONOMY_PATH):
         self._path = taxonomy_path
         self._data: dict[str, Any] = {}
+        self._methods: tuple[str, ...] = ()
+        self._voices: tuple[str, ...] = ()
+        self._categories: tuple[str, ...] = ()
+        self._method_set: frozenset[str] = frozenset()
+        self._voice_set: frozenset[str] = frozenset()
+        self._category_set: frozenset[str] = frozenset()
+        self._flags: Mapping[str, FlagInfo] = MappingProxyType({})
+        self._flag_codes: frozenset[str] = frozenset()
+        self._blocking_flags: frozenset[str] = frozenset()
+        self._warning_flags: frozenset[str] = frozenset()
         self._load()
 
     def _load(self) -> None:
@@ -42,6 +70,44 @@ class Taxonomy:
         with open(self._path, "r", encoding="utf-8") as f:
             self._data = yaml.safe_load(f)
 
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Build the frozen lookup tables from the loaded YAML."""
+        self._methods = tuple(self._data.get("method", {}).keys())
+        self._voices = tuple(self._data.get("voice", {}).keys())
+        self._categories = tuple(self._data.get("categories", {}).keys())
+        self._method_set = frozenset(self._methods)
+        self._voice_set = frozenset(self._voices)
+        self._category_set = frozenset(self._categories)
+
+        flags: dict[str, FlagInfo] = {}
+        for category_key, category_data in self._data.get("processing_flags", {}).items():
+            if category_key == "automated":
+                # automated has nested blocking/warning
+                groups = [
+                    (severity, category_data.get(severity, {}))
+                    for severity in ("blocking", "warning")
+                ]
+            else:
+                # content, access, classification, relevance
+                groups = [(None, category_data)]
+
+            for severity, entries in groups:
+                for code, entry in entries.items():
+                    code = str(code)
+                    flags.setdefault(code, FlagInfo(
+                        code=code,
+                        category=category_key,
+                        severity=severity,
+                        description=(entry or {}).get("description", ""),
+                    ))
+
+        self._flags = MappingProxyType(flags)
+        self._flag_codes = frozenset(flags)
+        self._blocking_flags = frozenset(c for c, f in flags.items() if f.severity == "blocking")
+        self._warning_flags = frozenset(c for c, f in flags.items() if f.severity == "warning")
+
     def reload(self) -> None:
         """Reload taxonomy from disk. Useful for development."""
         self._load()
@@ -49,9 +115,9 @@ class Taxonomy:
     # --- Method ---
 
     @property
-    def methods(self) -> list[str]:
-        """Return list of valid method values."""
-        return list(self._data.get("method", {}).keys())
+    def methods(self) -> tuple[str, ...]:
+        """Return valid method values, in taxonomy order."""
+        return self._methods
 
     def get_method_label(self, method: str, lang: str = "fr") -> str:
         """Get localized label for a method."""
@@ -65,14 +131,14 @@ class Taxonomy:
 
     def is_valid_method(self, method: str) -> bool:
         """Check if method value is valid."""
-        return method in self.methods
+        return method in self._method_set
 
     # --- Voice ---
 
     @property
-    def voices(self) -> list[str]:
-        """Return list of valid voice values."""
-        return list(self._data.get("voice", {}).keys())
+    def voices(self) -> tuple[str, ...]:
+        """Return valid voice values, in taxonomy order."""
+        return self._voices
 
     def get_voice_label(self, voice: str, lang: str = "fr") -> str:
         """Get localized label for a voice."""
@@ -86,14 +152,14 @@ class Taxonomy:
 
     def is_valid_voice(self, voice: str) -> bool:
         """Check if voice value is valid."""
-        return voice in self.voices
+        return voice in self._voice_set
 
     # --- Categories ---
 
     @property
-    def categories(self) -> list[str]:
-        """Return list of valid category IDs."""
-        return list(self._data.get("categories", {}).keys())
+    def categories(self) -> tuple[str, ...]:
+        """Return valid category IDs, in taxonomy order."""
+        return self._categories
 
     def get_category_label(self, category: str, lang: str = "fr") -> str:
         """Get localized label for a category."""
@@ -107,56 +173,34 @@ class Taxonomy:
 
     def is_valid_category(self, category: str) -> bool:
         """Check if category ID is valid."""
-        return category in self.categories
+        return category in self._category_set
 
     # --- Flags ---
 
-    def get_all_flag_codes(self) -> set[str]:
+    def get_all_flag_codes(self) -> frozenset[str]:
         """Return set of all valid flag codes."""
-        codes: set[str] = set()
-        flags = self._data.get("processing_flags", {})
-
-        for category_key, category_data in flags.items():
-            if category_key == "automated":
-                # automated has nested blocking/warning
-                for severity in ("blocking", "warning"):
-                    for code in category_data.get(severity, {}).keys():
-                        codes.add(code)
-            else:
-                # content, access, classification, relevance
-                for code in category_data.keys():
-                    codes.add(code)
-
-        return codes
+        return self._flag_codes
 
     def is_valid_flag(self, code: str) -> bool:
         """Check if flag code is valid."""
-        return code in self.get_all_flag_codes()
+        return code in self._flag_codes
 
-    def get_blocking_flags(self) -> set[str]:
+    def get_blocking_flags(self) -> frozenset[str]:
         """Return set of blocking flag codes (SENTMIS, WORDMIS)."""
-        automated = self._data.get("processing_flags", {}).get("automated", {})
-        return set(automated.get("blocking", {}).keys())
+        return self._blocking_flags
 
-    def get_warning_flags(self) -> set[str]:
+    def get_warning_flags(self) -> frozenset[str]:
         """Return set of warning flag codes."""
-        automated = self._data.get("processing_flags", {}).get("automated", {})
-        return set(automated.get("warning", {}).keys())
+        return self._warning_flags
+
+    def get_flag(self, code: str) -> FlagInfo | None:
+        """Return category, severity and description for a flag code."""
+        return self._flags.get(code)
 
     def get_flag_description(self, code: str) -> str:
         """Get description for a flag code."""
-        flags = self._data.get("processing_flags", {})
-
-        for category_key, category_data in flags.items():
-            if category_key == "automated":
-                for severity in ("blocking", "warning"):
-                    if code in category_data.get(severity, {}):
-                        return category_data[severity][code].get("description", "")
-            else:
-                if code in category_data:
-                    return category_data[code].get("description", "")
-
-        return ""
+        flag = self._flags.get(code)
+        return flag.description if flag else ""
 
     # --- Summary for Claude ---
 
@@ -193,3 +237,17 @@ def get_taxonomy() -> Taxonomy:
     if _taxonomy is None:
         _taxonomy = Taxonomy()
     return _taxonomy
+
+
+def reload_taxonomy() -> Taxonomy:
+    """
+    Load the taxonomy from disk and swap it in atomically.
+
+    If the file cannot be loaded, the exception propagates and the current
+    taxonomy stays.
+    """
+    global _taxonomy
+    current = _taxonomy
+    _taxonomy = Taxonomy(current._path) if current is not None else Taxonomy()
+    logger.info(f"Taxonomy reloaded from {_taxonomy._path}")
+    return _taxonomy
@@ -10,6 +10,7 @@ Phase 1 tools:
 
 Phase 2 tools:
 - get_chunk() — get a chunk of article text for translation
+- get_cache_stats() — chunk cache / extraction store diagnostics
 
 Phase 4 tools:
 - validate_classification() — validate classification fields, return token
@@ -22,14 +23,18 @@ Later phases will add:
 from __future__ import annotations
 
 import logging
+import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any
 
 from .database import get_database
 from .taxonomy import get_taxonomy
 from .glossary import find_glossary_terms_in_text, get_glossary_version, verify_glossary_terms
+from .extraction_store import get_extraction_store, load_extraction
+from .image_store import resolve_image_refs
 from .pdf_extraction import (
-    extract_article_text,
     extract_pdf_metadata,
     get_cached_path,
     fetch_and_cache,
@@ -44,32 +49,11 @@ from .utils import slugify
 logger = logging.getLogger(__name__)
 
 
-# --- spaCy Model Loading (per D18) ---
-# Load models ONCE at module import, not per-request.
-# Takes ~2-3 seconds on first import; reused for all subsequent calls.
-
-_nlp_en = None
-
-def _get_nlp_en():
-    """Get English spaCy model, loading it if necessary."""
-    global _nlp_en
-    if _nlp_en is None:
-        try:
-            import spacy
-            _nlp_en = spacy.load("en_core_web_sm")
-            logger.info("Loaded spaCy model: en_core_web_sm")
-        except OSError:
-            logger.warning(
-                "spaCy model 'en_core_web_sm' not found. "
-                "Long paragraphs won't be split at sentence boundaries. "
-                "Run: python -m spacy download en_core_web_sm"
-            )
-    return _nlp_en
-
-
 # --- Chunk Cache (per D26) ---
-# In-memory cache with 1-hour TTL, cleared after save/skip
+# In-memory LRU cache with 1-hour TTL and a byte budget, cleared after save/skip
 # Stores: chunks, timestamp, extractor_used, extraction_problems
+# Backed by the on-disk extraction store, which is content-addressed and
+# therefore survives restarts and clear_chunk_cache() without going stale.
 
 from dataclasses import dataclass
 
@@ -83,19 +67,161 @@ class ChunkCacheEntry:
     extraction_problems: list[str]
 
 
-_chunk_cache: dict[str, ChunkCacheEntry] = {}
+class ChunkCache:
+    """
+    Bounded LRU cache of ChunkCacheEntry objects, keyed by article ID.
+
+    Entries expire after the TTL and are also evicted least-recently-used
+    first once their total size exceeds max_bytes. A background sweeper
+    (see start_sweeper) drops expired entries for articles that are never
+    read again. Hit/miss/eviction counters feed get_cache_stats().
+    """
+
+    def __init__(self, max_bytes: int, ttl: timedelta):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, ChunkCacheEntry] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._sweeper: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _entry_size(entry: ChunkCacheEntry) -> int:
+        """Approximate memory held by an entry (its strings dominate)."""
+        return (
+            sum(sys.getsizeof(chunk) for chunk in entry.chunks)
+            + sum(sys.getsizeof(problem) for problem in entry.extraction_problems)
+            + sys.getsizeof(entry.extractor_used)
+        )
+
+    def _expired(self, entry: ChunkCacheEntry, now: datetime) -> bool:
+        return now - entry.cached_at >= self.ttl
+
+    def _remove(self, article_id: str) -> ChunkCacheEntry | None:
+        entry = self._entries.pop(article_id, None)
+        if entry is not None:
+            self._bytes -= self._sizes.pop(article_id)
+        return entry
+
+    def get(self, article_id: str) -> ChunkCacheEntry | None:
+        """Return a live entry and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(article_id)
+            if entry is not None and self._expired(entry, datetime.now()):
+                self._remove(article_id)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(article_id)
+            self.hits += 1
+            return entry
+
+    def __setitem__(self, article_id: str, entry: ChunkCacheEntry) -> None:
+        """Insert or replace an entry, evicting LRU entries over budget."""
+        size = self._entry_size(entry)
+        with self._lock:
+            self._remove(article_id)
+            self._entries[article_id] = entry
+            self._sizes[article_id] = size
+            self._bytes += size
+
+            # Never evict the entry just stored, even if it alone is over budget
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+                logger.info(f"Chunk cache evicted {oldest} (over {self.max_bytes} bytes)")
+
+    def __contains__(self, article_id: object) -> bool:
+        with self._lock:
+            return article_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pop(self, article_id: str, default: Any = None) -> Any:
+        """Remove an entry without counting it as an eviction."""
+        with self._lock:
+            entry = self._remove(article_id)
+        return default if entry is None else entry
+
+    def clear(self) -> None:
+        """Remove every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def sweep(self) -> int:
+        """Drop all expired entries. Returns how many were removed."""
+        now = datetime.now()
+        with self._lock:
+            expired = [aid for aid, e in self._entries.items() if self._expired(e, now)]
+            for article_id in expired:
+                self._remove(article_id)
+            self.expirations += len(expired)
+        if expired:
+            logger.info(f"Chunk cache sweep removed {len(expired)} expired entries")
+        return len(expired)
+
+    def start_sweeper(self, interval_seconds: float = 300.0) -> None:
+        """Sweep expired entries periodically on a daemon thread (idempotent)."""
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._stop.clear()
+
+        def run() -> None:
+            while not self._stop.wait(interval_seconds):
+                try:
+                    self.sweep()
+                except Exception:
+                    logger.exception("Chunk cache sweep failed")
+
+        self._sweeper = threading.Thread(target=run, name="chunk-cache-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper, if running."""
+        self._stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=5)
+            self._sweeper = None
+
+    def stats(self) -> dict[str, Any]:
+        """Occupancy and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": int(self.ttl.total_seconds()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "sweeper_running": self._sweeper is not None and self._sweeper.is_alive(),
+            }
+
+
 CHUNK_CACHE_TTL = timedelta(hours=1)
+CHUNK_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+
+_chunk_cache = ChunkCache(max_bytes=CHUNK_CACHE_MAX_BYTES, ttl=CHUNK_CACHE_TTL)
 
 
 def _get_cached_entry(article_id: str) -> ChunkCacheEntry | None:
     """Get cache entry if still valid."""
-    if article_id in _chunk_cache:
-        entry = _chunk_cache[article_id]
-        if datetime.now() - entry.cached_at < CHUNK_CACHE_TTL:
-            return entry
-        # Expired — remove
-        del _chunk_cache[article_id]
-    return None
+    return _chunk_cache.get(article_id)
 
 
 def _set_cached_entry(
@@ -103,14 +229,16 @@ def _set_cached_entry(
     chunks: list[str],
     extractor_used: str,
     extraction_problems: list[str]
-) -> None:
-    """Store extraction result in cache."""
-    _chunk_cache[article_id] = ChunkCacheEntry(
+) -> ChunkCacheEntry:
+    """Store extraction result in cache. Returns the stored entry."""
+    entry = ChunkCacheEntry(
         chunks=chunks,
         cached_at=datetime.now(),
         extractor_used=extractor_used,
         extraction_problems=extraction_problems,
     )
+    _chunk_cache[article_id] = entry
+    return entry
 
 
 def clear_chunk_cache(article_id: str | None = None) -> None:
@@ -119,6 +247,10 @@ def clear_chunk_cache(article_id: str | None = None) -> None:
 
     Called after save_article() or skip_article().
     If article_id is None, clears entire cache.
+
+    The on-disk extraction store is keyed by file content, not article ID,
+    so it is left alone: a re-opened article re-chunks from the store
+    only if its source file is unchanged.
     """
     if article_id:
         _chunk_cache.pop(article_id, None)
@@ -126,87 +258,29 @@ def clear_chunk_cache(article_id: str | None = None) -> None:
         _chunk_cache.clear()
 
 
-# --- Chunking Logic (per D3, Part 4.2) ---
-
-def _split_into_chunks(text: str, target_paragraphs: int = 4) -> list[str]:
-    """
-    Split text into chunks of ~4 paragraphs each.
-
-    Per D3:
-    - Split on double newlines
-    - Target 4 paragraphs per chunk
-    - If a paragraph exceeds 500 words, split at ~400 words on sentence boundary
-
-    Uses spaCy for sentence boundary detection on long paragraphs.
-    """
-    # Use module-level spaCy loader (per D18)
-    nlp_en = _get_nlp_en()
-
-    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-    chunks: list[str] = []
-    current_chunk: list[str] = []
-
-    for para in paragraphs:
-        word_count = len(para.split())
-
-        # If paragraph is too long (>500 words), split it
-        if word_count > 500 and nlp_en is not None:
-            sub_paras = _split_long_paragraph(para, nlp_en, target_words=400)
-            for sub in sub_paras:
-                current_chunk.append(sub)
-                if len(current_chunk) >= target_paragraphs:
-                    chunks.append('\n\n'.join(current_chunk))
-                    current_chunk = []
-        else:
-            current_chunk.append(para)
-            if len(current_chunk) >= target_paragraphs:
-                chunks.append('\n\n'.join(current_chunk))
-                current_chunk = []
-
-    # Don't forget remaining paragraphs
-    if current_chunk:
-        chunks.append('\n\n'.join(current_chunk))
-
-    return chunks
-
-
-def _split_long_paragraph(para: str, nlp, target_words: int = 400) -> list[str]:
+def get_cache_stats() -> dict[str, Any]:
     """
-    Split a long paragraph at sentence boundaries.
+    Diagnostic: occupancy and counters for the chunk cache and extraction store.
 
-    Args:
-        para: The paragraph text
-        nlp: spaCy language model
-        target_words: Target words per sub-paragraph
+    Use during long batch sessions to size CHUNK_CACHE_MAX_BYTES: a high
+    eviction count with a low hit rate means the budget is too small.
 
-    Returns:
-        List of sub-paragraphs
+    Response:
+    {
+        "chunk_cache": {"entries": 3, "bytes": 412330, "max_bytes": 67108864,
+                        "hits": 41, "misses": 3, "hit_rate": 0.932,
+                        "evictions": 0, "expirations": 1, ...},
+        "extraction_store": {"bytes": 1204551, "max_bytes": 104857600}
+    }
     """
-    doc = nlp(para)
-    sentences = list(doc.sents)
-
-    sub_paras: list[str] = []
-    current_sub: list[str] = []
-    current_word_count = 0
-
-    for sent in sentences:
-        sent_text = sent.text.strip()
-        sent_words = len(sent_text.split())
-
-        if current_word_count + sent_words > target_words and current_sub:
-            # Start a new sub-paragraph
-            sub_paras.append(' '.join(current_sub))
-            current_sub = [sent_text]
-            current_word_count = sent_words
-        else:
-            current_sub.append(sent_text)
-            current_word_count += sent_words
-
-    # Don't forget remaining sentences
-    if current_sub:
-        sub_paras.append(' '.join(current_sub))
-
-    return sub_paras
+    store = get_extraction_store()
+    return {
+        "chunk_cache": _chunk_cache.stats(),
+        "extraction_store": {
+            "bytes": store.size_bytes(),
+            "max_bytes": store.max_bytes,
+        },
+    }
 
 
 # --- Chunk Instruction (repeated per chunk to prevent context decay) ---
@@ -488,6 +562,9 @@ def get_chunk(article_id: str, chunk_number: int) -> dict[str, Any]:
             "action": "This article is paywalled (open_access=false). Skip to validate_classification() — only title and summary are translated for paywalled articles.",
         }
 
+    # Keep this worker's claim alive while it works through the chunks
+    db.renew_article_lease(article_id)
+
     # Check chunk cache first
     cache_entry = _get_cached_entry(article_id)
 
@@ -539,33 +616,30 @@ def get_chunk(article_id: str, chunk_number: int) -> dict[str, Any]:
 
             cached_path = fetch_result.path
 
-        # Extract text
-        result = extract_article_text(cached_path)
+        stored, problems = load_extraction(cached_path)
 
-        if not result.usable:
+        if stored is None:
             return {
                 "error": True,
                 "error_code": "EXTRACTION_FAILED",
-                "problems": result.problems,
-                "action": f"Call skip_article('{article_id}', 'PDF extraction failed: {', '.join(result.problems)}', 'PDFEXTRACT')",
+                "problems": problems,
+                "action": f"Call skip_article('{article_id}', 'PDF extraction failed: {', '.join(problems)}', 'PDFEXTRACT')",
             }
 
-        # Split into chunks and cache with metadata
-        chunks = _split_into_chunks(result.text)
-        _set_cached_entry(
+        # Use the entry directly: reading it back would count a hit, and the
+        # prefetch thread may already have evicted it
+        cache_entry = _set_cached_entry(
             article_id,
-            chunks,
-            extractor_used=result.extractor_used,
-            extraction_problems=result.problems,
+            stored.chunks,
+            extractor_used=stored.extractor_used,
+            extraction_problems=stored.extraction_problems,
         )
 
         logger.info(
-            f"Article {article_id}: {len(chunks)} chunks, "
-            f"extractor={result.extractor_used}, warnings={result.problems}"
+            f"Article {article_id}: {len(stored.chunks)} chunks, "
+            f"extractor={stored.extractor_used}, warnings={stored.extraction_problems}"
         )
 
-        cache_entry = _get_cached_entry(article_id)
-
     # Check if chunk_number is valid
     if chunk_number < 1:
         chunk_number = 1
@@ -948,13 +1022,14 @@ def save_article(
             glossary_version=glossary_version,
         )
 
-        # Save translation
+        # Save translation. The public site renders translated_full_text and
+        # cannot reach the image store, so references become data URIs.
         db.save_translation(
             article_id=article_id,
             target_language="fr",
             translated_title=translated_title,
             translated_summary=translated_summary,
-            translated_full_text=translated_full_text,
+            translated_full_text=resolve_image_refs(translated_full_text) if translated_full_text else None,
         )
 
         # Set categories
@@ -0,0 +1,226 @@
+"""
+Structured tracing and latency metrics for MCP tool calls.
+
+Every tool call wrapped by server.log_tool_call produces one span: a JSON
+line in logs/trace.jsonl with the tool name, wall-clock start, monotonic
+duration, outcome and bounded previews of the arguments and result. Spans
+also feed per-tool latency windows, summarized as p50/p95/p99 by
+get_server_metrics().
+
+Previews use reprlib, which truncates containers and strings as it goes, so
+a multi-megabyte chunk or parsed article never gets fully repr()'d just to
+be cut to 200 characters. In the text log, previews are wrapped in
+LazyPreview and only rendered if the record is actually emitted.
+
+Set PDA_TRACE=0 to stop writing spans (metrics are still collected).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import logging.handlers
+import os
+import reprlib
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# --- Configuration ---
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TRACE_PATH = PROJECT_ROOT / "logs" / "trace.jsonl"
+TRACE_MAX_BYTES = 20 * 1024 * 1024  # Rotate to trace.jsonl.1 beyond this
+TRACE_ENABLED = os.environ.get("PDA_TRACE", "1") != "0"
+
+PREVIEW_CHARS = 200
+LATENCY_WINDOW = 2048  # Most recent calls per tool used for percentiles
+
+
+# --- Bounded previews ---
+
+_repr = reprlib.Repr()
+_repr.maxlevel = 3
+_repr.maxdict = 8
+_repr.maxlist = 8
+_repr.maxtuple = 8
+_repr.maxset = 8
+_repr.maxstring = 120
+_repr.maxother = 120
+
+
+def preview(value: Any, limit: int = PREVIEW_CHARS) -> str:
+    """Short repr of value, built without rendering the whole object."""
+    text = _repr.repr(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+class LazyPreview:
+    """Defers preview() until a log record is formatted."""
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: int = PREVIEW_CHARS):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return preview(self.value, self.limit)
+
+
+# --- Latency metrics ---
+
+class ToolMetrics:
+    """Per-tool call counts and a sliding window of latencies."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._window = window
+        self._latencies: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def record(self, tool: str, seconds: float, ok: bool = True) -> None:
+        """Record one call's duration."""
+        with self._lock:
+            samples = self._latencies.get(tool)
+            if samples is None:
+                samples = self._latencies[tool] = deque(maxlen=self._window)
+            samples.append(seconds)
+            self._counts[tool] = self._counts.get(tool, 0) + 1
+            if not ok:
+                self._errors[tool] = self._errors.get(tool, 0) + 1
+
+    @staticmethod
+    def _percentile(ordered: list[float], pct: float) -> float:
+        """Nearest-rank percentile of an ascending list."""
+        rank = max(1, -(-len(ordered) * pct // 100))  # ceiling
+        return ordered[int(rank) - 1]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-tool count, errors and latency percentiles in milliseconds."""
+        with self._lock:
+            windows = {tool: sorted(samples) for tool, samples in self._latencies.items()}
+            counts = dict(self._counts)
+            errors = dict(self._errors)
+
+        tools = {}
+        for tool, ordered in sorted(windows.items()):
+            tools[tool] = {
+                "count": counts[tool],
+                "errors": errors.get(tool, 0),
+                "p50_ms": round(self._percentile(ordered, 50) * 1000, 2),
+                "p95_ms": round(self._percentile(ordered, 95) * 1000, 2),
+                "p99_ms": round(self._percentile(ordered, 99) * 1000, 2),
+                "max_ms": round(ordered[-1] * 1000, 2),
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+            }
+        return {
+            "uptime_seconds": round(time.monotonic() - self._started, 1),
+            "window": self._window,
+            "tools": tools,
+        }
+
+
+# --- Span writer ---
+
+def _trace_handler(path: Path) -> logging.Handler:
+    """Rotating, thread-safe writer for bare JSON lines."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handler = logging.handlers.RotatingFileHandler(
+        path, maxBytes=TRACE_MAX_BYTES, backupCount=1, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+class Tracer:
+    """Records tool-call spans to JSONL and to the latency metrics."""
+
+    def __init__(self, path: Path = TRACE_PATH, enabled: bool = TRACE_ENABLED):
+        self.metrics = ToolMetrics()
+        self._path = path
+        self._enabled = enabled
+        self._handler: logging.Handler | None = None  # Opened on first span
+
+    def record(
+        self,
+        tool: str,
+        started_at: float,
+        seconds: float,
+        args: tuple,
+        kwargs: dict[str, Any],
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """
+        Record one finished call.
+
+        Args:
+            tool: Tool name
+            started_at: Wall-clock start (time.time())
+            seconds: Duration measured with time.perf_counter()
+            args, kwargs: Call arguments (previewed, never fully rendered)
+            result: Return value, if the call succeeded
+            error: Exception, if it failed
+        """
+        ok = error is None
+        self.metrics.record(tool, seconds, ok)
+        if not self._enabled:
+            return
+
+        span = {
+            "ts": round(started_at, 3),
+            "tool": tool,
+            "duration_ms": round(seconds * 1000, 3),
+            "ok": ok,
+            "thread": threading.current_thread().name,
+            "args": preview(args) if args else None,
+            "kwargs": preview(kwargs) if kwargs else None,
+        }
+        if ok:
+            span["result"] = preview(result)
+        else:
+            span["error"] = f"{type(error).__name__}: {str(error)[:PREVIEW_CHARS]}"
+
+        try:
+            if self._handler is None:
+                self._handler = _trace_handler(self._path)
+            # Handler.handle() takes the handler lock; spans stay out of mcp.log
+            self._handler.handle(logging.makeLogRecord({
+                "msg": json.dumps(span, ensure_ascii=False),
+                "levelno": logging.INFO,
+            }))
+        except OSError as e:
+            logger.warning(f"Disabling span tracing, cannot write {self._path}: {e}")
+            self._enabled = False
+
+    def close(self) -> None:
+        """Close the trace file (reopened on the next span)."""
+        if self._handler is not None:
+            self._handler.close()
+            self._handler = None
+
+
+# --- Module-level singleton ---
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer:
+    """Get the tracer singleton."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def get_server_metrics() -> dict[str, Any]:
+    """Per-tool latency percentiles and error counts since startup."""
+    return get_tracer().metrics.snapshot()
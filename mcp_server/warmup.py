@@ -0,0 +1,172 @@
+"""
+Background warm-up of spaCy pipelines and the glossary.
+
+Models are loaded lazily (per D18, once per process), which used to put a
+multi-second load inside whichever tool call first needed them: a long
+paragraph split in get_chunk() or the quality checks in save_article().
+server.main() starts this warm-up on a daemon thread as the server comes up,
+so those loads happen while Claude is still reading the first article.
+
+Each step loads and exercises one pipeline (or the glossary matcher and
+lemma table). A tool call that needs a pipeline still being loaded blocks
+on the model registry's lock and then reuses the loaded model; nothing is
+loaded twice. Progress is reported by get_warmup_status().
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable
+
+from .glossary import get_glossary
+from .nlp_models import (
+    TASK_ANALYSIS,
+    TASK_LEMMAS,
+    TASK_SENTENCES,
+    get_model_stats,
+    get_pipeline,
+    is_model_installed,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Pipelines the tools use: chunk splitting and sentence counts (en/sentences),
+# single-pass quality checks (en+fr/analysis), glossary term lemmas (fr/lemmas)
+WARMUP_PIPELINES = [
+    ("en", TASK_SENTENCES),
+    ("en", TASK_ANALYSIS),
+    ("fr", TASK_ANALYSIS),
+    ("fr", TASK_LEMMAS),
+]
+
+SAMPLE_TEXT = {
+    "en": "The child avoided ordinary demands. Anxiety drove the avoidance.",
+    "fr": "L'enfant évitait les demandes ordinaires. L'anxiété expliquait l'évitement.",
+}
+
+
+@dataclass
+class WarmupStep:
+    """Outcome of one warm-up step."""
+    name: str
+    status: str = "pending"  # pending, running, ready, skipped, failed
+    seconds: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class WarmupStatus:
+    """Overall warm-up progress."""
+    state: str = "not_started"  # not_started, running, ready, failed
+    started_at: str | None = None
+    finished_at: str | None = None
+    steps: list[WarmupStep] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summary suitable for returning from a tool."""
+        return {
+            "state": self.state,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "steps": [
+                {"name": s.name, "status": s.status, "seconds": round(s.seconds, 2), "error": s.error}
+                for s in self.steps
+            ],
+        }
+
+
+def _pipeline_step(lang: str, task: str) -> Callable[[], str]:
+    def run() -> str:
+        if not is_model_installed(lang):
+            return "skipped"
+        nlp = get_pipeline(lang, task)
+        nlp(SAMPLE_TEXT[lang])
+        return "ready"
+    return run
+
+
+def _glossary_step() -> str:
+    glossary = get_glossary()
+    glossary.find_terms_in_text(SAMPLE_TEXT["en"])
+    if is_model_installed("fr"):
+        glossary.warm_lemmas()
+    return "ready"
+
+
+class Warmup:
+    """Runs the warm-up steps once, on a background thread."""
+
+    def __init__(self, steps: list[tuple[str, Callable[[], str]]] | None = None):
+        if steps is None:
+            steps = [(f"{lang}/{task}", _pipeline_step(lang, task)) for lang, task in WARMUP_PIPELINES]
+            steps.append(("glossary", _glossary_step))
+        self._steps = steps
+        self._status = WarmupStatus(steps=[WarmupStep(name) for name, _ in steps])
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start warming up in the background (no-op if already started)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._status.state = "running"
+            self._status.started_at = datetime.now().isoformat(timespec="seconds")
+            self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        failed = False
+        for (_, step), record in zip(self._steps, self._status.steps):
+            record.status = "running"
+            start = time.perf_counter()
+            try:
+                record.status = step()
+            except Exception as e:
+                logger.warning(f"Warm-up step {record.name} failed: {e}")
+                record.status = "failed"
+                record.error = str(e)
+                failed = True
+            record.seconds = time.perf_counter() - start
+
+        self._status.state = "failed" if failed else "ready"
+        self._status.finished_at = datetime.now().isoformat(timespec="seconds")
+        logger.info(f"Warm-up {self._status.state}: " + ", ".join(
+            f"{s.name}={s.status} ({s.seconds:.1f}s)" for s in self._status.steps
+        ))
+        self._done.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until warm-up finishes. Returns False on timeout."""
+        return self._done.wait(timeout)
+
+    def status(self) -> dict[str, Any]:
+        """Current progress plus load cost of every loaded pipeline."""
+        return {**self._status.as_dict(), "models": get_model_stats()}
+
+
+# --- Module-level singleton ---
+
+_warmup: Warmup | None = None
+
+
+def start_warmup() -> Warmup:
+    """Start the background warm-up (once per process)."""
+    global _warmup
+    if _warmup is None:
+        _warmup = Warmup()
+    _warmup.start()
+    return _warmup
+
+
+def get_warmup_status() -> dict[str, Any]:
+    """Report warm-up progress; state is not_started if it never ran."""
+    if _warmup is None:
+        return {**WarmupStatus().as_dict(), "models": get_model_stats()}
+    return _warmup.status()
@@ -5,16 +5,20 @@ Batch extract PDFs via Datalab API with structured JSON output.
 Outputs structured JSON with block-level content including:
 - PageHeader/PageFooter (for DOI, citation extraction)
 - SectionHeader, Text, Table, Figure blocks
-- Embedded images as base64 data URIs
+- Images stored once in cache/images, referenced from block HTML by hash
 """
 
 import requests
 import os
+import sys
 import time
 import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from mcp_server.image_store import externalize_html, externalize_images
+
 API_KEY = os.environ.get('DATALAB_API_KEY', '-vPPAEwkoYbtFa9oa6cQRV1Gef8O1LaTSha-TZq5Yso')
 API_URL = "https://www.datalab.to/api/v1/marker"
 
@@ -79,7 +83,7 @@ def submit_pdf(pdf_path: Path) -> dict:
 
 
 def poll_and_save(request_id: str, output_path: Path) -> bool:
-    """Poll for completion and save structured JSON with embedded images."""
+    """Poll for completion and save structured JSON, with images in the image store."""
     for attempt in range(MAX_POLL_ATTEMPTS):
         response = requests.get(
             f"{API_URL}/{request_id}",
@@ -119,16 +123,15 @@ def poll_and_save(request_id: str, output_path: Path) -> bool:
                 print(f"  WARNING: No blocks returned")
                 return False
 
-            # Embed images as base64 data URIs in block HTML
+            # Store each image once, by content hash, then point block HTML at
+            # the references in a single pass per block
+            image_refs = externalize_images(images)
             for block in blocks:
+                if block.get('images'):
+                    block['images'] = externalize_images(block['images'])
                 html = block.get('html', '')
-                for filename, b64_data in images.items():
-                    if filename in html:
-                        ext = filename.split('.')[-1].lower()
-                        mime = {'jpg': 'image/jpeg', 'jpeg': 'image/jpeg', 'png': 'image/png'}.get(ext, 'image/jpeg')
-                        data_uri = f'data:{mime};base64,{b64_data}'
-                        html = html.replace(f'src="{filename}"', f'src="{data_uri}"')
-                        block['html'] = html
+                if html:
+                    block['html'] = externalize_html(html, image_refs)
 
             # Save the full structured response
             page_count = data.get('page_count') or (max((b.get('page', 0) for b in blocks), default=0) + 1)
@@ -9,7 +9,7 @@ requiring interactive permission approvals. It:
 2. Updates batch_jobs table with status
 3. Runs Claude CLI with --print --dangerously-skip-permissions
 4. Monitors output for progress markers
-5. Updates database as articles complete
+5. Updates database as articles complete (buffered; see mcp_server.batch_events)
 
 Usage:
   python batch_runner.py --job-type preprocessing --count 5 --job-id abc123
@@ -33,6 +33,7 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from mcp_server.batch_events import BatchEventWriter
 from mcp_server.database import Database
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -152,6 +153,7 @@ class BatchRunner:
         self.count = count
         self.verbose = verbose
         self.db = Database(DB_PATH)
+        self.events = BatchEventWriter(self.db, job_id)
         self.process: subprocess.Popen | None = None
         self._stop_requested = False
 
@@ -174,13 +176,12 @@ class BatchRunner:
         log_path = LOG_DIR / f"{self.job_id}.log"
 
         # Update status to running
-        self.db.update_batch_job_status(
-            self.job_id,
+        self.events.start()
+        self.events.status(
             "running",
             pid=os.getpid()
         )
-        self.db.add_batch_job_event(
-            self.job_id,
+        self.events.event(
             "started",
             message=f"Starting {self.job_type} batch for {self.count} articles"
         )
@@ -237,40 +238,41 @@ class BatchRunner:
 
             # Update final status
             if self._stop_requested:
-                self.db.update_batch_job_status(self.job_id, "cancelled")
-                self.db.add_batch_job_event(
-                    self.job_id, "cancelled",
+                self.events.status("cancelled")
+                self.events.event(
+                    "cancelled",
                     message="Job cancelled by user"
                 )
             elif exit_code == 0:
-                self.db.update_batch_job_status(self.job_id, "completed")
-                self.db.add_batch_job_event(
-                    self.job_id, "completed",
+                self.events.status("completed")
+                self.events.event(
+                    "completed",
                     message="Batch completed successfully"
                 )
             else:
-                self.db.update_batch_job_status(
-                    self.job_id, "failed",
+                self.events.status(
+                    "failed",
                     error_message=f"Claude exited with code {exit_code}"
                 )
-                self.db.add_batch_job_event(
-                    self.job_id, "failed",
+                self.events.event(
+                    "failed",
                     message=f"Claude process failed with exit code {exit_code}"
                 )
 
             return exit_code
 
         except Exception as e:
-            self.db.update_batch_job_status(
-                self.job_id, "failed",
+            self.events.status(
+                "failed",
                 error_message=str(e)
             )
-            self.db.add_batch_job_event(
-                self.job_id, "error",
+            self.events.event(
+                "error",
                 message=f"Exception: {e}"
             )
             return 1
         finally:
+            self.events.close()
             self.db.close()
 
     def _parse_output_line(self, line: str):
@@ -280,12 +282,12 @@ class BatchRunner:
         # ARTICLE_START: slug
         if match := re.match(r'ARTICLE_START:\s*(.+)', line):
             slug = match.group(1).strip()
-            self.db.update_batch_job_status(
-                self.job_id, "running",
+            self.events.status(
+                "running",
                 current_article=slug
             )
-            self.db.add_batch_job_event(
-                self.job_id, "article_start",
+            self.events.event(
+                "article_start",
                 article_slug=slug,
                 message=f"Started processing {slug}"
             )
@@ -293,9 +295,9 @@ class BatchRunner:
         # ARTICLE_COMPLETE: slug
         elif match := re.match(r'ARTICLE_COMPLETE:\s*(.+)', line):
             slug = match.group(1).strip()
-            self.db.increment_batch_job_progress(self.job_id)
-            self.db.add_batch_job_event(
-                self.job_id, "article_complete",
+            self.events.increment_progress()
+            self.events.event(
+                "article_complete",
                 article_slug=slug,
                 message=f"Completed {slug}"
             )
@@ -304,16 +306,16 @@ class BatchRunner:
         elif match := re.match(r'ARTICLE_ERROR:\s*([^\-]+)\s*-\s*(.+)', line):
             slug = match.group(1).strip()
             reason = match.group(2).strip()
-            self.db.add_batch_job_event(
-                self.job_id, "article_error",
+            self.events.event(
+                "article_error",
                 article_slug=slug,
                 message=f"Error: {reason}"
             )
 
         # BATCH_COMPLETE
         elif "BATCH_COMPLETE" in line:
-            self.db.add_batch_job_event(
-                self.job_id, "batch_complete",
+            self.events.event(
+                "batch_complete",
                 message="All articles processed"
             )
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark glossary term matching on a long article.
+
+Compares Glossary.find_terms_in_text (single-pass Aho-Corasick automaton)
+against the previous implementation, which ran one word-boundary regex
+search per indexed term. Both must return the same {en: fr} dict.
+
+The synthetic article is built from the training corpus with glossary terms
+(and their hyphen variants / abbreviations) sprinkled in, so both the
+matching and the non-matching paths are exercised.
+
+Usage:
+  python scripts/benchmark_glossary.py
+  python scripts/benchmark_glossary.py --words 20000 --repeat 5
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mcp_server.glossary import Glossary
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CORPUS_FILES = [
+    PROJECT_ROOT / "training" / "has_terminology_2017.md",
+    PROJECT_ROOT / "training" / "philippe_contejean_2018.md",
+]
+
+
+def find_terms_regex(glossary: Glossary, text: str) -> dict[str, str]:
+    """Previous implementation: one re.search per indexed term."""
+    normalized_text = glossary._normalize(text)
+    matches: dict[str, str] = {}
+
+    for normalized_term, entry in glossary._index.items():
+        pattern = r'\b' + re.escape(normalized_term) + r'\b'
+        if re.search(pattern, normalized_text):
+            if entry["en"] not in matches:
+                matches[entry["en"]] = entry["fr"]
+
+    return matches
+
+
+def build_article(glossary: Glossary, word_count: int, seed: int) -> str:
+    """Build a deterministic synthetic article of roughly word_count words."""
+    rng = random.Random(seed)
+    vocabulary = []
+    for path in CORPUS_FILES:
+        if path.exists():
+            vocabulary.extend(path.read_text(encoding="utf-8").split())
+    if not vocabulary:
+        vocabulary = "the child showed avoidance of everyday demands at school".split()
+
+    terms = list(glossary._index.keys())
+    words: list[str] = []
+    while len(words) < word_count:
+        if rng.random() < 0.01:
+            words.extend(rng.choice(terms).split())
+        else:
+            words.append(rng.choice(vocabulary))
+        # Paragraph breaks every ~80 words, like extracted PDF text
+        if rng.random() < 0.0125:
+            words[-1] += "\n\n"
+
+    return " ".join(words[:word_count])
+
+
+def time_call(fn, repeat: int) -> float:
+    """Return the best wall-clock time over `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark glossary term matching")
+    parser.add_argument("--words", type=int, default=20000, help="Article length in words")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation (best is reported)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic article")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    glossary = Glossary()
+    build_time = time.perf_counter() - start
+
+    text = build_article(glossary, args.words, args.seed)
+
+    expected = find_terms_regex(glossary, text)
+    actual = glossary.find_terms_in_text(text)
+    if list(actual.items()) != list(expected.items()):
+        print("MISMATCH between automaton and regex results", file=sys.stderr)
+        print(f"  only regex:     {sorted(set(expected) - set(actual))}", file=sys.stderr)
+        print(f"  only automaton: {sorted(set(actual) - set(expected))}", file=sys.stderr)
+        sys.exit(1)
+
+    regex_time = time_call(lambda: find_terms_regex(glossary, text), args.repeat)
+    automaton_time = time_call(lambda: glossary.find_terms_in_text(text), args.repeat)
+
+    print(f"Glossary: {len(glossary._index)} indexed forms (load + build: {build_time * 1000:.1f} ms)")
+    print(f"Article:  {len(text.split())} words, {len(text)} chars, {len(actual)} terms found")
+    print(f"Regex per term:  {regex_time * 1000:8.1f} ms")
+    print(f"Aho-Corasick:    {automaton_time * 1000:8.1f} ms")
+    print(f"Speedup:         {regex_time / automaton_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,10 +25,13 @@ import re
 import json
 import sys
 import yaml
-import base64
 from pathlib import Path
 from bs4 import BeautifulSoup
 from collections import defaultdict
+from functools import lru_cache
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from mcp_server.image_store import externalize_document, read_image_payload
 
 
 # --- Normalize Datalab JSON formats ---
@@ -41,8 +44,9 @@ def normalize_datalab_json(data: dict) -> list:
     Manual website downloads: { "children": [Pages...] } where each Page has "children" with blocks
 
     Returns flat list of blocks. Structure and content are identical — only difference
-    is manual downloads have filename refs in HTML src while API embeds base64.
-    The images dict (with base64) exists in both, which is what the parser uses.
+    is manual downloads have filename refs in HTML src while API output points at the
+    image store (older API files embed base64 data URIs). The images dict (base64 or
+    image store references) exists in both, which is what the parser uses.
     """
     # Already flattened (from poll_and_save)
     if 'blocks' in data:
@@ -96,6 +100,36 @@ def load_section_headings():
 SECTION_PATTERNS, BODY_SECTIONS, METADATA_SECTIONS = load_section_headings()
 
 
+# Common LaTeX symbols that appear in academic papers
+LATEX_TO_UNICODE = {
+    r'\times': '×',
+    r'\div': '÷',
+    r'\pm': '±',
+    r'\leq': '≤',
+    r'\geq': '≥',
+    r'\neq': '≠',
+    r'\approx': '≈',
+    r'\alpha': 'α',
+    r'\beta': 'β',
+    r'\gamma': 'γ',
+    r'\delta': 'δ',
+    r'\chi': 'χ',
+    r'\eta': 'η',
+    r'\mu': 'μ',
+    r'\sigma': 'σ',
+    r'\sum': 'Σ',
+    r'\infty': '∞',
+}
+
+# One pass over the formula for all commands. No command is a prefix of
+# another and the replacements contain no backslashes, so this gives the
+# same result as replacing the commands one after another.
+_LATEX_COMMAND = re.compile('|'.join(
+    re.escape(latex) for latex in sorted(LATEX_TO_UNICODE, key=len, reverse=True)
+))
+_MATH_TAG = re.compile(r'<math>(.*?)</math>')
+
+
 def convert_math_tags(html: str) -> str:
     """
     Convert <math> tags to displayable content.
@@ -104,41 +138,93 @@ def convert_math_tags(html: str) -> str:
     inside them. Since these are simple inline formulas (not complex equations),
     we convert LaTeX to Unicode and wrap in a styled span instead.
     """
-    # Common LaTeX symbols that appear in academic papers
-    latex_to_unicode = {
-        r'\times': '×',
-        r'\div': '÷',
-        r'\pm': '±',
-        r'\leq': '≤',
-        r'\geq': '≥',
-        r'\neq': '≠',
-        r'\approx': '≈',
-        r'\alpha': 'α',
-        r'\beta': 'β',
-        r'\gamma': 'γ',
-        r'\delta': 'δ',
-        r'\chi': 'χ',
-        r'\eta': 'η',
-        r'\mu': 'μ',
-        r'\sigma': 'σ',
-        r'\sum': 'Σ',
-        r'\infty': '∞',
-    }
-
     def replace_math(match):
-        content = match.group(1)
         # Convert any LaTeX commands to Unicode
-        for latex, unicode_char in latex_to_unicode.items():
-            content = content.replace(latex, unicode_char)
+        content = _LATEX_COMMAND.sub(lambda m: LATEX_TO_UNICODE[m.group(0)], match.group(1))
         # Use a span with class for styling - browsers can't render plain text in <math>
         return f'<span class="formula">{content}</span>'
 
-    return re.sub(r'<math>(.*?)</math>', replace_math, html)
-
-
+    return _MATH_TAG.sub(replace_math, html)
+
+
+# --- HTML to text ---
+#
+# extract_text() runs on every block, often more than once, and building a
+# BeautifulSoup tree just to read its strings dominated parsing. Block HTML
+# from Datalab is plain markup, so the fast path splits it on tags with a
+# regex and reads the text between them, which is what
+# BeautifulSoup('html.parser').get_text(strip=True) returns: each run of text
+# between two tags, entities decoded, stripped, empty runs dropped, joined.
+# Anything the fast path does not model exactly (comments, doctypes, stray
+# '<', script/style and other tags whose strings BeautifulSoup reads raw or
+# leaves out, unusual entities) goes to BeautifulSoup instead.
+
+_TAG = re.compile(
+    r'<(?:([a-zA-Z][a-zA-Z0-9]*)'
+    r'(?:\s+[a-zA-Z_:][-a-zA-Z0-9_:.]*(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s"\'=<>`]+))?)*'
+    r'\s*/?|/([a-zA-Z][a-zA-Z0-9]*)\s*)>'
+)
+_SPECIAL_TAGS = frozenset({
+    'script', 'style', 'template', 'rt', 'rp', 'textarea', 'title',
+    'xmp', 'iframe', 'noembed', 'noframes', 'noscript', 'plaintext',
+})
+_ENTITY = re.compile(r'&(?:(amp|lt|gt|quot|apos|nbsp);|#([0-9]{1,7});|#[xX]([0-9a-fA-F]{1,6});)?(?=([#a-zA-Z]?))')
+_NAMED_ENTITIES = {'amp': '&', 'lt': '<', 'gt': '>', 'quot': '"', 'apos': "'", 'nbsp': '\xa0'}
+
+
+def _decode_entity(match: re.Match) -> str:
+    name, decimal, hexadecimal, following = match.groups()
+    if name:
+        return _NAMED_ENTITIES[name]
+    if decimal or hexadecimal:
+        codepoint = int(decimal, 10) if decimal else int(hexadecimal, 16)
+        if 0x20 <= codepoint < 0x7f or 0xa0 <= codepoint < 0xd800 or 0xe000 <= codepoint < 0x110000:
+            return chr(codepoint)
+    elif not following:
+        return '&'  # A bare ampersand is text
+    raise ValueError  # Decoded differently by html.parser; not handled here
+
+
+def _fast_text(html: str) -> str | None:
+    """get_text(strip=True) for plain markup, or None if BeautifulSoup is needed."""
+    if '<!' in html or '<?' in html:
+        return None
+    runs = []
+    pos = 0
+    for match in _TAG.finditer(html):
+        tag = match.group(1) or match.group(2)
+        if tag.lower() in _SPECIAL_TAGS:
+            return None
+        runs.append(html[pos:match.start()])
+        pos = match.end()
+    runs.append(html[pos:])
+
+    parts = []
+    for run in runs:
+        if '<' in run:
+            return None
+        if '&' in run:
+            try:
+                run = _ENTITY.sub(_decode_entity, run)
+            except ValueError:
+                return None
+        run = run.strip()
+        if run:
+            parts.append(run)
+    return ''.join(parts)
+
+
+def _html_text(html: str) -> str:
+    text = _fast_text(html)
+    if text is None:
+        text = BeautifulSoup(html, 'html.parser').get_text(strip=True)
+    return text
+
+
+@lru_cache(maxsize=8192)
 def extract_text(html: str, preserve_math: bool = False) -> str:
     """
-    Extract plain text from HTML.
+    Extract plain text from HTML (memoized per block HTML).
 
     Args:
         html: HTML string to extract text from
@@ -155,16 +241,14 @@ def extract_text(html: str, preserve_math: bool = False) -> str:
             return f'__MATH_{len(math_tags) - 1}__'
 
         html_with_placeholders = re.sub(r'<math>.*?</math>', save_math, html)
-        soup = BeautifulSoup(html_with_placeholders, 'html.parser')
-        text = soup.get_text(strip=True)
+        text = _html_text(html_with_placeholders)
 
         # Restore math tags
         for i, math_tag in enumerate(math_tags):
             text = text.replace(f'__MATH_{i}__', math_tag)
         return text
 
-    soup = BeautifulSoup(html, 'html.parser')
-    return soup.get_text(strip=True)
+    return _html_text(html)
 
 
 def extract_tag_level(html: str) -> str | None:
@@ -256,185 +340,164 @@ def join_split_sentences(blocks: list[dict]) -> list[dict]:
     footnotes, figures, tables, and captions. When looking for a continuation
     of an incomplete sentence, we skip over these non-content blocks BUT
     stop if we hit a SectionHeader (which marks a new section boundary).
+
+    Each block's text and role are computed once up front, so the lookahead
+    compares precomputed values instead of re-parsing HTML. Past a page break
+    (where only a lowercase start continues a sentence) the lookahead jumps
+    straight to the next candidate via a precomputed index.
     """
     # Block types to skip when looking for continuation
     SKIP_BLOCK_TYPES = {'PageHeader', 'PageFooter', 'Figure', 'Picture', 'Caption', 'Footnote', 'Table'}
 
     # METADATA_SECTIONS loaded from data/section_headings.yaml at module level
 
-    result = []
-    i = 0
-    consumed = set()
-
-    while i < len(blocks):
-        if i in consumed:
-            i += 1
-            continue
-
-        block = blocks[i]
+    # --- Classify every block once ---
+    # kind: 'text', 'header' (section boundary), 'metadata_header' (e.g. "Corresponding
+    # author", skipped along with its text), 'page' (page chrome), 'skip', or 'other'
+    n = len(blocks)
+    kinds = []
+    texts: list[str | None] = []
+    for block in blocks:
         bt = block.get('block_type', '')
+        html = block.get('html', '')
+        texts.append(extract_text(html, preserve_math=True) if bt in ('Text', 'Caption') else None)
 
-        if bt in ['Text', 'Caption']:
-            text = extract_text(block.get('html', ''), preserve_math=True)
-            current_incomplete = is_incomplete_sentence(text)
-
-            # Look ahead for a continuation
-            j = i + 1
-            continuation_idx = None
-            crossed_page = False
-            crossed_section = False  # Stop if we hit a new section
-
-            in_metadata_section = False  # Track if we're inside a metadata section
-
-            while j < len(blocks):
-                next_block = blocks[j]
-                next_bt = next_block.get('block_type', '')
-
-                # SectionHeader marks a section boundary
-                if next_bt == 'SectionHeader':
-                    next_text = extract_text(next_block.get('html', ''))
-                    next_text_lower = next_text.lower().strip()
-
-                    # Metadata sections (like "Corresponding author") can be skipped
-                    # because they're not body content
-                    if any(meta in next_text_lower for meta in METADATA_SECTIONS):
-                        in_metadata_section = True
-                        j += 1
-                        continue
-
-                    # Other SectionHeaders mark real section boundaries - don't join across
-                    in_metadata_section = False
-                    crossed_section = True
-                    j += 1
-                    continue
-
-                # Skip over non-content blocks (page chrome, figures, footnotes, etc.)
-                if next_bt in SKIP_BLOCK_TYPES:
-                    if next_bt in ['PageHeader', 'PageFooter']:
-                        crossed_page = True
-                        in_metadata_section = False  # Reset on page change
-                    j += 1
-                    continue
-
-                if next_bt in ['Text', 'Caption']:
-                    # Skip blocks already consumed by an earlier join
-                    if j in consumed:
-                        j += 1
-                        continue
-
-                    # Skip text blocks inside metadata sections (like author address/email)
-                    if in_metadata_section:
-                        j += 1
-                        continue
-
-                    # Don't join across section boundaries
-                    if crossed_section:
-                        break
-
-                    next_text = extract_text(next_block.get('html', ''), preserve_math=True)
+        if bt == 'SectionHeader':
+            header_lower = extract_text(html).lower().strip()
+            kinds.append('metadata_header' if any(meta in header_lower for meta in METADATA_SECTIONS) else 'header')
+        elif bt in ('PageHeader', 'PageFooter'):
+            kinds.append('page')
+        elif bt in SKIP_BLOCK_TYPES:
+            kinds.append('skip')
+        elif bt == 'Text':
+            kinds.append('text')
+        else:
+            kinds.append('other')
+
+    continues = [kind == 'text' and is_sentence_continuation(text) for kind, text in zip(kinds, texts)]
+
+    # Text after a metadata header is skipped until the next header or page change
+    in_metadata = []
+    metadata = False
+    for kind in kinds:
+        in_metadata.append(metadata)
+        if kind in ('header', 'metadata_header', 'page'):
+            metadata = kind == 'metadata_header'
+
+    # next_after_page[j]: first block at or after j that ends a lookahead which has
+    # crossed a page: a lowercase-start Text outside metadata, a section header, or
+    # an unknown block type
+    next_after_page = [n] * (n + 1)
+    for j in range(n - 1, -1, -1):
+        stops = kinds[j] in ('header', 'other') or (continues[j] and not in_metadata[j])
+        next_after_page[j] = j if stops else next_after_page[j + 1]
 
-                    # Skip obvious table/figure captions that start with "Table 1" etc.
-                    if next_bt == 'Caption' and re.match(r'^(Table|Fig\.?|Figure)\s*\d', next_text, re.IGNORECASE):
-                        j += 1
-                        continue
+    consumed = set()
 
+    def find_continuation(i: int, current_incomplete: bool) -> int | None:
+        """First block continuing block i's sentence, or None."""
+        page = blocks[i].get('page')
+        crossed_page = False
+        metadata = False  # Inside a metadata section seen during this lookahead
+
+        j = i + 1
+        while j < n:
+            kind = kinds[j]
+
+            # Metadata sections (like "Corresponding author") can be skipped
+            # because they're not body content
+            if kind == 'metadata_header':
+                metadata = True
+
+            # Other SectionHeaders mark real section boundaries - don't join across
+            elif kind == 'header':
+                return None
+
+            # Skip over non-content blocks (page chrome, figures, footnotes, etc.)
+            elif kind == 'page':
+                crossed_page = True
+                metadata = False  # Reset on page change
+
+            elif kind == 'text':
+                # Skip blocks already consumed by an earlier join, and text
+                # inside metadata sections (like author address/email)
+                if j not in consumed and not metadata:
                     # Found a continuation if it starts with lowercase
-                    if is_sentence_continuation(next_text):
-                        continuation_idx = j
-                        break
+                    if continues[j]:
+                        return j
 
                     # Or if current is incomplete and we're on the same page (column break)
-                    if current_incomplete and not crossed_page and block.get('page') == next_block.get('page'):
-                        continuation_idx = j
-                        break
-
-                    # If we crossed a page, keep looking (the continuation might be after more chrome)
-                    if crossed_page:
-                        j += 1
-                        continue
+                    if current_incomplete and not crossed_page and page == blocks[j].get('page'):
+                        return j
 
                     # Not a continuation, stop looking
-                    break
+                    if not crossed_page:
+                        return None
+
+                    # We crossed a page: the continuation might be after more chrome
+                    # and text; jump to the next lowercase start or stop
+                    j = next_after_page[j + 1]
+                    while j < n and kinds[j] == 'text' and j in consumed:
+                        j = next_after_page[j + 1]
+                    return j if j < n and kinds[j] == 'text' else None
+
+            # Unknown block type, stop looking
+            elif kind == 'other':
+                return None
+
+            j += 1
+
+        return None
+
+    def find_next_in_chain(last: int) -> int | None:
+        """Next lowercase-start block after the last one joined, or None."""
+        metadata = False
+        j = last + 1
+        while j < n:
+            kind = kinds[j]
+            if kind == 'metadata_header':
+                metadata = True
+            elif kind == 'page':
+                metadata = False
+            elif kind == 'text':
+                # Skip blocks already consumed and text in metadata sections
+                if j not in consumed and not metadata:
+                    return j if continues[j] else None
+            elif kind != 'skip':
+                # Hit a real section boundary or unknown block type, stop
+                return None
+            j += 1
+        return None
+
+    result = []
+    for i, block in enumerate(blocks):
+        if i in consumed:
+            continue
 
-                # Unknown block type, stop looking
-                break
+        if block.get('block_type', '') in ('Text', 'Caption'):
+            text = texts[i]
+            continuation_idx = find_continuation(i, is_incomplete_sentence(text))
 
             if continuation_idx is not None:
-                continuation_text = extract_text(blocks[continuation_idx].get('html', ''), preserve_math=True)
-                joined_text = text + ' ' + continuation_text
+                joined_text = text + ' ' + texts[continuation_idx]
                 consumed.add(continuation_idx)
 
                 # Keep joining if the result is still incomplete and there are more continuations
                 # This handles chains like: "text," + "more text with a" + "continuation."
                 while is_incomplete_sentence(joined_text):
-                    # Look for another continuation starting after the last one we consumed
-                    next_j = continuation_idx + 1
-                    next_continuation_idx = None
-                    next_crossed_page = crossed_page
-                    next_in_metadata_section = in_metadata_section
-
-                    while next_j < len(blocks):
-                        next_block = blocks[next_j]
-                        next_bt = next_block.get('block_type', '')
-
-                        if next_bt == 'SectionHeader':
-                            next_text_check = extract_text(next_block.get('html', ''))
-                            if any(meta in next_text_check.lower().strip() for meta in METADATA_SECTIONS):
-                                next_in_metadata_section = True
-                                next_j += 1
-                                continue
-                            # Hit a real section boundary, stop
-                            break
-
-                        if next_bt in SKIP_BLOCK_TYPES:
-                            if next_bt in ['PageHeader', 'PageFooter']:
-                                next_crossed_page = True
-                                next_in_metadata_section = False
-                            next_j += 1
-                            continue
-
-                        if next_bt in ['Text', 'Caption']:
-                            # Skip blocks already consumed
-                            if next_j in consumed:
-                                next_j += 1
-                                continue
-
-                            if next_in_metadata_section:
-                                next_j += 1
-                                continue
-
-                            next_text_candidate = extract_text(next_block.get('html', ''), preserve_math=True)
-
-                            if is_sentence_continuation(next_text_candidate):
-                                next_continuation_idx = next_j
-                                break
-
-                            # Not a continuation, stop looking
-                            break
-
-                        # Unknown block type
-                        break
-
-                    if next_continuation_idx is not None:
-                        next_continuation_text = extract_text(blocks[next_continuation_idx].get('html', ''), preserve_math=True)
-                        joined_text = joined_text + ' ' + next_continuation_text
-                        consumed.add(next_continuation_idx)
-                        continuation_idx = next_continuation_idx
-                        crossed_page = next_crossed_page
-                        in_metadata_section = next_in_metadata_section
-                    else:
-                        # No more continuations found
+                    continuation_idx = find_next_in_chain(continuation_idx)
+                    if continuation_idx is None:
                         break
+                    joined_text = joined_text + ' ' + texts[continuation_idx]
+                    consumed.add(continuation_idx)
 
                 new_block = block.copy()
                 new_block['html'] = f'<p>{joined_text}</p>'
                 new_block['_joined'] = True
                 result.append(new_block)
-                i += 1
                 continue
 
         result.append(block)
-        i += 1
 
     return result
 
@@ -600,8 +663,9 @@ def parse_blocks(json_path: Path, images_dir: Path | None = None) -> dict:
                 figure_entry['description_html'] = str(desc_div)
 
             # Extract and save images from the block's 'images' dict
+            # (base64 in older files, image store references since batch_extract stores them)
             block_images = block.get('images', {})
-            for img_filename, img_base64 in block_images.items():
+            for img_filename, img_payload in block_images.items():
                 if images_dir:
                     images_dir.mkdir(parents=True, exist_ok=True)
                     # Use figure_id prefix for cleaner filenames
@@ -609,7 +673,7 @@ def parse_blocks(json_path: Path, images_dir: Path | None = None) -> dict:
                     saved_filename = f"{figure_id}{ext}"
                     img_path = images_dir / saved_filename
                     try:
-                        img_data = base64.b64decode(img_base64)
+                        img_data = read_image_payload(img_payload)
                         with open(img_path, 'wb') as img_file:
                             img_file.write(img_data)
                         figure_entry['images'].append(saved_filename)
@@ -860,7 +924,9 @@ def parse_blocks(json_path: Path, images_dir: Path | None = None) -> dict:
         'warnings': warnings,
     }
 
-    return result
+    # Data URIs from Datalab files saved before the image store go to the store too,
+    # so _parsed.json never carries image payloads
+    return externalize_document(result)
 
 
 def main():
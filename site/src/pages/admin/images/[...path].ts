@@ -5,6 +5,9 @@ import path from "node:path";
 export const prerender = false;
 
 const IMAGES_BASE = "/Users/jd/Projects/pda/cache/articles/ready/images";
+// Content-addressed store: _store/{sha256}.{ext} lives at {sha256[:2]}/{sha256}.{ext}
+const STORE_BASE = "/Users/jd/Projects/pda/cache/images";
+const STORE_FILE = /^_store\/([0-9a-f]{2})([0-9a-f]{62}\.[a-z0-9]+)$/;
 
 // MIME types for common image formats
 const MIME_TYPES: Record<string, string> = {
@@ -28,11 +31,15 @@ export const GET: APIRoute = async ({ params }) => {
   }
 
   // Construct full path and validate it's within the images directory
-  const fullPath = path.join(IMAGES_BASE, imagePath);
+  const storeMatch = imagePath.match(STORE_FILE);
+  const base = storeMatch ? STORE_BASE : IMAGES_BASE;
+  const fullPath = storeMatch
+    ? path.join(STORE_BASE, storeMatch[1], storeMatch[1] + storeMatch[2])
+    : path.join(IMAGES_BASE, imagePath);
   const normalizedPath = path.normalize(fullPath);
 
   // Security: ensure path doesn't escape the images directory
-  if (!normalizedPath.startsWith(IMAGES_BASE)) {
+  if (!normalizedPath.startsWith(base)) {
     return new Response("Invalid path", { status: 403 });
   }
 
@@ -51,7 +58,8 @@ export const GET: APIRoute = async ({ params }) => {
       status: 200,
       headers: {
         "Content-Type": contentType,
-        "Cache-Control": "public, max-age=3600",
+        // Store files are named by content hash and never change
+        "Cache-Control": storeMatch ? "public, max-age=31536000, immutable" : "public, max-age=3600",
       },
     });
   } catch (error) {
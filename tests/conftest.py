@@ -212,6 +212,36 @@ def cached_pdf(tmp_path):
         pytest.skip("Real PDF not available for extraction tests")
 
 
+@pytest.fixture
+def make_pdf(tmp_path):
+    """
+    Factory for small generated PDFs with real text layers.
+
+    make_pdf(pages) writes a PDF with two paragraphs per page and returns
+    its path. Enough words to pass TOOSHORT from 2 pages up.
+    """
+    import fitz
+
+    def _make(pages: int = 3, name: str = "generated.pdf") -> Path:
+        doc = fitz.open()
+        for number in range(1, pages + 1):
+            page = doc.new_page()
+            body = (
+                f"Page {number} discusses demand avoidance and anxiety in children. "
+                "Clinicians describe the profile using observations from school and home. "
+                "Parents report that everyday requests can trigger strong reactions.\n\n"
+                f"A second paragraph on page {number} covers assessment approaches, "
+                "including interviews, questionnaires and structured observation."
+            )
+            page.insert_textbox(fitz.Rect(72, 72, 540, 770), body, fontsize=11)
+        path = tmp_path / name
+        doc.save(path)
+        doc.close()
+        return path
+
+    return _make
+
+
 @pytest.fixture
 def sample_text():
     """Sample English text for chunking and glossary tests."""
@@ -240,6 +270,25 @@ Eighth paragraph covering educational approaches and
 school exclusion prevention."""
 
 
+@pytest.fixture(autouse=True)
+def isolated_extraction_store(tmp_path, monkeypatch):
+    """Point the on-disk extraction store at a per-test directory."""
+    from mcp_server import extraction_store
+    store = extraction_store.ExtractionStore(root=tmp_path / "extractions")
+    monkeypatch.setattr(extraction_store, "_store", store)
+    return store
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_lemma_cache(tmp_path_factory):
+    """Keep the glossary lemma cache out of the working tree, shared by the session."""
+    from mcp_server import glossary
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(glossary, "LEMMA_CACHE_PATH", tmp_path_factory.mktemp("glossary") / "glossary_lemmas.json")
+        mp.setattr(glossary, "_glossary", None)
+        yield
+
+
 @pytest.fixture
 def clear_chunk_cache():
     """Clear the chunk cache before and after test."""
@@ -262,6 +262,47 @@ class TestTaxonomy:
         assert "SENTMIS" in blocking
         assert "WORDMIS" in blocking
 
+    def test_flag_lookup_table(self):
+        """Each flag code should map to its category, severity and description."""
+        from mcp_server.taxonomy import get_taxonomy
+
+        taxonomy = get_taxonomy()
+
+        sentmis = taxonomy.get_flag("SENTMIS")
+        assert sentmis.category == "automated"
+        assert sentmis.severity == "blocking"
+        assert "Sentence count" in sentmis.description
+
+        paywall = taxonomy.get_flag("PAYWALL")
+        assert paywall.category == "access"
+        assert paywall.severity is None
+
+        assert taxonomy.get_flag("INVALID_FLAG") is None
+        assert taxonomy.get_flag_description("INVALID_FLAG") == ""
+        assert "TERMMIS" in taxonomy.get_warning_flags()
+        assert taxonomy.get_blocking_flags() <= taxonomy.get_all_flag_codes()
+
+    def test_reload_rebuilds_lookup_tables(self, tmp_path):
+        """reload() should pick up edited values and flags."""
+        from mcp_server.taxonomy import Taxonomy, TAXONOMY_PATH
+
+        path = tmp_path / "taxonomy.yaml"
+        path.write_text(TAXONOMY_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+        taxonomy = Taxonomy(path)
+        assert not taxonomy.is_valid_flag("NEWFLAG")
+
+        path.write_text(
+            path.read_text(encoding="utf-8").replace(
+                "  content:\n",
+                "  content:\n    NEWFLAG:\n      description: Added flag\n",
+            ),
+            encoding="utf-8",
+        )
+        taxonomy.reload()
+
+        assert taxonomy.is_valid_flag("NEWFLAG")
+        assert taxonomy.get_flag_description("NEWFLAG") == "Added flag"
+
 
 class TestDatabase:
     """Tests for database operations."""
@@ -303,3 +344,196 @@ class TestDatabase:
         # Cleanup
         deleted = db_with_articles.cleanup_expired_tokens()
         assert deleted >= 1
+
+
+class TestConnectionPool:
+    """Tests for WAL mode and pooled per-thread connections."""
+
+    def test_connections_use_wal_and_pragmas(self, db_with_articles):
+        """Connections should be tuned for concurrent access."""
+        from mcp_server.database import BUSY_TIMEOUT_MS
+
+        conn = db_with_articles._get_conn()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == BUSY_TIMEOUT_MS
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_reads_not_blocked_by_open_write(self, db_with_articles):
+        """A reader on another thread should see committed data mid-write."""
+        import threading
+
+        db_with_articles.execute(
+            "UPDATE articles SET processing_status = 'in_progress' WHERE id = 'test-article-1'"
+        )
+        assert db_with_articles._get_conn().in_transaction
+
+        seen = {}
+
+        def reader():
+            row = db_with_articles.get_article_by_id("test-article-1")
+            seen["status"] = row["processing_status"]
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert seen["status"] == "pending"  # Last committed value
+        db_with_articles.rollback()
+
+    def test_threads_get_own_connection_and_return_it(self, db_with_articles):
+        """Each thread borrows its own connection; it returns to the pool on exit."""
+        import gc
+        import threading
+
+        main_conn = db_with_articles._get_conn()
+        borrowed = []
+
+        def worker():
+            borrowed.append(db_with_articles._get_conn())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        assert borrowed[0] is not main_conn
+        assert db_with_articles._pool.idle_count() == 1
+
+
+class TestQueryPlans:
+    """Query-plan regression tests: hot queries must stay on their indexes."""
+
+    def _plans_for(self, db, call):
+        """Run call(), then EXPLAIN QUERY PLAN every SELECT, UPDATE and DELETE it issued."""
+        statements = []
+        conn = db._get_conn()
+        conn.set_trace_callback(statements.append)
+        try:
+            call()
+        finally:
+            conn.set_trace_callback(None)
+
+        # The trace callback gives the SQL with its parameters expanded
+        queries = [
+            sql for sql in statements
+            if sql.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE"))
+        ]
+        assert queries, "call issued no queries"
+        return {
+            sql: [row["detail"] for row in db.execute("EXPLAIN QUERY PLAN " + sql).fetchall()]
+            for sql in queries
+        }
+
+    def _assert_indexed(self, plans):
+        for sql, details in plans.items():
+            for detail in details:
+                # "SCAN articles" is a full table scan; "SCAN ... USING COVERING INDEX" is not
+                assert not (detail.startswith("SCAN") and "INDEX" not in detail), (sql, detail)
+                assert "TEMP B-TREE FOR ORDER BY" not in detail, (sql, detail)
+
+    def test_get_next_article_uses_index(self, db_with_articles):
+        """Both the in_progress and pending lookups should search the status index."""
+        plans = self._plans_for(db_with_articles, db_with_articles.get_next_article)
+
+        self._assert_indexed(plans)
+        assert all(
+            any("idx_articles_status_created" in d for d in details)
+            for details in plans.values()
+        )
+
+        # The claim UPDATE looks up in_progress, then pending, in two subqueries
+        [claim] = [details for sql, details in plans.items() if sql.lstrip().upper().startswith("UPDATE")]
+        searches = [d for d in claim if d.startswith("SEARCH articles USING INDEX idx_articles_status_created")]
+        assert sum(d.startswith("SCALAR SUBQUERY") for d in claim) == 2
+        assert len(searches) == 2
+
+    def test_pending_iteration_uses_index(self, db_with_articles):
+        """Prefetch candidate selection should search the status index."""
+        plans = self._plans_for(db_with_articles, lambda: list(db_with_articles.iter_pending_articles()))
+        self._assert_indexed(plans)
+
+    def test_get_progress_uses_covering_index(self, db_with_articles):
+        """Status counts should be computed from the index, not the table."""
+        plans = self._plans_for(db_with_articles, db_with_articles.get_progress)
+
+        self._assert_indexed(plans)
+        assert any("COVERING INDEX" in d for details in plans.values() for d in details)
+
+    def test_batch_job_events_use_index(self, db_with_articles):
+        """Latest events for a job should search (job_id, timestamp) without sorting."""
+        plans = self._plans_for(db_with_articles, lambda: db_with_articles.get_batch_job_events("job-1"))
+        self._assert_indexed(plans)
+
+    def test_validation_tokens_article_index_exists(self, db_with_articles):
+        """Token lookups by article should have a supporting index."""
+        plan = db_with_articles.execute(
+            "EXPLAIN QUERY PLAN SELECT token FROM validation_tokens WHERE article_id = ?",
+            ("test-article-1",)
+        ).fetchall()
+        assert "idx_validation_tokens_article" in plan[0]["detail"]
+
+
+class TestTracing:
+    """Tests for tool-call spans and latency metrics."""
+
+    def test_preview_is_bounded_for_large_values(self):
+        """Previews of huge results stay short."""
+        from mcp_server.tracing import PREVIEW_CHARS, preview
+
+        result = {"text": "x" * 5_000_000, "chunks": ["para"] * 10_000, "complete": False}
+        text = preview(result)
+
+        assert len(text) <= PREVIEW_CHARS + 3
+        assert text.startswith("{")
+
+    def test_lazy_preview_not_rendered_when_filtered(self, monkeypatch):
+        """LazyPreview does no work unless the log record is emitted."""
+        import logging
+        from mcp_server import tracing
+
+        calls = []
+        monkeypatch.setattr(tracing, "preview", lambda value, limit=200: calls.append(1) or "")
+        log = logging.getLogger("test.tracing.lazy")
+        log.setLevel(logging.WARNING)
+
+        log.info("result=%s", tracing.LazyPreview({"big": "value"}))
+
+        assert calls == []
+
+    def test_percentiles(self):
+        """p50/p95/p99 use nearest rank over the recent window."""
+        from mcp_server.tracing import ToolMetrics
+
+        metrics = ToolMetrics()
+        for ms in range(1, 101):
+            metrics.record("get_chunk", ms / 1000)
+        metrics.record("save_article", 0.5, ok=False)
+
+        snapshot = metrics.snapshot()["tools"]
+        assert snapshot["get_chunk"]["count"] == 100
+        assert snapshot["get_chunk"]["p50_ms"] == 50
+        assert snapshot["get_chunk"]["p95_ms"] == 95
+        assert snapshot["get_chunk"]["p99_ms"] == 99
+        assert snapshot["get_chunk"]["max_ms"] == 100
+        assert snapshot["save_article"]["errors"] == 1
+
+    def test_spans_written_as_jsonl(self, tmp_path):
+        """Each recorded call becomes one JSON line."""
+        import json
+        from mcp_server.tracing import Tracer
+
+        tracer = Tracer(path=tmp_path / "trace.jsonl", enabled=True)
+        tracer.record("get_chunk", 1700000000.0, 0.0123, ("art-1", 2), {}, result={"text": "y" * 10_000})
+        tracer.record("save_article", 1700000001.0, 0.5, (), {"article_id": "a"}, error=ValueError("bad"))
+        tracer.close()
+
+        spans = [json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()]
+        assert [s["tool"] for s in spans] == ["get_chunk", "save_article"]
+        assert spans[0]["duration_ms"] == 12.3
+        assert spans[0]["ok"] is True
+        assert len(spans[0]["result"]) < 300
+        assert spans[1]["ok"] is False
+        assert spans[1]["error"] == "ValueError: bad"
+
@@ -236,6 +236,64 @@ class TestPdfExtraction:
         assert path is not None
         assert path.exists()
 
+    def test_parallel_mode_matches_serial(self, make_pdf):
+        """The extractor race picks the same result as the serial chain."""
+        from mcp_server.pdf_extraction import extract_article_text
+
+        pdf_path = make_pdf(pages=4)
+
+        serial = extract_article_text(pdf_path, parallel=False)
+        parallel = extract_article_text(pdf_path, parallel=True)
+
+        assert serial.usable is True
+        assert parallel.extractor_used == serial.extractor_used
+        assert parallel.text == serial.text
+        assert parallel.problems == serial.problems
+
+    def test_parallel_mode_respects_timeouts(self, make_pdf):
+        """Extractors that exceed their timeout are treated as failed."""
+        from mcp_server.pdf_extraction import extract_article_text
+
+        pdf_path = make_pdf(pages=2)
+        timeouts = {"pymupdf": 0, "pdfminer": 0, "pdfplumber": 0}
+
+        result = extract_article_text(pdf_path, parallel=True, timeouts=timeouts)
+
+        assert result.usable is False
+        assert result.problems == ["PDFEXTRACT"]
+
+    def test_page_parallel_pymupdf_matches_single_process(self, make_pdf, monkeypatch):
+        """Sharded PyMuPDF conversion yields the same Markdown, in page order."""
+        import os
+        from mcp_server.pdf_extraction import extract_pymupdf
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)  # Shard even on 1-CPU runners
+        pdf_path = make_pdf(pages=9)
+
+        single = extract_pymupdf(pdf_path, min_pages=10**6)
+        sharded = extract_pymupdf(pdf_path, min_pages=2, max_workers=3)
+
+        assert sharded == single
+        assert single.index("Page 1 ") < single.index("Page 9 ")
+
+    def test_pymupdf_sharding_is_gated(self, make_pdf, monkeypatch):
+        """Without the layout engine, or with shard_pages=False, no pool is started."""
+        import multiprocessing
+        import os
+        from mcp_server import pdf_extraction
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("sharding should be off")
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        monkeypatch.setattr(multiprocessing, "get_context", no_pool)
+        pdf_path = make_pdf(pages=4)
+
+        assert "Page 4 " in pdf_extraction.extract_pymupdf(pdf_path, min_pages=2, shard_pages=False)
+
+        monkeypatch.setattr(pdf_extraction, "_layout_engine_installed", lambda: False)
+        assert "Page 4 " in pdf_extraction.extract_pymupdf(pdf_path, min_pages=2)
+
     def test_get_cached_path_not_found(self):
         """Should return None when no cached file."""
         from mcp_server.pdf_extraction import get_cached_path
@@ -338,13 +396,66 @@ class TestGlossary:
             entry = glossary.get_entry(term["en"])
             assert entry is not None
 
+    def test_matcher_equivalent_to_regex_scan(self):
+        """Single-pass matcher should return exactly what a per-term regex scan does."""
+        import re
+        from mcp_server.glossary import get_glossary
+
+        glossary = get_glossary()
+
+        def regex_scan(text):
+            normalized = glossary._normalize(text)
+            matches = {}
+            for term, entry in glossary._index.items():
+                if re.search(r'\b' + re.escape(term) + r'\b', normalized):
+                    matches.setdefault(entry["en"], entry["fr"])
+            return matches
+
+        texts = [
+            "Children with Pathological Demand Avoidance (PDA) show demand-avoidance.",
+            "The child showed inattention; autistic traits and an autism spectrum profile.",
+            "PDA profile,PDA presentation and mood lability / mood swings at school.",
+            "Extreme Demand Avoidance (EDA)x and need-for-control in   spaced\ntext.",
+            "",
+            " ".join(list(glossary._index.keys())[::7]),
+        ]
+        for text in texts:
+            assert list(glossary.find_terms_in_text(text).items()) == list(regex_scan(text).items())
+
+    def test_finds_overlapping_terms(self):
+        """A term nested inside a longer term should also be reported."""
+        from mcp_server.glossary import find_glossary_terms_in_text
+
+        terms = find_glossary_terms_in_text("Pathological demand avoidance is discussed.")
+
+        assert "demand avoidance" in terms
+
+    def test_reload_rebuilds_matcher(self, tmp_path):
+        """reload() should pick up terms added to the YAML file."""
+        from mcp_server.glossary import Glossary
+
+        path = tmp_path / "glossary.yaml"
+        path.write_text('version: "2025-01-01"\ncore_terms:\n  - en: masking\n    fr: camouflage\n')
+        glossary = Glossary(path)
+        assert glossary.find_terms_in_text("social masking and burnout") == {"masking": "camouflage"}
+
+        path.write_text(
+            'version: "2025-01-02"\ncore_terms:\n  - en: masking\n    fr: camouflage\n'
+            '  - en: autistic burnout\n    fr: épuisement autistique\n'
+        )
+        glossary.reload()
+        assert glossary.find_terms_in_text("masking and autistic burnout") == {
+            "masking": "camouflage",
+            "autistic burnout": "épuisement autistique",
+        }
+
 
 class TestChunking:
     """Tests for text chunking logic."""
 
     def test_splits_on_paragraphs(self, sample_text):
         """Should split text into chunks based on paragraphs."""
-        from mcp_server.tools import _split_into_chunks
+        from mcp_server.extraction_store import _split_into_chunks
 
         chunks = _split_into_chunks(sample_text, target_paragraphs=4)
 
@@ -355,7 +466,7 @@ class TestChunking:
 
     def test_respects_target_paragraphs(self, sample_text):
         """Should create chunks with approximately target paragraph count."""
-        from mcp_server.tools import _split_into_chunks
+        from mcp_server.extraction_store import _split_into_chunks
 
         chunks = _split_into_chunks(sample_text, target_paragraphs=2)
 
@@ -364,7 +475,7 @@ class TestChunking:
 
     def test_handles_long_paragraphs(self):
         """Should split paragraphs exceeding 500 words."""
-        from mcp_server.tools import _split_into_chunks
+        from mcp_server.extraction_store import _split_into_chunks
 
         # Create a very long paragraph
         long_para = "This is a sentence with several words. " * 100  # ~700 words
@@ -378,7 +489,7 @@ class TestChunking:
 
     def test_empty_text_returns_empty(self):
         """Should handle empty or whitespace-only text."""
-        from mcp_server.tools import _split_into_chunks
+        from mcp_server.extraction_store import _split_into_chunks
 
         chunks = _split_into_chunks("")
         assert chunks == []
@@ -438,6 +549,496 @@ class TestChunkCache:
         assert entry.extractor_used == "pymupdf"
         assert entry.extraction_problems == ["COLUMNJUMBLE", "NOREFSSECTION"]
 
+    @staticmethod
+    def _entry(text, age=None):
+        from datetime import datetime, timedelta
+        from mcp_server.tools import ChunkCacheEntry
+
+        return ChunkCacheEntry(
+            chunks=[text],
+            cached_at=datetime.now() - (age or timedelta(0)),
+            extractor_used="test",
+            extraction_problems=[],
+        )
+
+    def test_lru_eviction_over_byte_budget(self):
+        """Least recently used entries are evicted once over max_bytes."""
+        from datetime import timedelta
+        from mcp_server.tools import ChunkCache
+
+        cache = ChunkCache(max_bytes=2500, ttl=timedelta(hours=1))
+        cache["a"] = self._entry("a" * 1000)
+        cache["b"] = self._entry("b" * 1000)
+        cache.get("a")  # "b" is now least recently used
+        cache["c"] = self._entry("c" * 1000)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= 2500
+
+    def test_oversized_entry_is_kept(self):
+        """The entry just stored survives even if it alone exceeds the budget."""
+        from datetime import timedelta
+        from mcp_server.tools import ChunkCache
+
+        cache = ChunkCache(max_bytes=100, ttl=timedelta(hours=1))
+        cache["big"] = self._entry("x" * 1000)
+
+        assert cache.get("big") is not None
+
+    def test_sweep_removes_expired_entries(self):
+        """Expired entries are dropped by sweep() without being read."""
+        from datetime import timedelta
+        from mcp_server.tools import ChunkCache
+
+        cache = ChunkCache(max_bytes=10**6, ttl=timedelta(hours=1))
+        cache["stale"] = self._entry("old", age=timedelta(hours=2))
+        cache["fresh"] = self._entry("new")
+
+        assert cache.sweep() == 1
+        assert "stale" not in cache
+        assert "fresh" in cache
+        assert cache.stats()["bytes"] == ChunkCache._entry_size(self._entry("new"))
+
+    def test_hit_miss_counters(self):
+        """Lookups are counted as hits or misses."""
+        from datetime import timedelta
+        from mcp_server.tools import ChunkCache
+
+        cache = ChunkCache(max_bytes=10**6, ttl=timedelta(hours=1))
+        cache["a"] = self._entry("text")
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.667
+
+    def test_get_cache_stats_tool(self, clear_chunk_cache):
+        """The diagnostic tool reports chunk cache and extraction store usage."""
+        from mcp_server.tools import get_cache_stats, _set_cached_entry
+
+        _set_cached_entry("article-a", ["chunk"], "test", [])
+        stats = get_cache_stats()
+
+        assert stats["chunk_cache"]["entries"] == 1
+        assert stats["chunk_cache"]["bytes"] > 0
+        assert "evictions" in stats["chunk_cache"]
+        assert "max_bytes" in stats["extraction_store"]
+
+    def test_miss_is_not_counted_as_hit(self, db_with_articles, clear_chunk_cache, monkeypatch):
+        """A miss in get_chunk() serves the entry it stored, even if it is gone already."""
+        from datetime import timedelta
+        from mcp_server import tools
+        from mcp_server.pdf_extraction import CACHE_DIR
+
+        cache = tools.ChunkCache(max_bytes=1024 * 1024, ttl=timedelta(0))  # Entries expire at once
+        monkeypatch.setattr(tools, "_chunk_cache", cache)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = CACHE_DIR / "test-article-1.txt"
+        path.write_text("Only paragraph.", encoding="utf-8")
+        try:
+            result = tools.get_chunk("test-article-1", 1)
+        finally:
+            path.unlink(missing_ok=True)
+
+        assert result["text"] == "Only paragraph."
+        assert (cache.hits, cache.misses) == (0, 1)
+
+
+class TestExtractionStore:
+    """Tests for the persistent, content-addressed extraction store."""
+
+    def _write_source(self, text: str) -> Path:
+        from mcp_server.pdf_extraction import CACHE_DIR
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = CACHE_DIR / "test-article-1.txt"
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_reopen_after_clear_skips_extraction(self, db_with_articles, clear_chunk_cache, monkeypatch):
+        """After the in-memory cache is cleared, chunks come from the store."""
+        from mcp_server import extraction_store, tools
+
+        path = self._write_source("First paragraph here.\n\nSecond paragraph here.")
+        try:
+            first = tools.get_chunk("test-article-1", 1)
+            tools.clear_chunk_cache()
+
+            def fail(_path):
+                raise AssertionError("extract_article_text should not run")
+            monkeypatch.setattr(extraction_store, "extract_article_text", fail)
+
+            second = tools.get_chunk("test-article-1", 1)
+
+            assert second["text"] == first["text"]
+            assert tools._get_cached_entry("test-article-1") is not None
+        finally:
+            path.unlink(missing_ok=True)
+
+    def test_changed_source_is_re_extracted(self, db_with_articles, clear_chunk_cache):
+        """A different file gets a different key, so stale chunks are never served."""
+        from mcp_server import tools
+
+        path = self._write_source("Original paragraph.")
+        try:
+            tools.get_chunk("test-article-1", 1)
+            tools.clear_chunk_cache()
+
+            self._write_source("Replacement paragraph.")
+            result = tools.get_chunk("test-article-1", 1)
+
+            assert result["text"] == "Replacement paragraph."
+        finally:
+            path.unlink(missing_ok=True)
+
+    def test_key_depends_on_params(self, tmp_path, isolated_extraction_store):
+        """Chunking parameters are part of the key."""
+        source = tmp_path / "a.txt"
+        source.write_text("text", encoding="utf-8")
+
+        key_a = isolated_extraction_store.key_for(source, {"target_paragraphs": 4})
+        key_b = isolated_extraction_store.key_for(source, {"target_paragraphs": 2})
+
+        assert key_a != key_b
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Entries beyond the size budget are evicted oldest-first."""
+        import os
+        from mcp_server.extraction_store import ExtractionStore, StoredExtraction
+
+        store = ExtractionStore(root=tmp_path / "store", max_bytes=700)
+        entry = StoredExtraction(text="x" * 200, chunks=["x" * 50], extractor_used="t", extraction_problems=[])
+
+        store.put("old", entry)
+        os.utime(tmp_path / "store" / "old.json", (1, 1))
+        store.put("recent", entry)
+        os.utime(tmp_path / "store" / "recent.json", (2, 2))
+        store.get("old")  # Touch: "old" becomes most recently used
+        store.put("new", entry)
+
+        assert store.get("recent") is None
+        assert store.get("old") is not None
+        assert store.get("new") is not None
+        assert store.size_bytes() <= 700
+
+    def test_concurrent_puts_of_same_key(self, tmp_path):
+        """Writers racing on one entry each use their own temp file."""
+        import threading
+        from mcp_server.extraction_store import ExtractionStore, StoredExtraction
+
+        store = ExtractionStore(root=tmp_path / "store")
+        entry = StoredExtraction(text="x" * 100_000, chunks=["x" * 100_000], extractor_used="t", extraction_problems=[])
+        errors = []
+
+        def put():
+            try:
+                for _ in range(20):
+                    store.put("same", entry)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=put) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert store.get("same") == entry
+        assert [p.name for p in (tmp_path / "store").iterdir()] == ["same.json"]
+
+
+class TestPrefetch:
+    """Tests for background prefetch of upcoming article sources."""
+
+    def test_candidates_follow_queue_order_and_skip_cached(self, db_with_articles, tmp_path, monkeypatch):
+        """Only pending, open-access articles without a cached file are chosen."""
+        from mcp_server import pdf_extraction
+        from mcp_server.prefetch import select_prefetch_candidates
+
+        monkeypatch.setattr(pdf_extraction, "CACHE_DIR", tmp_path)
+        (tmp_path / "test-article-1.pdf").write_bytes(b"%PDF-1.4")
+
+        candidates = select_prefetch_candidates(count=5)
+
+        # article-1 is cached, article-3 is paywalled, 4 and 5 are not pending
+        assert [c["id"] for c in candidates] == ["test-article-2"]
+
+    def test_prefetch_respects_per_host_limit_and_warms_store(self, tmp_path, monkeypatch):
+        """Downloads run concurrently within per-host limits, then pre-extract."""
+        import asyncio
+        import threading
+        import time
+        from mcp_server import extraction_store, prefetch
+        from mcp_server.pdf_extraction import FetchResult
+
+        lock = threading.Lock()
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        def fake_fetch(article_id, url):
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.05)
+            with lock:
+                active[host] -= 1
+            path = tmp_path / f"{article_id}.txt"
+            path.write_text(f"Article {article_id} about demand avoidance. " * 40)
+            return FetchResult(success=True, path=path, error_code=None, error_message=None)
+
+        monkeypatch.setattr(prefetch, "fetch_and_cache", fake_fetch)
+        articles = [
+            {"id": f"a{i}", "source_url": f"https://host{i % 2}.example/{i}.pdf"}
+            for i in range(6)
+        ]
+
+        report = asyncio.run(prefetch.prefetch_articles(articles, concurrency=4, per_host=2))
+
+        assert sorted(report.extracted) == [f"a{i}" for i in range(6)]
+        assert max(peak.values()) <= 2
+
+        # The extraction store is warm: no re-extraction on first open
+        def fail(_path):
+            raise AssertionError("extract_article_text should not run")
+        monkeypatch.setattr(extraction_store, "extract_article_text", fail)
+        stored, _ = extraction_store.load_extraction(tmp_path / "a0.txt")
+        assert stored is not None
+
+    def test_prefetch_reports_fetch_failures(self, monkeypatch):
+        """Failed downloads are reported, not raised."""
+        import asyncio
+        from mcp_server import prefetch
+        from mcp_server.pdf_extraction import FetchResult
+
+        monkeypatch.setattr(
+            prefetch, "fetch_and_cache",
+            lambda article_id, url: FetchResult(False, None, "PAYWALL", "paywall"),
+        )
+        report = asyncio.run(prefetch.prefetch_articles([{"id": "x", "source_url": "https://h/x"}]))
+
+        assert report.failed == {"x": "PAYWALL"}
+        assert report.fetched == []
+
+    def test_failed_candidate_backs_off(self, db_with_articles, tmp_path, monkeypatch):
+        """A failed prefetch is not selected again until its backoff expires."""
+        from mcp_server import pdf_extraction, prefetch
+
+        monkeypatch.setattr(pdf_extraction, "CACHE_DIR", tmp_path)
+        (tmp_path / "test-article-1.pdf").write_bytes(b"%PDF-1.4")
+        monkeypatch.setattr(prefetch, "_failures", {})
+        now = [1000.0]
+        monkeypatch.setattr(prefetch.time, "monotonic", lambda: now[0])
+
+        prefetch.record_prefetch_report(prefetch.PrefetchReport(failed={"test-article-2": "PAYWALL"}))
+        assert prefetch.select_prefetch_candidates(count=5) == []
+
+        now[0] += prefetch.PREFETCH_RETRY_BASE + 1
+        assert [c["id"] for c in prefetch.select_prefetch_candidates(count=5)] == ["test-article-2"]
+
+        # A second failure waits twice as long
+        prefetch.record_prefetch_report(prefetch.PrefetchReport(failed={"test-article-2": "PAYWALL"}))
+        now[0] += prefetch.PREFETCH_RETRY_BASE + 1
+        assert prefetch.select_prefetch_candidates(count=5) == []
+
+
+class TestHotReload:
+    """Tests for watching and atomically reloading glossary/taxonomy files."""
+
+    GLOSSARY = 'version: "{version}"\ncore_terms:\n  - en: demand avoidance\n    fr: évitement des demandes\n'
+
+    @pytest.fixture
+    def tmp_glossary(self, tmp_path, monkeypatch):
+        from mcp_server import glossary
+
+        path = tmp_path / "glossary.yaml"
+        path.write_text(self.GLOSSARY.format(version="1.0"), encoding="utf-8")
+        monkeypatch.setattr(glossary, "_glossary", glossary.Glossary(path, lemma_cache_path=None))
+        return path
+
+    def test_watcher_reloads_after_change_settles(self, tmp_path):
+        """A change is acted on once it is seen unchanged on a second poll."""
+        from mcp_server.hot_reload import FileWatcher
+
+        path = tmp_path / "data.yaml"
+        path.write_text("a: 1\n")
+        calls = []
+        watcher = FileWatcher()
+        watcher.watch(path, lambda: calls.append(1))
+
+        assert watcher.poll() == []
+        path.write_text("a: 12\n")
+        assert watcher.poll() == []      # pending
+        assert watcher.poll() == [path]  # stable: reloaded
+        assert watcher.poll() == []
+        assert calls == [1]
+
+    def test_reload_swaps_glossary_and_version(self, tmp_glossary):
+        """get_glossary_version() reflects an edit without a restart."""
+        from mcp_server.glossary import get_glossary, get_glossary_version, reload_glossary
+
+        old = get_glossary()
+        tmp_glossary.write_text(self.GLOSSARY.format(version="2.0"), encoding="utf-8")
+        reload_glossary()
+
+        assert get_glossary_version() == "2.0"
+        assert get_glossary() is not old
+        assert old.version == "1.0"  # In-flight users of the old instance are unaffected
+
+    def test_failed_reload_keeps_previous_glossary(self, tmp_glossary):
+        """A broken edit is logged and the last good glossary keeps serving."""
+        from mcp_server.glossary import get_glossary, reload_glossary
+        from mcp_server.hot_reload import FileWatcher
+
+        old = get_glossary()
+        watcher = FileWatcher()
+        watcher.watch(tmp_glossary, reload_glossary)
+
+        tmp_glossary.write_text("core_terms: [unclosed\n", encoding="utf-8")
+        watcher.poll()
+        assert watcher.poll() == []
+
+        assert get_glossary() is old
+        assert get_glossary().find_terms_in_text("demand avoidance") == {
+            "demand avoidance": "évitement des demandes"
+        }
+
+    def test_reload_taxonomy_swaps_instance(self, monkeypatch):
+        """reload_taxonomy() replaces the singleton with a fresh load."""
+        from mcp_server import taxonomy
+
+        old = taxonomy.get_taxonomy()
+        monkeypatch.setattr(taxonomy, "_taxonomy", old)  # Restored after the test
+        fresh = taxonomy.reload_taxonomy()
+
+        assert taxonomy.get_taxonomy() is fresh
+        assert fresh is not old
+        assert fresh.methods == old.methods
+
+
+class TestLazyImports:
+    """Tests that heavy libraries stay out of server startup."""
+
+    def test_tools_import_skips_pdf_and_html_libraries(self):
+        """Importing tools and preprocessing should not load PDF or HTML parsers."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, mcp_server.tools, mcp_server.preprocessing, mcp_server.prefetch; "
+            "heavy = ['fitz', 'pymupdf4llm', 'pdfminer', 'pdfplumber', 'bs4', 'parse_article_blocks', 'spacy']; "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True,
+            cwd=Path(__file__).parent.parent,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
+
+    def test_startup_profile_reports_project_modules(self):
+        """The profile should attribute import time to individual modules."""
+        from mcp_server.startup_profile import format_profile, profile_imports
+
+        timings = profile_imports("mcp_server.tools")
+        names = {t.module for t in timings}
+
+        assert "mcp_server.tools" in names
+        assert "mcp_server.pdf_extraction" in names
+        report = format_profile(timings, "mcp_server.tools", top=5)
+        assert report.startswith("Import of mcp_server.tools:")
+
+
+class _FakeResponse:
+    """Stand-in for an HTTP response: serves body in reads, records read sizes."""
+
+    def __init__(self, body: bytes, content_type: str = "", content_length: bool = False):
+        self._body = body
+        self._pos = 0
+        self.reads = []
+        self.headers = {"Content-Type": content_type}
+        if content_length:
+            self.headers["Content-Length"] = str(len(body))
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        end = len(self._body) if size < 0 else self._pos + size
+        data = self._body[self._pos:end]
+        self._pos += len(data)
+        return data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestStreamingFetch:
+    """Offline tests for the streaming download in fetch_and_cache."""
+
+    def _fetch(self, monkeypatch, tmp_path, response, **kwargs):
+        from mcp_server import pdf_extraction
+
+        monkeypatch.setattr(pdf_extraction, "CACHE_DIR", tmp_path)
+        monkeypatch.setattr(pdf_extraction.urllib.request, "urlopen", lambda *a, **k: response)
+        return pdf_extraction.fetch_and_cache("stream-test", "https://example.org/paper", **kwargs)
+
+    def test_streams_pdf_into_cache(self, monkeypatch, tmp_path):
+        """A multi-block PDF is written intact, with no temp file left behind."""
+        from mcp_server.pdf_extraction import DOWNLOAD_BLOCK_SIZE
+
+        body = b"%PDF-1.4\n" + b"x" * (DOWNLOAD_BLOCK_SIZE * 3 + 17)
+        result = self._fetch(monkeypatch, tmp_path, _FakeResponse(body))
+
+        assert result.success is True
+        assert result.path == tmp_path / "stream-test.pdf"
+        assert result.path.read_bytes() == body
+        assert list(tmp_path.glob("*.part")) == []
+
+    def test_non_pdf_aborted_after_first_block(self, monkeypatch, tmp_path):
+        """A large HTML page is rejected without reading past the first block."""
+        from mcp_server.pdf_extraction import DOWNLOAD_BLOCK_SIZE
+
+        response = _FakeResponse(b"<html><body>" + b"a" * DOWNLOAD_BLOCK_SIZE * 20, "text/html")
+        result = self._fetch(monkeypatch, tmp_path, response)
+
+        assert result.error_code == "NOT_PDF"
+        assert sum(response.reads) <= DOWNLOAD_BLOCK_SIZE
+        assert list(tmp_path.iterdir()) == []
+
+    def test_paywall_detected_in_first_block(self, monkeypatch, tmp_path):
+        """Paywall markers in the first block map to PAYWALL."""
+        body = b"<html><body>Buy this article for $39.95</body></html>"
+        result = self._fetch(monkeypatch, tmp_path, _FakeResponse(body, "text/html"))
+
+        assert result.error_code == "PAYWALL"
+
+    def test_max_bytes_enforced_while_streaming(self, monkeypatch, tmp_path):
+        """Downloads over max_bytes fail and leave nothing in the cache."""
+        body = b"%PDF-1.4\n" + b"x" * 500_000
+        result = self._fetch(monkeypatch, tmp_path, _FakeResponse(body), max_bytes=200_000)
+
+        assert result.success is False
+        assert result.error_code == "FETCH_FAILED"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_max_bytes_checked_against_content_length(self, monkeypatch, tmp_path):
+        """A declared Content-Length over the limit fails before any read."""
+        response = _FakeResponse(b"%PDF-1.4\n" + b"x" * 500_000, content_length=True)
+        result = self._fetch(monkeypatch, tmp_path, response, max_bytes=200_000)
+
+        assert result.error_code == "FETCH_FAILED"
+        assert response.reads == []
+
 
 class TestFetchAndCache:
     """Tests for URL fetching and caching."""
@@ -524,3 +1125,507 @@ class TestFetchAndCache:
 
         assert result.success is False
         assert result.error_code in ("NOT_PDF", "PAYWALL")
+
+
+class TestParsedArticleStore:
+    """Tests for the in-memory store of {slug}_parsed.json documents."""
+
+    def _write(self, path, data):
+        import json
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_repeated_loads_decode_once(self, tmp_path, monkeypatch):
+        """An unchanged file is decoded on the first load only."""
+        import json
+        from mcp_server.parsed_store import ParsedArticleStore
+
+        path = tmp_path / "a_parsed.json"
+        self._write(path, {"title": "T"})
+        decodes = []
+        original_load = json.load
+        monkeypatch.setattr(json, "load", lambda f: (decodes.append(1), original_load(f))[1])
+
+        store = ParsedArticleStore()
+        for _ in range(5):
+            assert store.load(path)["title"] == "T"
+
+        assert len(decodes) == 1
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        """An edit from outside the server is picked up via mtime and size."""
+        import os
+        from mcp_server.parsed_store import ParsedArticleStore
+
+        path = tmp_path / "a_parsed.json"
+        self._write(path, {"title": "Old"})
+        store = ParsedArticleStore()
+        store.load(path)
+
+        self._write(path, {"title": "New title"})
+        os.utime(path, ns=(1, 1))
+
+        assert store.load(path)["title"] == "New title"
+
+    def test_save_writes_through(self, tmp_path):
+        """save() is on disk when it returns, with no temp file left behind."""
+        import json
+        from mcp_server.parsed_store import ParsedArticleStore
+
+        path = tmp_path / "a_parsed.json"
+        self._write(path, {"title": "Old"})
+        store = ParsedArticleStore()
+
+        data = store.load(path)
+        data["title"] = "New"
+        store.save(path, data)
+
+        assert json.loads(path.read_text(encoding="utf-8"))["title"] == "New"
+        assert store.load(path)["title"] == "New"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_save_refuses_to_overwrite_outside_edit(self, tmp_path):
+        """An edit made by the admin site after load() is not lost."""
+        import json
+        import os
+        import pytest
+        from mcp_server.parsed_store import ParsedArticleStore, StaleDocumentError
+
+        path = tmp_path / "a_parsed.json"
+        self._write(path, {"title": "Old"})
+        store = ParsedArticleStore()
+        data = store.load(path)
+
+        self._write(path, {"title": "Edited on the site"})
+        os.utime(path, ns=(1, 1))
+        data["title"] = "Edited by a tool"
+
+        with pytest.raises(StaleDocumentError):
+            store.save(path, data)
+
+        assert json.loads(path.read_text(encoding="utf-8"))["title"] == "Edited on the site"
+        assert store.load(path)["title"] == "Edited on the site"
+
+    def test_unsaved_changes_do_not_leak(self, tmp_path):
+        """Assigning keys on a loaded document does not change the cached one."""
+        from mcp_server.parsed_store import ParsedArticleStore
+
+        path = tmp_path / "a_parsed.json"
+        self._write(path, {"title": "T"})
+        store = ParsedArticleStore()
+
+        store.load(path)["title"] = "Changed but never saved"
+
+        assert store.load(path)["title"] == "T"
+
+    def test_move_leaves_nothing_behind(self, tmp_path):
+        """Moving an article to ready/ leaves nothing behind in cache/."""
+        import json
+        from mcp_server.parsed_store import ParsedArticleStore
+
+        path = tmp_path / "a_parsed.json"
+        ready = tmp_path / "ready"
+        ready.mkdir()
+        self._write(path, {"title": "T"})
+        store = ParsedArticleStore()
+        store.load(path)
+
+        store.move(path, ready / path.name, {"title": "Final"})
+
+        assert not path.exists()
+        assert json.loads((ready / path.name).read_text(encoding="utf-8")) == {"title": "Final"}
+        assert store.stats()["documents"] == 0
+
+    def test_confirm_tool_reports_outside_edit(self, tmp_path, monkeypatch):
+        """A confirm tool returns STALE_DOCUMENT instead of raising."""
+        import json
+        import os
+        from mcp_server import preprocessing
+        from mcp_server.parsed_store import ParsedArticleStore
+
+        path = tmp_path / "demo_parsed.json"
+        self._write(path, {"title": "T", "authors": "A", "year": "2020", "citation": "C", "abstract": "Abs"})
+        store = ParsedArticleStore()
+        monkeypatch.setattr(preprocessing, "CACHE_DIR", tmp_path)
+        monkeypatch.setattr(preprocessing, "get_parsed_store", lambda: store)
+
+        preprocessing.step4_check_fields("demo")
+
+        # The admin site saves while the tool is between its load and its save
+        original_load = store.load
+
+        def load_then_edit(load_path):
+            data = original_load(load_path)
+            self._write(path, {"title": "Edited on the site"})
+            os.utime(path, ns=(1, 1))
+            return data
+        monkeypatch.setattr(store, "load", load_then_edit)
+
+        result = preprocessing.step4_confirm_fields("demo", year="2021")
+
+        assert result["success"] is False
+        assert result["error"] == "STALE_DOCUMENT"
+        assert "step4_check_fields('demo')" in result["action"]
+        assert json.loads(path.read_text(encoding="utf-8")) == {"title": "Edited on the site"}
+        assert preprocessing._get_step4_state("demo")["fields"] is False
+
+
+class TestBodyModel:
+    """Tests for the cached paragraph model of body_html."""
+
+    BODY = (
+        '<h2>Method</h2>\n'
+        '<p>The children were assessed at <em>two</em> sites &amp; compared.</p>\n'
+        '<p>and this paragraph continues the previous one without a capital letter.</p>\n'
+        '<p>Figure 1 Distribution of scores</p>\n'
+        '<p>Scores differed, <span class="formula">F(1, 56) = 4.07</span>, and r = .67 overall.</p>\n'
+        '<ul><li>p &lt; .05 in one item</li></ul>'
+    )
+
+    def test_nodes_render_back_to_body(self):
+        """Concatenated node HTML is byte-identical to the original body."""
+        from mcp_server.body_model import BodyModel
+
+        model = BodyModel(self.BODY)
+
+        assert "".join(node.html for node in model.nodes) == self.BODY
+
+    def test_fixes_match_a_fresh_parse(self):
+        """A model updated by fixes equals a model parsed from the new HTML."""
+        from mcp_server.body_model import BodyModel
+
+        model = BodyModel(self.BODY)
+        fixed, changes = model.apply_fixes([
+            {"index": 2, "action": "join_previous"},
+            {"index": 3, "action": "delete"},
+            {"index": 5, "action": "replace", "text": "Item <b>one</b>"},
+        ])
+
+        assert changes == ["Replaced paragraph 5", "Deleted paragraph 3", "Joined paragraph 2 to 1"]
+        assert fixed.nodes == BodyModel(fixed.body_html).nodes
+        assert "&lt;b&gt;one&lt;/b&gt;" in fixed.body_html
+        assert "Figure 1" not in fixed.body_html
+
+    def test_join_orphans_keeps_inline_markup(self):
+        """Warning joins move children, so <em> and entities survive."""
+        from mcp_server.body_model import BodyModel
+
+        fixed, changes = BodyModel(self.BODY).join_orphans([{"index": 2, "action": "join_previous"}])
+
+        assert changes == ["Joined paragraph 2 to 1"]
+        assert "<em>two</em> sites &amp; compared. and this paragraph" in fixed.body_html
+        assert fixed.nodes == BodyModel(fixed.body_html).nodes
+
+    def test_join_orphans_skips_void_neighbours(self):
+        """Joins into or out of <br> and <img> are skipped, so no text is lost."""
+        from mcp_server.body_model import BodyModel
+
+        body = '<br><div>text after a break</div><p>Caption</p><img src="pda-image:abc.png"><p>and more</p>'
+        fixed, changes = BodyModel(body).join_orphans([
+            {"index": 1, "action": "join_previous"},
+            {"index": 3, "action": "join_previous"},
+            {"index": 4, "action": "join_previous"},
+        ])
+
+        assert changes == [
+            "SKIPPED: join 4 to 3, <img> is a void element",
+            "SKIPPED: join 3 to 2, <img> is a void element",
+            "SKIPPED: join 1 to 0, <br> is a void element",
+        ]
+        assert fixed.body_html == '<br/><div>text after a break</div><p>Caption</p><img src="pda-image:abc.png"/><p>and more</p>'
+
+    def test_chained_joins_keep_whitespace(self):
+        """Consecutive joins give the same HTML as editing the whole tree."""
+        from mcp_server.body_model import BodyModel
+
+        body = '<p>a b</p><p> x <em>y</em> </p><div> <b>q</b>\n</div>'
+        fixed, _ = BodyModel(body).join_orphans([
+            {"index": 1, "action": "join_previous"},
+            {"index": 2, "action": "join_previous"},
+        ])
+
+        assert fixed.body_html == '<p>a b  x <em>y</em>   <b>q</b>\n</p>'
+
+    def test_formula_spans_are_indexed(self):
+        """Existing formula spans are recorded per paragraph."""
+        from mcp_server.body_model import BodyModel
+
+        node = BodyModel(self.BODY).nodes[8]
+
+        assert node.tag == "p"
+        assert node.formulas == ("F(1, 56) = 4.07",)
+
+    def test_review_chunks_parse_body_once(self, tmp_path, monkeypatch):
+        """Paging through get_body_for_review() reuses one parsed model."""
+        import bs4
+        from mcp_server import body_model, preprocessing
+        from mcp_server.parsed_store import ParsedArticleStore
+
+        body = "".join(f"<p>Paragraph {i} is long enough to avoid fragment flags.</p>" for i in range(25))
+        self_path = tmp_path / "demo_parsed.json"
+        self_path.write_text(
+            '{"method": "empirical", "voice": "academic", "peer_reviewed": true, "body_html": "%s"}' % body,
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(preprocessing, "CACHE_DIR", tmp_path)
+        monkeypatch.setattr(preprocessing, "get_parsed_store", lambda: store)
+        store = ParsedArticleStore()
+        body_model.clear_body_models()
+
+        parses = []
+        original = bs4.BeautifulSoup.__init__
+        monkeypatch.setattr(
+            bs4.BeautifulSoup, "__init__",
+            lambda self, *args, **kwargs: (parses.append(1), original(self, *args, **kwargs))[1],
+        )
+
+        chunks = [preprocessing.get_body_for_review("demo", chunk) for chunk in range(3)]
+
+        assert [c["chunk_info"]["paragraphs_in_chunk"] for c in chunks] == [10, 10, 5]
+        assert chunks[2]["paragraphs"][0]["index"] == 20
+        assert len(parses) == 1
+
+
+class TestImageStore:
+    """Tests for the content-addressed image sidecar store."""
+
+    PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 40
+
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        from mcp_server import image_store
+
+        store = image_store.ImageStore(tmp_path / "images")
+        monkeypatch.setattr(image_store, "_store", store)
+        return store
+
+    def _b64(self, data: bytes) -> str:
+        import base64
+        return base64.b64encode(data).decode("ascii")
+
+    def test_same_bytes_stored_once(self, store):
+        """Images are named by content hash, so duplicates share one file."""
+        ref = store.put_base64(self._b64(self.PNG), "fig.png")
+
+        assert ref == store.put(self.PNG, "png")
+        assert ref.startswith("pda-image:") and ref.endswith(".png")
+        assert store.read(ref) == self.PNG
+        assert len(list(store.root.rglob("*.png"))) == 1
+
+    def test_block_html_points_at_store(self, store):
+        """Filename sources and inline data URIs become references."""
+        from mcp_server.image_store import externalize_html
+
+        html = (
+            '<p><img src="a.png"/> and <img src="data:image/png;base64,' + self._b64(self.PNG) + '"/>'
+            ' and <img src="other.jpg"/></p>'
+        )
+
+        result = externalize_html(html, {"a.png": self._b64(self.PNG)})
+
+        ref = store.put(self.PNG, "png")
+        assert result == f'<p><img src="{ref}"/> and <img src="{ref}"/> and <img src="other.jpg"/></p>'
+
+    def test_invalid_payload_stays_inline(self, store):
+        """A payload the store rejects is inlined, not raised, so the extraction is saved."""
+        from mcp_server.image_store import externalize_html, externalize_images
+
+        images = externalize_images({"bad.png": "not base64!"})
+        result = externalize_html('<img src="bad.png"/>', images)
+
+        assert images == {"bad.png": "not base64!"}
+        assert result == '<img src="data:image/png;base64,not base64!"/>'
+        assert not list(store.root.rglob("*.png"))
+
+    def test_resolver_round_trips_data_uri(self, store):
+        """Resolving a reference gives back the original data URI, or a URL."""
+        from mcp_server.image_store import SITE_URL_PREFIX, externalize_html, resolve_image_refs
+
+        original = '<img src="data:image/png;base64,' + self._b64(self.PNG) + '"/>'
+        html = externalize_html(original)
+
+        assert resolve_image_refs(html) == original
+        assert resolve_image_refs(html, SITE_URL_PREFIX).startswith('<img src="/admin/images/_store/')
+        assert resolve_image_refs("<p>No images</p>") == "<p>No images</p>"
+
+    def test_migration_shrinks_files(self, store, tmp_path):
+        """Migrating a cache file moves payloads out and is idempotent."""
+        import json
+        from mcp_server.image_store import migrate_file, read_image_payload
+
+        payload = self._b64(self.PNG)
+        doc = {"blocks": [{
+            "block_type": "Picture",
+            "html": f'<img src="data:image/png;base64,{payload}"/>',
+            "images": {"fig.png": payload},
+        }]}
+        path = tmp_path / "article.json"
+        path.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+
+        before, after = migrate_file(path)
+
+        assert after * 10 < before
+        block = json.loads(path.read_text(encoding="utf-8"))["blocks"][0]
+        assert read_image_payload(block["images"]["fig.png"]) == self.PNG
+        assert migrate_file(path) == (after, after)
+
+    def test_dry_run_leaves_file(self, store, tmp_path):
+        """--dry-run reports sizes without rewriting."""
+        from mcp_server.image_store import migrate_file
+
+        path = tmp_path / "article_parsed.json"
+        text = '{"body_html": "<img src=\\"data:image/png;base64,' + self._b64(self.PNG) + '\\"/>"}'
+        path.write_text(text, encoding="utf-8")
+
+        before, after = migrate_file(path, dry_run=True)
+
+        assert after < before
+        assert path.read_text(encoding="utf-8") == text
+
+
+class TestJoinSplitSentences:
+    """Tests for joining sentences split across page and column breaks."""
+
+    def _text(self, html, page=0, block_type="Text"):
+        return {"block_type": block_type, "html": html, "page": page}
+
+    def _join(self, blocks):
+        import mcp_server.preprocessing  # noqa: F401 — puts scripts/ on sys.path
+        from parse_article_blocks import join_split_sentences
+        return [b["html"] for b in join_split_sentences(blocks)]
+
+    def test_column_break_on_same_page(self):
+        """An incomplete sentence joins the next text block on its page."""
+        result = self._join([
+            self._text("<p>Anxiety was measured with the</p>"),
+            self._text("<p>Extreme Demand Avoidance Questionnaire.</p>"),
+        ])
+
+        assert result == ["<p>Anxiety was measured with the Extreme Demand Avoidance Questionnaire.</p>"]
+
+    def test_page_break_skips_chrome_and_other_text(self):
+        """Past a page break, the next lowercase start continues the sentence."""
+        import mcp_server.preprocessing  # noqa: F401 — puts scripts/ on sys.path
+        from parse_article_blocks import METADATA_SECTIONS
+
+        meta = sorted(METADATA_SECTIONS)[0]
+        result = self._join([
+            self._text("<p>Children avoided demands when</p>", page=0),
+            self._text("<p>12</p>", page=0, block_type="PageFooter"),
+            self._text("<p>Journal of Autism</p>", page=1, block_type="PageHeader"),
+            self._text("<p>Table 2 Scores</p>", page=1, block_type="Caption"),
+            self._text(f"<h3>{meta.title()}</h3>", page=1, block_type="SectionHeader"),
+            self._text("<p>and this belongs to the metadata section.</p>", page=1),
+            self._text("<p>Journal of Autism</p>", page=1, block_type="PageHeader"),
+            self._text("<p>Unrelated paragraph.</p>", page=1),
+            self._text("<p>anxious about losing control.</p>", page=1),
+        ])
+
+        assert result[0] == "<p>Children avoided demands when anxious about losing control.</p>"
+        assert "<p>Unrelated paragraph.</p>" in result
+        assert len(result) == 8
+
+    def test_section_header_is_a_boundary(self):
+        """Sentences are never joined across a section header."""
+        result = self._join([
+            self._text("<p>The results were</p>", page=0),
+            self._text("<h2>Discussion</h2>", page=0, block_type="SectionHeader"),
+            self._text("<p>consistent with earlier work.</p>", page=0),
+        ])
+
+        assert result[0] == "<p>The results were</p>"
+        assert len(result) == 3
+
+    def test_chained_continuations(self):
+        """Joining continues while the joined sentence is still incomplete."""
+        result = self._join([
+            self._text("<p>First part,</p>", page=0),
+            self._text("<p>footer</p>", page=0, block_type="PageFooter"),
+            self._text("<p>second part and</p>", page=1),
+            self._text("<p>third part.</p>", page=1),
+            self._text("<p>Next paragraph.</p>", page=1),
+        ])
+
+        assert result == ["<p>First part, second part and third part.</p>", "<p>footer</p>", "<p>Next paragraph.</p>"]
+
+
+class TestExtractText:
+    """Tests for the block parser's HTML-to-text fast path."""
+
+    # Block HTML as Datalab produces it, plus markup the fast path hands to BeautifulSoup
+    GOLDEN_CORPUS = [
+        '',
+        'plain text',
+        '<p block-type="Text">Children with PDA (n = 42) showed <i>higher</i> anxiety.</p>',
+        '<h2>Method</h2>',
+        '<p>Scores &amp; ratings &lt;5 &gt;2 &quot;q&quot; &apos;a&apos; &nbsp;x&#38;y&#x26;z &#150; &#x1F600;</p>',
+        '<p>A &amp B &copy; &foo; &#0; & done &</p>',
+        '<p>  spaced\n  <b> bold </b>\t</p>\n<p>\xa0</p>',
+        '<table><tr><td colspan=2>1</td><td class="n">2</td></tr></table>',
+        '<p><a href="x>y" title=\'t\'>link</a><br/>next<img src=x/>after</p>',
+        '<p>p < .05 and q > 1</p>',
+        '<p>a<!-- comment -->b<![CDATA[c]]></p><!DOCTYPE html><?pi?>',
+        '<p>a<script>var x = "<b>";</script><style>p {}</style>b</p>',
+        '<ruby>漢<rp>(</rp><rt>kan</rt><rp>)</rp></ruby>',
+        '<p>Unclosed <b>bold <i>italic</p></x> text',
+        '<p><math>\\chi^2 \\leq 3.84</math> and <math>\\alpha = .05</math></p>',
+        '<p>Literal __MATH_0__ and <math>\\beta</math></p>',
+    ]
+
+    def _reference(self, html, preserve_math=False):
+        """The BeautifulSoup implementation extract_text() must match."""
+        import re
+        from bs4 import BeautifulSoup
+
+        if not html:
+            return ''
+        math_tags = []
+        if preserve_math:
+            def save_math(match):
+                math_tags.append(match.group(0))
+                return f'__MATH_{len(math_tags) - 1}__'
+            html = re.sub(r'<math>.*?</math>', save_math, html)
+        text = BeautifulSoup(html, 'html.parser').get_text(strip=True)
+        for i, math_tag in enumerate(math_tags):
+            text = text.replace(f'__MATH_{i}__', math_tag)
+        return text
+
+    def test_matches_beautifulsoup_on_golden_corpus(self):
+        """Output is identical to BeautifulSoup's get_text(strip=True)."""
+        import mcp_server.preprocessing  # noqa: F401 — puts scripts/ on sys.path
+        from parse_article_blocks import extract_text
+
+        for html in self.GOLDEN_CORPUS:
+            for preserve_math in (False, True):
+                assert extract_text(html, preserve_math=preserve_math) == self._reference(html, preserve_math), html
+
+    def test_plain_markup_skips_beautifulsoup(self):
+        """Datalab's usual markup is handled without building a tree."""
+        import mcp_server.preprocessing  # noqa: F401 — puts scripts/ on sys.path
+        from parse_article_blocks import _fast_text
+
+        assert _fast_text(self.GOLDEN_CORPUS[2]) == "Children with PDA (n = 42) showedhigheranxiety."
+        assert _fast_text('<p>x &amp; y&#160;&#x3b1;</p>') == "x & y\xa0α"
+        assert _fast_text('<p>a<!-- comment -->b</p>') is None
+        assert _fast_text('<p>&copy; 2020 &#150;</p>') is None
+
+    def test_results_are_memoized(self):
+        """The same block HTML is converted once."""
+        import mcp_server.preprocessing  # noqa: F401 — puts scripts/ on sys.path
+        from parse_article_blocks import extract_text
+
+        extract_text.cache_clear()
+        extract_text('<p>Once</p>')
+        extract_text('<p>Once</p>')
+
+        assert extract_text.cache_info().hits == 1
+
+    def test_math_conversion_in_one_pass(self):
+        """All LaTeX commands in a formula are converted, longest name first."""
+        import mcp_server.preprocessing  # noqa: F401 — puts scripts/ on sys.path
+        from parse_article_blocks import convert_math_tags
+
+        html = '<p><math>\\beta \\eta \\leq \\timesx \\\\sum \\unknown</math> x <math>\\infty</math></p>'
+
+        assert convert_math_tags(html) == (
+            '<p><span class="formula">β η ≤ ×x \\Σ \\unknown</span> x <span class="formula">∞</span></p>'
+        )
@@ -718,3 +718,310 @@ class TestCombinedQualityChecks:
 
         assert "TERMMIS" in results.warning_flags
         assert len(results.glossary_missing) == 1
+
+
+class _FakeToken:
+    def __init__(self, word):
+        self.lemma_ = word
+        # Like the real French model, capitalized words come out as PROPN
+        self.pos_ = "PROPN" if word[:1].isupper() else "NOUN"
+
+
+class _FakeDoc(list):
+    @property
+    def sents(self):
+        return iter(range(max(1, sum(1 for t in self if t.lemma_.endswith(".")))))
+
+
+class _CountingNlp:
+    """Minimal stand-in for a spaCy pipeline that records each text it sees."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return _FakeDoc(_FakeToken(word) for word in text.split())
+
+    def pipe(self, texts, batch_size=None):
+        for text in texts:
+            yield self(text)
+
+
+GLOSSARY_YAML = """
+version: "1.0"
+core_terms:
+  - en: anxiety
+    fr: anxiété
+  - en: demand
+    fr: demandes
+    fr_alt: [exigences]
+  - en: child
+    fr: enfant
+"""
+
+
+@pytest.fixture
+def fake_nlp(tmp_path, monkeypatch):
+    """Patch quality_checks with counting pipelines and a temp glossary."""
+    from mcp_server import glossary, quality_checks
+
+    glossary_path = tmp_path / "glossary.yaml"
+    glossary_path.write_text(GLOSSARY_YAML, encoding="utf-8")
+    monkeypatch.setattr(
+        glossary, "_glossary",
+        glossary.Glossary(glossary_path, lemma_cache_path=tmp_path / "lemmas.json"),
+    )
+
+    nlp_en, nlp_fr = _CountingNlp(), _CountingNlp()
+    monkeypatch.setattr(
+        quality_checks, "get_pipeline",
+        lambda lang, task: nlp_en if lang == "en" else nlp_fr,
+    )
+    return nlp_en, nlp_fr
+
+
+class TestSingleParseAnalysis:
+    """Tests that each text is parsed once and shared across checks."""
+
+    def test_run_quality_checks_parses_each_text_once(self, fake_nlp):
+        """Source and translation go through spaCy once, plus one lowercased recall parse."""
+        from mcp_server.quality_checks import run_quality_checks
+
+        nlp_en, nlp_fr = fake_nlp
+        source = "The child avoids demands. Anxiety drives avoidance."
+        translation = "L'enfant évite les demandes. L'anxiété motive l'évitement."
+        glossary = {"anxiety": "anxiété", "demand": "demandes", "child": "enfant"}
+
+        run_quality_checks(source, translation, glossary, [])
+
+        assert nlp_en.calls == [source]
+        assert nlp_fr.calls.count(translation) == 1
+        assert nlp_fr.calls.count(translation.lower()) == 1
+
+    def test_capitalized_term_counts_toward_recall(self, fake_nlp):
+        """A sentence-initial glossary term is matched despite its capital."""
+        from mcp_server.quality_checks import check_glossary_recall
+
+        glossary = {"anxiety": "anxiété", "demand": "demandes", "child": "enfant"}
+
+        result = check_glossary_recall("", "Enfant et demandes en hausse. Anxiété partout.", glossary)
+
+        assert result.missing_expected == []
+        assert result.recall == 1.0
+
+
+class TestGlossaryLemmaCache:
+    """Tests for the precomputed, persisted glossary lemma table."""
+
+    def test_terms_lemmatized_once_in_bulk(self, fake_nlp):
+        """All fr and fr_alt terms are lemmatized together, once."""
+        from mcp_server.quality_checks import check_glossary_recall
+
+        _, nlp_fr = fake_nlp
+        glossary = {"anxiety": "anxiété", "demand": "demandes", "child": "enfant"}
+
+        check_glossary_recall("", "enfant anxiété demandes", glossary)
+        check_glossary_recall("", "enfant anxiété demandes", glossary)
+
+        for fr_term in ("anxiété", "demandes", "exigences", "enfant"):
+            assert nlp_fr.calls.count(fr_term) == 1
+
+    def test_lemmas_persisted_across_instances(self, fake_nlp, tmp_path):
+        """A new Glossary with the same version reads lemmas from disk."""
+        from mcp_server.glossary import Glossary
+
+        _, nlp_fr = fake_nlp
+        kwargs = {"lemma_cache_path": tmp_path / "lemmas.json"}
+
+        Glossary(tmp_path / "glossary.yaml", **kwargs).get_term_lemmas("enfant")
+        assert (tmp_path / "lemmas.json").exists()
+        nlp_fr.calls.clear()
+
+        lemmas = Glossary(tmp_path / "glossary.yaml", **kwargs).get_term_lemmas("enfant")
+
+        assert lemmas == frozenset({"enfant"})
+        assert nlp_fr.calls == []
+
+    def test_version_change_invalidates_cache(self, fake_nlp, tmp_path):
+        """Bumping the glossary version recomputes every term."""
+        from mcp_server.glossary import Glossary
+
+        _, nlp_fr = fake_nlp
+        glossary_path = tmp_path / "glossary.yaml"
+        kwargs = {"lemma_cache_path": tmp_path / "lemmas.json"}
+
+        Glossary(glossary_path, **kwargs).get_term_lemmas("enfant")
+        nlp_fr.calls.clear()
+
+        glossary_path.write_text(GLOSSARY_YAML.replace('"1.0"', '"1.1"'), encoding="utf-8")
+        Glossary(glossary_path, **kwargs).get_term_lemmas("enfant")
+
+        assert "enfant" in nlp_fr.calls
+
+    def test_suite_keeps_cache_out_of_working_tree(self):
+        """The shared glossary writes its lemma cache under the session's tmp dir."""
+        from mcp_server import glossary
+
+        assert glossary.get_glossary()._lemma_cache_path == glossary.LEMMA_CACHE_PATH
+        assert glossary.PROJECT_ROOT not in glossary.LEMMA_CACHE_PATH.parents
+
+
+class TestModelRegistry:
+    """Tests for the shared, task-pruned spaCy model registry."""
+
+    @staticmethod
+    def _blank_loader(calls):
+        import spacy
+
+        def loader(model, exclude):
+            calls.append((model, tuple(exclude)))
+            return spacy.blank(model[:2])
+        return loader
+
+    def test_loads_each_language_once_with_exclusions(self):
+        """A language's tasks share one model, loaded without parser or NER."""
+        from mcp_server.nlp_models import ModelRegistry, TASK_ANALYSIS, TASK_LEMMAS, TASK_SENTENCES
+
+        calls = []
+        registry = ModelRegistry(loader=self._blank_loader(calls))
+
+        sentences = registry.get("en", TASK_SENTENCES)
+        assert sentences is registry.get("en", TASK_SENTENCES)
+        lemmas = registry.get("en", TASK_LEMMAS)
+        registry.get("en", TASK_ANALYSIS)
+
+        assert calls == [("en_core_web_sm", ("parser", "ner"))]
+        assert lemmas.nlp is sentences.nlp
+
+    def test_tasks_skip_components_per_call(self):
+        """A task runs only its components, without changing the shared model."""
+        from mcp_server.nlp_models import ModelRegistry, TASK_ANALYSIS, TASK_LEMMAS
+
+        registry = ModelRegistry(loader=self._blank_loader([]))
+        lemmas = registry.get("en", TASK_LEMMAS)
+        analysis = registry.get("en", TASK_ANALYSIS)
+
+        assert "sentencizer" not in registry.stats()[0]["components"]
+        assert not lemmas("One sentence here. Another one there.").has_annotation("SENT_START")
+        assert len(list(analysis("One sentence here. Another one there.").sents)) == 2
+        assert [doc.has_annotation("SENT_START") for doc in lemmas.pipe(["A b. C d."])] == [False]
+        assert lemmas.nlp.disabled == []
+
+    def test_sentences_pipeline_segments_text(self):
+        """The sentence task splits sentences even without a trained senter."""
+        from mcp_server.nlp_models import ModelRegistry, TASK_SENTENCES
+
+        registry = ModelRegistry(loader=self._blank_loader([]))
+        nlp = registry.get("en", TASK_SENTENCES)
+
+        doc = nlp("One sentence here. Another one there.")
+
+        assert len(list(doc.sents)) == 2
+
+    def test_reports_throughput(self):
+        """Stats count docs and characters processed per task."""
+        from mcp_server.nlp_models import ModelRegistry, TASK_LEMMAS
+
+        registry = ModelRegistry(loader=self._blank_loader([]))
+        nlp = registry.get("fr", TASK_LEMMAS)
+        nlp("un texte")
+        list(nlp.pipe(["deux", "trois"]))
+
+        [stats] = registry.stats()
+        assert stats["lang"] == "fr"
+        assert stats["task"] == TASK_LEMMAS
+        assert stats["docs"] == 3
+        assert stats["chars"] == len("un texte") + len("deux") + len("trois")
+        assert "memory_mb" in stats
+
+    def test_missing_model_fails_fast(self):
+        """A missing model raises RuntimeError and is not retried."""
+        from mcp_server.nlp_models import ModelRegistry, TASK_SENTENCES
+
+        attempts = []
+
+        def loader(model, exclude):
+            attempts.append(model)
+            raise OSError("not installed")
+
+        registry = ModelRegistry(loader=loader)
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="python -m spacy download"):
+                registry.get("en", TASK_SENTENCES)
+
+        assert attempts == ["en_core_web_sm"]
+
+
+class TestWarmup:
+    """Tests for the background model and glossary warm-up."""
+
+    @pytest.fixture
+    def blank_registry(self, monkeypatch):
+        """Registry backed by blank spaCy models, all reported as installed."""
+        import threading
+        import time
+        import spacy
+        from mcp_server import glossary, nlp_models, warmup
+
+        loads = []
+        lock = threading.Lock()
+
+        def loader(model, exclude):
+            with lock:
+                loads.append(model)
+            time.sleep(0.05)  # Give concurrent callers a chance to race
+            return spacy.blank(model[:2])
+
+        registry = nlp_models.ModelRegistry(loader=loader)
+        monkeypatch.setattr(nlp_models, "_registry", registry)
+        monkeypatch.setattr(warmup, "is_model_installed", lambda lang: True)
+        monkeypatch.setattr(
+            glossary, "_glossary", glossary.Glossary(glossary.GLOSSARY_PATH, lemma_cache_path=None)
+        )
+        return loads
+
+    def test_warms_every_pipeline_and_glossary(self, blank_registry):
+        """All pipelines the tools use are loaded once, then the glossary."""
+        from mcp_server.warmup import WARMUP_PIPELINES, Warmup
+
+        warm = Warmup()
+        warm.start()
+        assert warm.wait(timeout=60)
+
+        status = warm.status()
+        assert status["state"] == "ready"
+        assert [s["status"] for s in status["steps"]] == ["ready"] * (len(WARMUP_PIPELINES) + 1)
+        assert sorted(blank_registry) == ["en_core_web_sm", "fr_core_news_sm"]  # One load per language
+        assert len(status["models"]) == len(WARMUP_PIPELINES)
+
+    def test_tool_call_during_warmup_reuses_model(self, blank_registry):
+        """A caller racing the warm-up waits for the load instead of repeating it."""
+        from mcp_server.nlp_models import TASK_SENTENCES, get_pipeline
+        from mcp_server.warmup import Warmup
+
+        warm = Warmup()
+        warm.start()
+        nlp = get_pipeline("en", TASK_SENTENCES)
+        assert warm.wait(timeout=60)
+
+        assert nlp is get_pipeline("en", TASK_SENTENCES)
+        assert blank_registry.count("en_core_web_sm") == 1  # Shared by sentences and analysis
+
+    def test_failed_step_reported(self):
+        """A failing step is recorded without stopping the others."""
+        from mcp_server.warmup import Warmup
+
+        def broken():
+            raise RuntimeError("spaCy model 'fr_core_news_sm' not found")
+
+        warm = Warmup(steps=[("fr/analysis", broken), ("glossary", lambda: "ready")])
+        warm.start()
+        assert warm.wait(timeout=5)
+
+        status = warm.status()
+        assert status["state"] == "failed"
+        assert status["steps"][0]["status"] == "failed"
+        assert "not found" in status["steps"][0]["error"]
+        assert status["steps"][1]["status"] == "ready"
+
@@ -463,6 +463,34 @@ class TestSaveArticle:
         assert row["translated_full_text"] == "Texte complet traduit."
         assert row["status"] == "translated"
 
+    def test_image_refs_inlined_for_public_site(self, db_with_articles, tmp_path, monkeypatch):
+        """pda-image: references in the full text are stored as data URIs."""
+        from mcp_server import image_store
+        from mcp_server.tools import save_article
+
+        store = image_store.ImageStore(tmp_path / "images")
+        monkeypatch.setattr(image_store, "_store", store)
+        ref = store.put(b"\x89PNG\r\n\x1a\n" + bytes(64), "png")
+        token = self._get_valid_token(db_with_articles)
+
+        save_article(
+            article_id="test-article-1",
+            validation_token=token,
+            source="Test Journal",
+            doi="10.1234/test",
+            translated_title="Mon titre en français",
+            translated_summary="Mon résumé en français avec du contenu.",
+            translated_full_text=f'<p>Texte.</p><img src="{ref}">',
+            flags=[],
+        )
+
+        row = db_with_articles.execute(
+            "SELECT translated_full_text FROM translations WHERE article_id = ?",
+            ("test-article-1",)
+        ).fetchone()
+
+        assert row["translated_full_text"] == f'<p>Texte.</p><img src="{store.data_uri(ref)}">'
+
     def test_marks_article_translated(self, db_with_articles):
         """Should update article status to translated."""
         from mcp_server.tools import save_article
@@ -1165,6 +1193,41 @@ class TestKeywordStorage:
 
         assert final_count > initial_count
 
+    def test_reuses_existing_keywords(self, db_with_articles):
+        """Existing keywords should be linked by id, not duplicated."""
+        db_with_articles.set_article_keywords("test-article-1", ["PDA", "autism"])
+        db_with_articles.set_article_keywords("test-article-2", ["autism", "PDA", "PDA", "anxiety"])
+
+        count = db_with_articles.execute("SELECT COUNT(*) AS count FROM keywords").fetchone()["count"]
+        assert count == 3
+
+        rows = db_with_articles.execute(
+            """SELECT k.keyword FROM article_keywords ak
+               JOIN keywords k ON ak.keyword_id = k.id
+               WHERE ak.article_id = ?""",
+            ("test-article-2",)
+        ).fetchall()
+        assert {r["keyword"] for r in rows} == {"autism", "PDA", "anxiety"}
+
+    def test_round_trips_independent_of_keyword_count(self, db_with_articles, monkeypatch):
+        """Keyword writes should cost the same number of calls for 2 or 50 keywords."""
+        calls = []
+        for name in ("execute", "executemany"):
+            original = getattr(db_with_articles, name)
+
+            def tracked(*args, _original=original, _name=name):
+                calls.append(_name)
+                return _original(*args)
+
+            monkeypatch.setattr(db_with_articles, name, tracked)
+
+        db_with_articles.set_article_keywords("test-article-1", ["a", "b"])
+        few = len(calls)
+        calls.clear()
+        db_with_articles.set_article_keywords("test-article-1", [f"keyword {i}" for i in range(50)])
+
+        assert len(calls) == few
+
 
 class TestWarningFlags:
     """Tests for warning flag detection and storage."""
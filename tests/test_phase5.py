@@ -354,3 +354,87 @@ def db_with_admin_data(sample_articles, monkeypatch):
 
     # Cleanup
     test_database.close()
+
+
+class TestBatchEventWriter:
+    """Tests for buffered batch job event and status writes."""
+
+    @pytest.fixture
+    def job(self, db_with_articles):
+        db_with_articles.create_batch_job("job-1", "translation", 10, "/tmp/job-1.log")
+        return db_with_articles
+
+    def _event_count(self, db):
+        return db.execute(
+            "SELECT COUNT(*) AS count FROM batch_job_events WHERE job_id = 'job-1'"
+        ).fetchone()["count"]
+
+    def test_buffers_until_flush_in_one_commit(self, job, monkeypatch):
+        """Events are held in memory and written in a single transaction."""
+        from mcp_server.batch_events import BatchEventWriter
+
+        writer = BatchEventWriter(job, "job-1", max_events=100)
+        for i in range(5):
+            writer.event("article_start", article_slug=f"a{i}")
+        assert self._event_count(job) == 0
+
+        commits = []
+        original_commit = job.commit
+        monkeypatch.setattr(job, "commit", lambda: (commits.append(1), original_commit()))
+        writer.flush()
+
+        assert len(commits) == 1
+        assert self._event_count(job) == 5
+
+    def test_flushes_at_event_limit(self, job):
+        """Reaching max_events triggers a flush."""
+        from mcp_server.batch_events import BatchEventWriter
+
+        writer = BatchEventWriter(job, "job-1", max_events=3)
+        writer.event("article_start", article_slug="a")
+        writer.event("article_complete", article_slug="a")
+        assert self._event_count(job) == 0
+
+        writer.event("article_start", article_slug="b")
+        assert self._event_count(job) == 3
+
+    def test_terminal_event_flushes_immediately(self, job):
+        """Job-ending events are written at once."""
+        from mcp_server.batch_events import BatchEventWriter
+
+        writer = BatchEventWriter(job, "job-1", max_events=100)
+        writer.event("article_start", article_slug="a")
+        writer.event("batch_complete", message="All articles processed")
+
+        assert self._event_count(job) == 2
+
+    def test_status_and_progress_are_coalesced(self, job):
+        """Only the latest status fields and the summed progress are written."""
+        from mcp_server.batch_events import BatchEventWriter
+
+        writer = BatchEventWriter(job, "job-1", max_events=100)
+        writer.status("running", pid=1234)
+        for slug in ("a", "b", "c"):
+            writer.status("running", current_article=slug)
+            writer.increment_progress()
+        writer.flush()
+
+        row = job.get_batch_job("job-1")
+        assert row["status"] == "running"
+        assert row["pid"] == 1234
+        assert row["current_article"] == "c"
+        assert row["processed_count"] == 3
+
+    def test_background_thread_flushes_on_interval(self, job):
+        """Buffered writes reach the database within the time limit."""
+        import time
+        from mcp_server.batch_events import BatchEventWriter
+
+        with BatchEventWriter(job, "job-1", max_events=100, interval_ms=50) as writer:
+            writer.event("article_start", article_slug="a")
+            deadline = time.monotonic() + 5
+            while self._event_count(job) == 0 and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            assert self._event_count(job) == 1
+
@@ -293,6 +293,110 @@ Fourth chunk text."""
                 cache_path.unlink()
 
 
+class TestArticleClaims:
+    """Tests for leased article claims shared by several workers."""
+
+    def _worker(self, db_path, worker_id):
+        from mcp_server.database import Database
+        return Database(db_path, worker_id=worker_id)
+
+    def test_workers_claim_different_articles(self, db_with_articles):
+        """Two workers should never be handed the same article."""
+        a = self._worker(db_with_articles._path, "worker-a")
+        b = self._worker(db_with_articles._path, "worker-b")
+
+        first = a.get_next_article()
+        second = b.get_next_article()
+
+        assert first["id"] == "test-article-1"
+        assert second["id"] != first["id"]
+        row = a.get_article_by_id(first["id"])
+        assert row["claimed_by"] == "worker-a"
+        assert row["lease_expires_at"] is not None
+
+    def test_worker_resumes_its_own_claim(self, db_with_articles):
+        """A worker asking again gets back the article it already holds."""
+        a = self._worker(db_with_articles._path, "worker-a")
+
+        assert a.get_next_article()["id"] == a.get_next_article()["id"]
+
+    def test_expired_lease_is_reclaimed(self, db_with_articles):
+        """An in_progress article whose lease expired goes to the next worker."""
+        a = self._worker(db_with_articles._path, "worker-a")
+        b = self._worker(db_with_articles._path, "worker-b")
+        claimed = a.get_next_article()["id"]
+
+        a.execute(
+            "UPDATE articles SET lease_expires_at = datetime('now', '-1 minute') WHERE id = ?",
+            (claimed,)
+        )
+        a.commit()
+
+        assert b.get_next_article()["id"] == claimed
+        assert b.get_article_by_id(claimed)["claimed_by"] == "worker-b"
+
+    def test_lease_of_dead_local_process_is_reclaimed(self, db_with_articles):
+        """A live lease held by an exited process on this host is taken back."""
+        import socket
+        import subprocess
+        import sys
+
+        child = subprocess.Popen([sys.executable, "-c", "pass"])
+        child.wait()
+        dead = self._worker(db_with_articles._path, f"{socket.gethostname()}:{child.pid}")
+        claimed = dead.get_next_article()["id"]
+
+        b = self._worker(db_with_articles._path, "worker-b")
+        assert b.get_next_article()["id"] == claimed
+
+    def test_concurrent_claims_are_unique(self, db_with_articles):
+        """Workers racing on separate threads each get a distinct article."""
+        import threading
+
+        db_with_articles.execute("UPDATE articles SET processing_status = 'pending'")
+        db_with_articles.commit()
+
+        claims = []
+        barrier = threading.Barrier(4)
+
+        def work(n):
+            worker = self._worker(db_with_articles._path, f"worker-{n}")
+            barrier.wait()
+            article = worker.get_next_article()
+            if article:
+                claims.append(article["id"])
+            worker.close()
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=30)
+
+        assert len(claims) == 4
+        assert len(set(claims)) == 4
+
+    def test_finishing_clears_claim(self, db_with_articles):
+        """Skipping an article releases its lease."""
+        claimed = db_with_articles.get_next_article()["id"]
+        db_with_articles.mark_article_skipped(claimed, "test", "PDFEXTRACT")
+
+        row = db_with_articles.get_article_by_id(claimed)
+        assert row["claimed_by"] is None
+        assert row["lease_expires_at"] is None
+
+    def test_claim_refuses_to_commit_open_transaction(self, db_with_articles):
+        """A caller's uncommitted changes are never committed by a claim."""
+        db_with_articles.execute("UPDATE articles SET doi = 'partial' WHERE id = 'test-article-2'")
+
+        with pytest.raises(RuntimeError, match="open transaction"):
+            db_with_articles.get_next_article()
+        db_with_articles.rollback()
+
+        assert db_with_articles.get_article_by_id("test-article-2")["doi"] != "partial"
+        assert db_with_articles.get_next_article()["id"] == "test-article-1"
+
+
 class TestSessionPause:
     """Tests for session pause: triggers at interval, continues after reset."""
 